@@ -37,6 +37,10 @@ FastAPIを使用し、クラウドに依存しない環境で動作します。
 cd platforms/local
 uvicorn main:app --reload --host 0.0.0.0 --port 8000
 
+# python main.py で起動（デフォルトはリロード無効）
+UVICORN_RELOAD=true python main.py      # 開発: 自動リロード
+UVICORN_WORKERS=4 python main.py        # 本番: マルチワーカー
+
 # 本番サーバー（Gunicorn + Uvicorn Worker）
 gunicorn main:app -w 4 -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:8000
 ```
@@ -47,17 +51,26 @@ gunicorn main:app -w 4 -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:8000
 - OLLAMA_BASE_URL=http://localhost:11434 (オプション)
 - OLLAMA_MODEL=llama3.1:8b (オプション)
 - TESSERACT_LANG=jpn+eng (オプション)
+- MAX_CONCURRENT_SUBMITS=8 (オプション、ジョブ登録の同時実行数上限)
+- CORS_ALLOWED_ORIGINS=* (オプション、カンマ区切りの許可オリジン)
+- INCLUDE_ERROR_DETAILS=false (オプション、エラーレスポンスにトレースバックを含める)
+- RESULTS_STREAM_MIN_ITEMS=50 (オプション、結果取得をストリーミング返却する件数の下限)
+- UVICORN_RELOAD=false (オプション、python main.py 起動時の自動リロード)
+- UVICORN_WORKERS=1 (オプション、python main.py 起動時のワーカー数)
 
 ================================================================================
 """
 import sys
 import os
 import asyncio
+import functools
 import logging
 import traceback
 from typing import List, Dict, Any, Optional
 from contextlib import asynccontextmanager
 
+import orjson
+
 # =============================================================================
 # パス設定
 # =============================================================================
@@ -101,8 +114,8 @@ if not os.getenv("OCR_PROVIDER"):
 # FastAPI インポート
 # =============================================================================
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -110,16 +123,42 @@ from pydantic import BaseModel
 # ログ設定
 # =============================================================================
 
+from core.correlation import CorrelationIdFilter, get_or_create_correlation_id  # noqa: E402
+
+# 相関IDはContextVar経由でフィルタが付与する（ハンドラへの受け渡し不要）
+_log_handler = logging.StreamHandler()
+_log_handler.addFilter(CorrelationIdFilter())
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+    format='%(asctime)s [%(levelname)s] [%(correlation_id)s] %(name)s: %(message)s',
+    handlers=[_log_handler]
 )
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# 同時実行制御
+# =============================================================================
+
+from infrastructure.config import get_env_int, get_env_bool  # noqa: E402
+
+# /evaluate/submit で同時に処理するジョブ登録数の上限
+# バースト時にジョブストレージへの書き込みが殺到しないよう制限する
+MAX_CONCURRENT_SUBMITS = get_env_int("MAX_CONCURRENT_SUBMITS", default=8, min_val=1, max_val=100)
+_submit_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUBMITS)
+
+# エラーレスポンスにトレースバックを含めるか（開発時のみ有効化）
+INCLUDE_ERROR_DETAILS = get_env_bool("INCLUDE_ERROR_DETAILS", default=False)
+
+# /evaluate/results をストリーミング返却する結果件数の下限
+# 件数が多い場合はレスポンス全体のバイト列を一度に作らず、項目ごとに直列化する
+RESULTS_STREAM_MIN_ITEMS = get_env_int("RESULTS_STREAM_MIN_ITEMS", default=50, min_val=1)
+_RESULTS_STREAM_CHUNK_BYTES = 64 * 1024
+
 # =============================================================================
 # Pydantic モデル
 # =============================================================================
 
+
 class EvaluationItem(BaseModel):
     """評価項目"""
     ID: str
@@ -150,6 +189,22 @@ class JobStatusResponse(BaseModel):
     error_message: Optional[str] = None
 
 
+# =============================================================================
+# レスポンスクラス
+# =============================================================================
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjsonでシリアライズするJSONレスポンス
+
+    標準のJSONResponse（json.dumps）より高速にシリアライズします。
+    /evaluate/results の大きな結果リストで効果が大きくなります。
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # =============================================================================
 # FastAPI アプリケーション
 # =============================================================================
@@ -185,6 +240,13 @@ async def lifespan(app: FastAPI):
     logger.info(f"[Local Server] OLLAMA_BASE_URL: {os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')}")
     logger.info("=" * 60)
 
+    # Ollama接続確認用のHTTPクライアント（コネクションプールを再利用）
+    import httpx
+    app.state.ollama_client = httpx.AsyncClient(
+        timeout=5.0,
+        base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    )
+
     # バックグラウンドジョブワーカーを開始
     worker_task = asyncio.create_task(_background_job_worker())
 
@@ -196,6 +258,7 @@ async def lifespan(app: FastAPI):
         await worker_task
     except asyncio.CancelledError:
         pass
+    await app.state.ollama_client.aclose()
     logger.info("[Local Server] シャットダウン")
 
 
@@ -203,34 +266,103 @@ app = FastAPI(
     title="内部統制テスト評価AI - ローカルサーバー",
     description="オンプレミス/ローカル環境で動作する内部統制テスト評価AIシステム",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS設定
+# 許可するオリジン（カンマ区切り、デフォルト: 全オリジン）
+_CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+]
+
+# メソッド・ヘッダーを明示することで、Starletteがレスポンスヘッダーを
+# 起動時に確定でき、リクエストごとのヘッダー組み立てが不要になる
+# （クライアントはCookie認証を使わないため allow_credentials は無効）
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=_CORS_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=[
+        "content-type",
+        "authorization",
+        "x-api-key",
+        "x-functions-key",
+        "x-tenant-id",
+        "x-correlation-id",
+    ],
 )
 
 
+@app.middleware("http")
+async def correlation_id_middleware(request: Request, call_next):
+    """
+    相関IDをContextVarに設定し、レスポンスヘッダーで返却する。
+
+    ContextVarはリクエストの非同期コンテキスト（およびそこから生成される
+    タスク）に引き継がれるため、下流の handle_* やログ出力で参照できます。
+    """
+    correlation_id = get_or_create_correlation_id(request.headers)
+    response = await call_next(request)
+    response.headers["X-Correlation-ID"] = correlation_id
+    return response
+
+
 # =============================================================================
 # ヘルパー関数
 # =============================================================================
 
-def create_json_response(data: Any, status_code: int = 200) -> JSONResponse:
+def create_json_response(data: Any, status_code: int = 200) -> ORJSONResponse:
     """JSONレスポンスを作成"""
-    return JSONResponse(content=data, status_code=status_code)
+    return ORJSONResponse(content=data, status_code=status_code)
+
+
+def _error_details() -> Optional[str]:
+    """
+    エラーレスポンスに含めるトレースバックを取得
 
+    INCLUDE_ERROR_DETAILS=true の場合のみトレースバックを整形して返します。
+    本番環境ではスタックの走査・整形を行わず、内部情報も返しません。
+    """
+    if INCLUDE_ERROR_DETAILS:
+        return traceback.format_exc()
+    return None
+
+
+def _iter_results_json(response: Dict[str, Any]):
+    """
+    結果レスポンスを項目単位で直列化するジェネレータ
+
+    "results" 以外のキーを先に出力し、results の各項目を個別に
+    orjson.dumps して約64KBごとにまとめて送出します。
+    出力は orjson.dumps(response) と同じJSONになります。
+    """
+    envelope = {k: v for k, v in response.items() if k != "results"}
+    head = orjson.dumps(envelope, option=orjson.OPT_NON_STR_KEYS)[:-1]
+    buffer = bytearray(head)
+    buffer += b',"results":[' if envelope else b'"results":['
+
+    for index, item in enumerate(response["results"]):
+        if index:
+            buffer += b","
+        buffer += orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+        if len(buffer) >= _RESULTS_STREAM_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+
+    buffer += b"]}"
+    yield bytes(buffer)
 
-def create_error_response(message: str, status_code: int = 500, details: str = None) -> JSONResponse:
+
+def create_error_response(message: str, status_code: int = 500, details: str = None) -> ORJSONResponse:
     """エラーレスポンスを作成"""
     error_data = {"error": True, "message": message}
     if details:
         error_data["details"] = details
-    return JSONResponse(content=error_data, status_code=status_code)
+    return ORJSONResponse(content=error_data, status_code=status_code)
 
 
 # =============================================================================
@@ -256,15 +388,42 @@ async def health():
     return status
 
 
-@app.get("/config")
-async def config_status():
+# /config の応答が参照する環境変数（_build_config_status のキャッシュキー）
+_CONFIG_ENV_VARS = (
+    # LLM（LLMFactory.get_config_status / get_provider_info）
+    "LLM_PROVIDER",
+    "AZURE_ENDPOINT", "AZURE_FOUNDRY_ENDPOINT",
+    "AZURE_API_KEY", "AZURE_FOUNDRY_API_KEY",
+    "AZURE_MODEL", "AZURE_FOUNDRY_MODEL",
+    "GCP_PROJECT_ID", "GCP_LOCATION", "AWS_REGION",
+    # OCR（OCRFactory.get_config_status / get_provider_info）
+    "OCR_PROVIDER",
+    "AZURE_DI_ENDPOINT", "AZURE_DI_KEY", "AWS_TEXTRACT_REGION",
+    "GCP_DOCAI_PROJECT_ID", "GCP_DOCAI_LOCATION", "GCP_DOCAI_PROCESSOR_ID",
+    "YOMITOKU_ENDPOINT_NAME",
+    # ローカル環境固有（Ollama / Tesseract）
+    "OLLAMA_BASE_URL", "OLLAMA_MODEL", "OLLAMA_VISION_MODEL",
+    "TESSERACT_LANG", "TESSERACT_CMD",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_config_status(env_snapshot: tuple) -> bytes:
     """
-    GET /config - 設定状態エンドポイント
+    /config のレスポンス本文を構築（参照する環境変数の値ごとにメモ化）
+
+    設定状態は環境変数のみに依存するため、_CONFIG_ENV_VARS の値が
+    変わらない限り前回のシリアライズ結果を再利用します。
+    共有されるキャッシュ本体は不変のバイト列のため、コピーは不要です。
+
+    Args:
+        env_snapshot: _CONFIG_ENV_VARS の値（キャッシュキー）
+
+    Returns:
+        設定状態のJSON（UTF-8バイト列）
     """
     from core.handlers import handle_config
 
-    logger.info("[Local Server] /config が呼び出されました")
-
     config = handle_config()
     config["platform"] = {
         "name": "Local Server",
@@ -287,7 +446,18 @@ async def config_status():
             "cmd": os.getenv("TESSERACT_CMD", "auto-detect"),
         }
 
-    return config
+    return orjson.dumps(config, option=orjson.OPT_NON_STR_KEYS)
+
+
+@app.get("/config")
+async def config_status():
+    """
+    GET /config - 設定状態エンドポイント
+    """
+    logger.info("[Local Server] /config が呼び出されました")
+
+    env_snapshot = tuple(os.environ.get(name) for name in _CONFIG_ENV_VARS)
+    return Response(content=_build_config_status(env_snapshot), media_type="application/json")
 
 
 @app.post("/evaluate")
@@ -320,10 +490,8 @@ async def evaluate(request: Request):
         return response
 
     except Exception as e:
-        error_details = traceback.format_exc()
-        logger.error(f"[Local Server] 予期せぬエラー: {e}")
-        logger.error(f"[Local Server] トレースバック:\n{error_details}")
-        return create_error_response(str(e), 500, error_details)
+        logger.exception(f"[Local Server] 予期せぬエラー: {e}")
+        return create_error_response(str(e), 500, _error_details())
 
 
 @app.post("/evaluate/submit")
@@ -348,7 +516,8 @@ async def evaluate_submit(request: Request):
         logger.info(f"[Local Server] 受信: {len(items)}件のテスト項目")
 
         tenant_id = request.headers.get("X-Tenant-ID", "default")
-        response = await handle_submit(items=items, tenant_id=tenant_id)
+        async with _submit_semaphore:
+            response = await handle_submit(items=items, tenant_id=tenant_id)
 
         if response.get("error"):
             logger.error(f"[Local Server] ジョブ送信エラー: {response.get('message')}")
@@ -358,9 +527,8 @@ async def evaluate_submit(request: Request):
         return create_json_response(response, 202)
 
     except Exception as e:
-        error_details = traceback.format_exc()
-        logger.error(f"[Local Server] 予期せぬエラー: {e}")
-        return create_error_response(str(e), 500, error_details)
+        logger.exception(f"[Local Server] 予期せぬエラー: {e}")
+        return create_error_response(str(e), 500, _error_details())
 
 
 @app.get("/evaluate/status/{job_id}")
@@ -381,9 +549,8 @@ async def evaluate_status(job_id: str):
         return response
 
     except Exception as e:
-        error_details = traceback.format_exc()
-        logger.error(f"[Local Server] 予期せぬエラー: {e}")
-        return create_error_response(str(e), 500, error_details)
+        logger.exception(f"[Local Server] 予期せぬエラー: {e}")
+        return create_error_response(str(e), 500, _error_details())
 
 
 @app.get("/evaluate/results/{job_id}")
@@ -408,13 +575,19 @@ async def evaluate_results(job_id: str):
                 "message": "Job not completed yet. Please check status endpoint."
             }, 202)
 
-        logger.info(f"[Local Server] 結果返却: {len(response.get('results', []))}件")
+        results = response.get("results") or []
+        logger.info(f"[Local Server] 結果返却: {len(results)}件")
+
+        if isinstance(results, list) and len(results) >= RESULTS_STREAM_MIN_ITEMS:
+            return StreamingResponse(
+                _iter_results_json(response),
+                media_type="application/json"
+            )
         return response
 
     except Exception as e:
-        error_details = traceback.format_exc()
-        logger.error(f"[Local Server] 予期せぬエラー: {e}")
-        return create_error_response(str(e), 500, error_details)
+        logger.exception(f"[Local Server] 予期せぬエラー: {e}")
+        return create_error_response(str(e), 500, _error_details())
 
 
 # =============================================================================
@@ -428,24 +601,29 @@ async def check_ollama_connection() -> dict:
     base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{base_url}/api/tags")
-
-            if response.status_code == 200:
-                data = response.json()
-                models = [m.get("name") for m in data.get("models", [])]
-                return {
-                    "connected": True,
-                    "base_url": base_url,
-                    "available_models": models[:10],  # 最大10件
-                    "model_count": len(models)
-                }
-            else:
-                return {
-                    "connected": False,
-                    "base_url": base_url,
-                    "error": f"HTTP {response.status_code}"
-                }
+        # lifespanで生成した共有クライアントがあれば再利用（keep-alive）
+        shared_client = getattr(app.state, "ollama_client", None)
+        if shared_client is not None:
+            response = await shared_client.get("/api/tags")
+        else:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                response = await client.get(f"{base_url}/api/tags")
+
+        if response.status_code == 200:
+            data = response.json()
+            models = [m.get("name") for m in data.get("models", [])]
+            return {
+                "connected": True,
+                "base_url": base_url,
+                "available_models": models[:10],  # 最大10件
+                "model_count": len(models)
+            }
+        else:
+            return {
+                "connected": False,
+                "base_url": base_url,
+                "error": f"HTTP {response.status_code}"
+            }
     except Exception as e:
         return {
             "connected": False,
@@ -461,21 +639,32 @@ async def check_ollama_connection() -> dict:
 if __name__ == "__main__":
     import uvicorn
 
+    # 本番向けデフォルト: リロード無効
+    # 開発時は UVICORN_RELOAD=true でファイル監視による自動リロードを有効化
+    reload = get_env_bool("UVICORN_RELOAD", default=False)
+    # ワーカー数（インメモリのジョブストレージはプロセス間で共有されないため、
+    # 複数ワーカーにする場合は JOB_STORAGE_PROVIDER に外部ストレージを指定すること）
+    workers = get_env_int("UVICORN_WORKERS", default=1, min_val=1)
+
     print("=" * 60)
     print("内部統制テスト評価AI - ローカルサーバー")
     print("=" * 60)
     print(f"LLM Provider: {os.getenv('LLM_PROVIDER', 'LOCAL')}")
     print(f"OCR Provider: {os.getenv('OCR_PROVIDER', 'TESSERACT')}")
     print(f"Ollama URL: {os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')}")
+    print(f"Reload: {reload}, Workers: {1 if reload else workers}")
     print("=" * 60)
     print("起動中: http://localhost:8000")
     print("API ドキュメント: http://localhost:8000/docs")
     print("=" * 60)
 
+    # uvloop・httptools は uvicorn[standard]（requirements.txt）で導入され、
+    # uvicorn が既定で自動選択する
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=None if reload else workers,
         log_level="info"
     )
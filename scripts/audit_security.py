@@ -17,6 +17,11 @@ audit_security.py - セキュリティ監査スクリプト
 
 【使用方法】
 python scripts/audit_security.py
+python scripts/audit_security.py --no-cache   # スキャン結果キャッシュを使わない
+
+シークレットスキャンの結果はリポジトリ直下の .audit_cache.json に
+（パス, 更新時刻, サイズ）単位で保存され、変更のないファイルは再スキャンしません。
+本スクリプトが変更された場合はキャッシュ全体が無効になります。
 
 【出力】
 - セキュリティ問題のリスト
@@ -24,26 +29,118 @@ python scripts/audit_security.py
 
 ================================================================================
 """
+import hashlib
+import json
+import math
+import mmap
+import os
 import re
 import sys
-from typing import List, Dict, Set
+from collections import Counter, deque
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+
+# ハードコードされたシークレットの検出パターン（パターン, 種別）
+# 空白・値部分は改行を含めないことで、一致を1行内に限定しバックトラックの範囲を抑える
+SECRET_PATTERNS = [
+    (r'password[ \t]*=[ \t]*["\'][^"\'\r\n]+["\']', "パスワード"),
+    (r'api[_-]?key[ \t]*=[ \t]*["\'][^"\'\r\n]+["\']', "APIキー"),
+    (r'secret[_-]?key[ \t]*=[ \t]*["\'][^"\'\r\n]+["\']', "シークレットキー"),
+    (r'token[ \t]*=[ \t]*["\'][^"\'\r\n]+["\']', "トークン"),
+    (r'aws[_-]?access[_-]?key[_-]?id[ \t]*=[ \t]*["\']AKI[A-Z0-9]+["\']', "AWS Access Key"),
+    (r'AKIA[A-Z0-9]{16}', "AWS Access Key ID"),
+]
+
+# 疑わしい長い文字列の候補（引用符で囲まれた32文字以上の英数字・base64系文字）
+# 候補はシャノンエントロピーで絞り込み、同じ文字の繰り返しなどの誤検知を除く
+# 16進文字列は1文字あたり最大4ビットのため、文字種ごとに閾値を分ける
+HIGH_ENTROPY_PATTERN = r'["\'][0-9a-zA-Z+/=_\-]{32,}["\']'
+HEX_ENTROPY_THRESHOLD = 3.0
+BASE64_ENTROPY_THRESHOLD = 4.0
+_HIGH_ENTROPY_GROUP = "entropy"
+_HEX_RE = re.compile(rb"[0-9a-fA-F]+")
+
+# 全パターンを名前付きグループの選択で1つの正規表現に結合（1ファイル1回の走査で済ませる）
+# パターンはすべてASCIIのため、mmapしたバイト列をデコードせずに直接走査する
+_SECRET_RE = re.compile(
+    "|".join(
+        [f"(?P<g{i}>{pattern})" for i, (pattern, _) in enumerate(SECRET_PATTERNS)]
+        + [f"(?P<{_HIGH_ENTROPY_GROUP}>{HIGH_ENTROPY_PATTERN})"]
+    ).encode(),
+    re.IGNORECASE
+)
+_SECRET_TYPES = {f"g{i}": secret_type for i, (_, secret_type) in enumerate(SECRET_PATTERNS)}
+_SECRET_TYPES[_HIGH_ENTROPY_GROUP] = "疑わしい長い文字列"
+
+
+def _shannon_entropy(data: bytes) -> float:
+    """バイト列のシャノンエントロピー（1文字あたりのビット数）を計算"""
+    length = len(data)
+    return -sum(
+        (count / length) * math.log2(count / length)
+        for count in Counter(data).values()
+    )
+
+
+def _is_high_entropy(candidate: bytes) -> bool:
+    """候補文字列のエントロピーが文字種（16進 / base64系）ごとの閾値を超えるか判定"""
+    threshold = HEX_ENTROPY_THRESHOLD if _HEX_RE.fullmatch(candidate) else BASE64_ENTROPY_THRESHOLD
+    return _shannon_entropy(candidate) > threshold
+
+
+# シークレットスキャンで走査しないディレクトリ（"."始まりのディレクトリも除外）
+SKIP_DIRS = {".venv", "venv", "node_modules", ".git", "tests", "__pycache__", ".mypy_cache", "vendor"}
+
+# シークレットスキャン対象とするファイルサイズの上限（超過分は情報として記録しスキップ）
+MAX_SCAN_BYTES = 1024 * 1024
+
+# 自動生成・ミニファイされたファイルのファイル名マーカー
+GENERATED_FILE_MARKERS = ("_pb2.py", "_pb2_grpc.py", ".min.")
+
+# シークレットスキャンの並列数（ファイル読み込み・デコード主体のI/Oバウンド処理）
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# 先行して投入するスキャンタスク数の上限（ファイル一覧・結果を全件保持しないため）
+SCAN_QUEUE_SIZE = SCAN_MAX_WORKERS * 4
+
+# シークレットスキャン結果のキャッシュファイル（リポジトリ直下）
+SCAN_CACHE_FILE = ".audit_cache.json"
+# キャッシュの有効性を判定するバージョン（パターン・除外条件を含む本スクリプトの内容から算出）
+_SCANNER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+# secrets_provider.py で確認するシークレット管理サービス統合（表示名, 表記ゆれ）
+SECRET_PROVIDERS = [
+    ("Azure Key Vault", ("Key Vault", "KeyVault")),
+    ("AWS Secrets Manager", ("Secrets Manager", "SecretsManager")),
+    ("GCP Secret Manager", ("Secret Manager", "SecretManager")),
+]
+
+# 誤検知として除外する文字列（一致箇所のバイト列に対して1回の検索で判定）
+# 環境変数参照・例示用プレースホルダーは大文字小文字を区別し、
+# テスト用の明示的なダミー値（test/dummy）は区別しない
+_EXCLUDE_RE = re.compile(rb"os\.getenv|os\.environ|YOUR_|PLACEHOLDER|(?i:test|dummy)")
 
 
 class SecurityAuditor:
     """セキュリティ監査クラス"""
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.root_dir = Path(__file__).parent.parent
         self.issues: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
+        # 監査フェーズ間で共有するファイル内容キャッシュ
+        self._file_cache: Dict[Path, str] = {}
+        # 実行間で共有するシークレットスキャン結果キャッシュ
+        # {相対パス: [mtime_ns, size, スキップ理由, [[行番号, 種別, 一致文字列], ...]]}
+        self.use_cache = use_cache
+        self._scan_cache: Dict[str, list] = {}
+        self._new_scan_cache: Dict[str, list] = {}
 
     def audit_all(self) -> bool:
         """全監査を実行"""
-        print(f"\n{'='*80}")
-        print(f"セキュリティ監査開始")
-        print(f"{'='*80}\n")
+        sys.stdout.write(f"\n{'='*80}\nセキュリティ監査開始\n{'='*80}\n\n")
 
         # ハードコードされたシークレットチェック
         self._check_hardcoded_secrets()
@@ -67,47 +164,26 @@ class SecurityAuditor:
         """ハードコードされたシークレットチェック"""
         print(f"[1/5] ハードコードされたシークレットチェック")
 
-        # Pythonファイルのみをスキャン
-        python_files = list(self.root_dir.glob("**/*.py"))
-
-        # パターン定義
-        secret_patterns = [
-            (r'password\s*=\s*["\'][^"\']+["\']', "パスワード"),
-            (r'api[_-]?key\s*=\s*["\'][^"\']+["\']', "APIキー"),
-            (r'secret[_-]?key\s*=\s*["\'][^"\']+["\']', "シークレットキー"),
-            (r'token\s*=\s*["\'][^"\']+["\']', "トークン"),
-            (r'aws[_-]?access[_-]?key[_-]?id\s*=\s*["\']AKI[A-Z0-9]+["\']', "AWS Access Key"),
-            (r'AKIA[A-Z0-9]{16}', "AWS Access Key ID"),
-            (r'["\'][0-9a-zA-Z]{32,}["\']', "疑わしい長い文字列")
-        ]
-
         found_secrets = []
 
-        for py_file in python_files:
-            # 除外パス
-            if any(exclude in str(py_file) for exclude in [".venv", "node_modules", ".git", "tests/"]):
-                continue
+        # Pythonファイルのみをスキャン（除外ディレクトリは走査時に枝刈り）
+        # 読み込みと正規表現走査はスレッドで並列化し、結果はファイル順に集約する
+        # ファイル列挙はジェネレータのまま流し、投入済みタスクは SCAN_QUEUE_SIZE 件までに抑える
+        pending = deque()
+        if self.use_cache:
+            self._load_scan_cache()
 
-            try:
-                content = py_file.read_text(encoding="utf-8")
+        with ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS) as executor:
+            for py_file in self._iter_py_files():
+                pending.append((py_file, executor.submit(self._scan_file_with_cache, py_file)))
+                if len(pending) >= SCAN_QUEUE_SIZE:
+                    self._collect_secret_hits(*pending.popleft(), found_secrets)
 
-                for pattern, secret_type in secret_patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        # 除外: os.getenv(), os.environ等の環境変数参照
-                        if "os.getenv" in match.group(0) or "os.environ" in match.group(0):
-                            continue
-                        # 除外: テスト用の明示的なダミー値
-                        if "test" in match.group(0).lower() or "dummy" in match.group(0).lower():
-                            continue
-                        # 除外: 例示用のプレースホルダー
-                        if "YOUR_" in match.group(0) or "PLACEHOLDER" in match.group(0):
-                            continue
-
-                        found_secrets.append((py_file.relative_to(self.root_dir), secret_type, match.group(0)))
+            while pending:
+                self._collect_secret_hits(*pending.popleft(), found_secrets)
 
-            except Exception as e:
-                self.warnings.append(f"⚠️  ファイル読み込みエラー: {py_file.name}")
+        if self.use_cache:
+            self._save_scan_cache()
 
         if found_secrets:
             for file_path, secret_type, matched_text in found_secrets:
@@ -122,6 +198,136 @@ class SecurityAuditor:
 
         print()
 
+    def _collect_secret_hits(self, py_file: Path, future, found_secrets: list):
+        """スキャン結果を found_secrets に追加（スキップ・読み込みエラーは情報・警告に記録）"""
+        cache_key, stamp, (skip_reason, hits) = future.result()
+        if stamp is not None and skip_reason != "読み込みエラー":
+            self._new_scan_cache[cache_key] = [*stamp, skip_reason, hits]
+
+        if skip_reason == "読み込みエラー":
+            self.warnings.append(f"⚠️  ファイル読み込みエラー: {py_file.name}")
+            return
+        if skip_reason:
+            self.info.append(
+                f"ℹ️  シークレットスキャン対象外（{skip_reason}）: {py_file.relative_to(self.root_dir)}"
+            )
+            return
+
+        for lineno, secret_type, matched_text in hits:
+            found_secrets.append(
+                (f"{py_file.relative_to(self.root_dir)}:{lineno}", secret_type, matched_text)
+            )
+
+    def _load_scan_cache(self):
+        """前回実行時のスキャン結果キャッシュを読み込み（スクリプト変更時は破棄）"""
+        try:
+            data = json.loads((self.root_dir / SCAN_CACHE_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == _SCANNER_VERSION:
+            self._scan_cache = data.get("files", {})
+
+    def _save_scan_cache(self):
+        """今回のスキャン結果でキャッシュを置き換え（一時ファイル経由でアトミックに書き込み）"""
+        cache_path = self.root_dir / SCAN_CACHE_FILE
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({"version": _SCANNER_VERSION, "files": self._new_scan_cache}, ensure_ascii=False),
+                encoding="utf-8"
+            )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            self.info.append(f"ℹ️  スキャン結果キャッシュを保存できませんでした: {SCAN_CACHE_FILE}")
+
+    def _scan_file_with_cache(self, py_file: Path):
+        """
+        キャッシュを参照してシークレット候補を抽出（ワーカースレッドで実行）
+
+        (相対パス, 更新時刻, サイズ) が前回と一致すれば前回の結果を再利用します。
+
+        Returns:
+            (キャッシュキー, [mtime_ns, size] または None, _scan_file_for_secrets の戻り値)
+        """
+        cache_key = str(py_file.relative_to(self.root_dir))
+        try:
+            st = py_file.stat()
+        except OSError:
+            return cache_key, None, ("読み込みエラー", [])
+        stamp = [st.st_mtime_ns, st.st_size]
+
+        cached = self._scan_cache.get(cache_key)
+        if cached and cached[:2] == stamp:
+            return cache_key, stamp, (cached[2], [tuple(hit) for hit in cached[3]])
+        return cache_key, stamp, self._scan_file_for_secrets(py_file)
+
+    def _scan_file_for_secrets(self, py_file: Path) -> Tuple[Optional[str], List[Tuple[int, str, str]]]:
+        """
+        1ファイル分のシークレット候補を抽出（ワーカースレッドで実行）
+
+        自動生成ファイル・サイズ超過・バイナリと思われるファイルは
+        正規表現走査を行わずにスキップします。
+
+        Returns:
+            (スキップ理由, [(行番号, 種別, 一致文字列), ...])。走査した場合のスキップ理由はNone
+            除外条件（環境変数参照・ダミー値等）に該当する一致は含みません
+        """
+        if any(marker in py_file.name for marker in GENERATED_FILE_MARKERS):
+            return "自動生成ファイル", []
+        try:
+            with open(py_file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > MAX_SCAN_BYTES:
+                    return "サイズ超過", []
+                if size == 0:
+                    return None, []
+                # ファイル全体を str に展開せず、mmap上でバイト列のまま走査する
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if b"\x00" in mm[:512]:
+                        return "バイナリ", []
+                    hits = []
+                    # 行番号は直前の一致位置からの改行数を数えて逐次求める
+                    lineno, last_pos = 1, 0
+                    for match in _SECRET_RE.finditer(mm):
+                        lineno += mm[last_pos:match.start()].count(b"\n")
+                        last_pos = match.start()
+                        matched = match.group(0)
+                        if _EXCLUDE_RE.search(matched):
+                            continue
+                        if (match.lastgroup == _HIGH_ENTROPY_GROUP
+                                and not _is_high_entropy(matched[1:-1])):
+                            continue
+                        hits.append((lineno, _SECRET_TYPES[match.lastgroup], matched.decode("utf-8", "replace")))
+                    return None, hits
+        except Exception:
+            return "読み込みエラー", []
+
+    def _read(self, path: Path) -> str:
+        """
+        ファイル内容を読み込み（キャッシュ付き）
+
+        同じファイルを複数の監査フェーズで参照するため、
+        読み込みとUTF-8デコードは1ファイルにつき1回だけ行います。
+        """
+        content = self._file_cache.get(path)
+        if content is None:
+            content = path.read_text(encoding="utf-8")
+            self._file_cache[path] = content
+        return content
+
+    def _iter_py_files(self):
+        """
+        スキャン対象のPythonファイルを列挙
+
+        os.walk の dirnames をその場で絞り込み、.venv や node_modules などの
+        除外ディレクトリには降りないようにします。
+        """
+        for dirpath, dirnames, filenames in os.walk(self.root_dir):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    yield Path(dirpath) / filename
+
     def _check_gitignore(self):
         """.gitignore設定チェック"""
         print(f"[2/5] .gitignore設定チェック")
@@ -133,7 +339,7 @@ class SecurityAuditor:
             print(f"  ❌ .gitignoreファイル不在\n")
             return
 
-        content = gitignore_path.read_text(encoding="utf-8")
+        content = self._read(gitignore_path)
 
         # 必須エントリ
         required_entries = [
@@ -148,8 +354,16 @@ class SecurityAuditor:
             ".secrets"
         ]
 
+        # コメント・空行を除いたパターン行を1回だけ集合化して照合する
+        # （先頭の"/"によるルート固定・末尾の"/"によるディレクトリ指定は同一視）
+        entries = {
+            line.strip().strip("/")
+            for line in content.splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        }
+
         for entry in required_entries:
-            if entry in content:
+            if entry.strip("/") in entries:
                 print(f"  ✓ {entry}")
             else:
                 self.warnings.append(
@@ -167,7 +381,7 @@ class SecurityAuditor:
         error_handler_path = self.root_dir / "src" / "core" / "error_handler.py"
 
         if error_handler_path.exists():
-            content = error_handler_path.read_text(encoding="utf-8")
+            content = self._read(error_handler_path)
 
             # トレースバック非表示機能の確認
             if "include_internal" in content and "to_dict" in content:
@@ -201,7 +415,7 @@ class SecurityAuditor:
 
         for handler_path in platform_handlers:
             if handler_path.exists():
-                content = handler_path.read_text(encoding="utf-8")
+                content = self._read(handler_path)
 
                 # try-exceptブロックの存在確認
                 if "try:" in content and "except" in content:
@@ -227,29 +441,16 @@ class SecurityAuditor:
         if secrets_provider_path.exists():
             print(f"  ✓ secrets_provider.py実装済み")
 
-            content = secrets_provider_path.read_text(encoding="utf-8")
+            content = self._read(secrets_provider_path)
 
             # Key Vault/Secrets Manager/Secret Manager統合確認
-            if "Key Vault" in content or "KeyVault" in content:
-                print(f"  ✓ Azure Key Vault統合あり")
-            else:
-                self.warnings.append(
-                    "⚠️  Azure Key Vault統合が見つかりません"
-                )
-
-            if "Secrets Manager" in content or "SecretsManager" in content:
-                print(f"  ✓ AWS Secrets Manager統合あり")
-            else:
-                self.warnings.append(
-                    "⚠️  AWS Secrets Manager統合が見つかりません"
-                )
-
-            if "Secret Manager" in content or "SecretManager" in content:
-                print(f"  ✓ GCP Secret Manager統合あり")
-            else:
-                self.warnings.append(
-                    "⚠️  GCP Secret Manager統合が見つかりません"
-                )
+            for label, variants in SECRET_PROVIDERS:
+                if any(variant in content for variant in variants):
+                    print(f"  ✓ {label}統合あり")
+                else:
+                    self.warnings.append(
+                        f"⚠️  {label}統合が見つかりません"
+                    )
 
         else:
             self.issues.append(
@@ -273,7 +474,7 @@ class SecurityAuditor:
         # 共通Dockerfileやsrc内のFastAPIミドルウェア設定もチェック
         common_app = self.root_dir / "src" / "app.py"
         if common_app.exists():
-            content = common_app.read_text(encoding="utf-8")
+            content = self._read(common_app)
             if "CORSMiddleware" in content or "Access-Control-Allow-Origin" in content:
                 print(f"  ✓ 共通FastAPIアプリ: CORS設定あり")
                 if '"*"' in content or "'*'" in content:
@@ -287,7 +488,7 @@ class SecurityAuditor:
 
         for platform_name, app_path, display_name in platform_cors_checks:
             if app_path.exists():
-                content = app_path.read_text(encoding="utf-8")
+                content = self._read(app_path)
 
                 if "CORSMiddleware" in content or "Access-Control-Allow-Origin" in content:
                     print(f"  ✓ {display_name}: CORS設定あり")
@@ -306,49 +507,54 @@ class SecurityAuditor:
 
     def _print_summary(self) -> bool:
         """結果サマリーを表示"""
-        print(f"\n{'='*80}")
-        print(f"監査結果サマリー")
-        print(f"{'='*80}\n")
+        # 行をまとめて組み立て、標準出力へは1回で書き出す
+        lines: List[str] = []
+        lines.append(f"\n{'='*80}")
+        lines.append(f"監査結果サマリー")
+        lines.append(f"{'='*80}\n")
 
         if self.issues:
-            print("【重大な問題】")
+            lines.append("【重大な問題】")
             for issue in self.issues:
-                print(f"  {issue}")
-            print()
+                lines.append(f"  {issue}")
+            lines.append("")
 
         if self.warnings:
-            print("【警告】")
+            lines.append("【警告】")
             for warning in self.warnings:
-                print(f"  {warning}")
-            print()
+                lines.append(f"  {warning}")
+            lines.append("")
 
         if self.info:
-            print("【情報】")
+            lines.append("【情報】")
             for info_item in self.info:
-                print(f"  {info_item}")
-            print()
+                lines.append(f"  {info_item}")
+            lines.append("")
 
         if not self.issues and not self.warnings:
-            print("  ✅ 重大なセキュリティ問題は検出されませんでした\n")
+            lines.append("  ✅ 重大なセキュリティ問題は検出されませんでした\n")
 
-        print(f"{'='*80}")
-        print(f"合計: 重大な問題 {len(self.issues)} 件, 警告 {len(self.warnings)} 件, 情報 {len(self.info)} 件")
-        print(f"{'='*80}\n")
+        lines.append(f"{'='*80}")
+        lines.append(f"合計: 重大な問題 {len(self.issues)} 件, 警告 {len(self.warnings)} 件, 情報 {len(self.info)} 件")
+        lines.append(f"{'='*80}\n")
 
         if self.issues:
-            print("❌ セキュリティ監査失敗 - 重大な問題があります")
-            return False
+            lines.append("❌ セキュリティ監査失敗 - 重大な問題があります")
+            success = False
         elif self.warnings:
-            print("⚠️  セキュリティ監査完了（警告あり）")
-            return True
+            lines.append("⚠️  セキュリティ監査完了（警告あり）")
+            success = True
         else:
-            print("✅ セキュリティ監査成功")
-            return True
+            lines.append("✅ セキュリティ監査成功")
+            success = True
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        return success
 
 
 def main():
     """メイン処理"""
-    auditor = SecurityAuditor()
+    auditor = SecurityAuditor(use_cache="--no-cache" not in sys.argv[1:])
     success = auditor.audit_all()
     sys.exit(0 if success else 1)
 
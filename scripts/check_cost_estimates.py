@@ -23,12 +23,91 @@ python scripts/check_cost_estimates.py
 
 ================================================================================
 """
+import os
 import re
 import sys
 from typing import List, Dict, Any, Set
 from pathlib import Path
 
 
+# IaCリソースタイプ → コストドキュメント上のサービス名（コンテナベースデプロイ対応）
+_RESOURCE_MAPPINGS = {
+    "Microsoft.App/containerApps": "Container Apps",
+    "Microsoft.App/managedEnvironments": "Container Apps",
+    "Microsoft.ContainerRegistry/registries": "Container Registry",
+    "Microsoft.ApiManagement/service": "APIM",
+    "Microsoft.KeyVault/vaults": "Key Vault",
+    "Microsoft.Storage/storageAccounts": "Storage Account",
+    "aws_apprunner_service": "App Runner",
+    "aws_ecr_repository": "ECR",
+    "aws_api_gateway_rest_api": "API Gateway",
+    "aws_secretsmanager_secret": "Secrets Manager",
+    "google_cloud_run_service": "Cloud Run",
+    "google_artifact_registry_repository": "Artifact Registry",
+    "google_storage_bucket": "Cloud Storage",
+    "google_secret_manager_secret": "Secret Manager"
+}
+
+# Azure必須サービス（コンテナベースデプロイ）
+AZURE_SERVICES = [
+    "Container Apps",
+    "Container Registry",
+    "Azure AI Foundry",
+    "Document Intelligence",
+    "Storage Account",
+    "APIM",
+    "Key Vault",
+    "Application Insights"
+]
+
+# AWS必須サービス（コンテナベースデプロイ）
+AWS_SERVICES = [
+    "App Runner",
+    "ECR",
+    "Bedrock",
+    "Textract",
+    "S3",
+    "API Gateway",
+    "Secrets Manager",
+    "CloudWatch"
+]
+
+# GCP必須サービス（コンテナベースデプロイ）
+GCP_SERVICES = [
+    "Cloud Run",
+    "Artifact Registry",
+    "Vertex AI",
+    "Document AI",
+    "Cloud Storage",
+    "Apigee",
+    "Secret Manager",
+    "Cloud Logging",
+    "Cloud Trace"
+]
+
+# 監視サービスコストのチェック対象
+MONITORING_NEEDLES = [
+    "Part 8", "監視サービス", "Application Insights",
+    "CloudWatch", "X-Ray", "Cloud Logging", "Cloud Trace"
+]
+
+# 年間・月間処理件数のチェック対象
+VOLUME_NEEDLES = ["1,328", "1328", "111"]
+
+# コストドキュメントから1回の走査で検出する全文字列
+COST_DOC_NEEDLES = (
+    AZURE_SERVICES + AWS_SERVICES + GCP_SERVICES
+    + MONITORING_NEEDLES + VOLUME_NEEDLES
+    + list(_RESOURCE_MAPPINGS.values())
+)
+
+# IaCファイルからリソースタイプを抽出する正規表現
+# resource 'resourceName' 'Microsoft.XXX/YYY@version' の形式
+_BICEP_RESOURCE_RE = re.compile(r"resource\s+\w+\s+'(Microsoft\.\w+/\w+)@")
+# resource "resource_type" "name" の形式
+_TF_RESOURCE_RE = re.compile(r'resource\s+"([\w_]+)"\s+"[\w_]+"')
+
+
 class CostEstimateChecker:
     """コスト見積もり整合性チェッカー"""
 
@@ -37,17 +116,28 @@ class CostEstimateChecker:
         self.cost_doc_path = self.root_dir / "docs" / "CLOUD_COST_ESTIMATION.md"
         self.issues: List[str] = []
         self.warnings: List[str] = []
+        # チェック間で共有するファイル内容キャッシュ
+        self._file_cache: Dict[Path, str] = {}
+        # コストドキュメント本文（check_all で1回だけ読み込む）
+        self._cost_doc: str = ""
+        # コストドキュメントに記載のある検査対象文字列（check_all で算出）
+        self._doc_present: Set[str] = set()
 
     def check_all(self) -> bool:
         """全チェックを実行"""
-        print(f"\n{'='*80}")
-        print(f"コスト見積もり整合性チェック開始")
-        print(f"{'='*80}\n")
+        sys.stdout.write(f"\n{'='*80}\nコスト見積もり整合性チェック開始\n{'='*80}\n\n")
 
         # コストドキュメント存在確認
         if not self._check_cost_document_exists():
             return False
 
+        # コストドキュメントは以降の全チェックで参照するため先に1回だけ読み込む
+        self._cost_doc = self._read(self.cost_doc_path)
+        # 各チェックが照合する文字列の記載有無を先にまとめて求めておく
+        self._doc_present = {
+            needle for needle in COST_DOC_NEEDLES if needle in self._cost_doc
+        }
+
         # コスト見積もりの完全性チェック
         self._check_cost_completeness()
 
@@ -63,6 +153,19 @@ class CostEstimateChecker:
         # 結果サマリー
         return self._print_summary()
 
+    def _read(self, path: Path) -> str:
+        """
+        ファイル内容を読み込み（キャッシュ付き）
+
+        コストドキュメントは複数のチェックで参照するため、
+        読み込みとUTF-8デコードは1ファイルにつき1回だけ行います。
+        """
+        content = self._file_cache.get(path)
+        if content is None:
+            content = path.read_text(encoding="utf-8")
+            self._file_cache[path] = content
+        return content
+
     def _check_cost_document_exists(self) -> bool:
         """コストドキュメントの存在確認"""
         print(f"[1/5] コストドキュメント存在確認")
@@ -81,48 +184,11 @@ class CostEstimateChecker:
         """コスト見積もりの完全性チェック"""
         print(f"[2/5] コスト見積もり完全性チェック")
 
-        content = self.cost_doc_path.read_text(encoding="utf-8")
-
-        # Azure必須サービス（コンテナベースデプロイ）
-        azure_services = [
-            "Container Apps",
-            "Container Registry",
-            "Azure AI Foundry",
-            "Document Intelligence",
-            "Storage Account",
-            "APIM",
-            "Key Vault",
-            "Application Insights"
-        ]
-
-        # AWS必須サービス（コンテナベースデプロイ）
-        aws_services = [
-            "App Runner",
-            "ECR",
-            "Bedrock",
-            "Textract",
-            "S3",
-            "API Gateway",
-            "Secrets Manager",
-            "CloudWatch"
-        ]
-
-        # GCP必須サービス（コンテナベースデプロイ）
-        gcp_services = [
-            "Cloud Run",
-            "Artifact Registry",
-            "Vertex AI",
-            "Document AI",
-            "Cloud Storage",
-            "Apigee",
-            "Secret Manager",
-            "Cloud Logging",
-            "Cloud Trace"
-        ]
+        present = self._doc_present
 
         # Azure
-        for service in azure_services:
-            if service not in content:
+        for service in AZURE_SERVICES:
+            if service not in present:
                 self.issues.append(
                     f"❌ Azureコスト見積もりに{service}が含まれていません"
                 )
@@ -130,8 +196,8 @@ class CostEstimateChecker:
                 print(f"  ✓ Azure: {service} 記載あり")
 
         # AWS
-        for service in aws_services:
-            if service not in content:
+        for service in AWS_SERVICES:
+            if service not in present:
                 self.issues.append(
                     f"❌ AWSコスト見積もりに{service}が含まれていません"
                 )
@@ -139,8 +205,8 @@ class CostEstimateChecker:
                 print(f"  ✓ AWS: {service} 記載あり")
 
         # GCP
-        for service in gcp_services:
-            if service not in content:
+        for service in GCP_SERVICES:
+            if service not in present:
                 self.issues.append(
                     f"❌ GCPコスト見積もりに{service}が含まれていません"
                 )
@@ -184,60 +250,42 @@ class CostEstimateChecker:
 
     def _extract_bicep_resources(self, bicep_dir: Path) -> Set[str]:
         """Bicepファイルからリソースタイプを抽出"""
-        resources = set()
-        for bicep_file in bicep_dir.glob("*.bicep"):
-            content = bicep_file.read_text(encoding="utf-8")
-            # resource 'resourceName' 'Microsoft.XXX/YYY@version' の形式を抽出
-            matches = re.findall(r"resource\s+\w+\s+'(Microsoft\.\w+/\w+)@", content)
-            resources.update(matches)
-        return resources
+        return self._extract_resources(bicep_dir, ".bicep", _BICEP_RESOURCE_RE)
 
     def _extract_terraform_resources(self, terraform_dir: Path) -> Set[str]:
         """TerraformファイルからリソースタイプをExtract"""
+        return self._extract_resources(terraform_dir, ".tf", _TF_RESOURCE_RE)
+
+    def _extract_resources(self, directory: Path, suffix: str, pattern: "re.Pattern[str]") -> Set[str]:
+        """ディレクトリ直下の suffix ファイルから pattern に一致するリソースタイプを抽出"""
         resources = set()
-        for tf_file in terraform_dir.glob("*.tf"):
-            content = tf_file.read_text(encoding="utf-8")
-            # resource "resource_type" "name" の形式を抽出
-            matches = re.findall(r'resource\s+"([\w_]+)"\s+"[\w_]+"', content)
-            resources.update(matches)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    content = self._read(Path(entry.path))
+                    resources.update(pattern.findall(content))
         return resources
 
     def _check_resources_in_cost_doc(self, resources: Set[str], platform: str):
         """リソースがコストドキュメントに含まれているか確認"""
-        content = self.cost_doc_path.read_text(encoding="utf-8")
-
-        # 簡易マッピング（コンテナベースデプロイ対応）
-        resource_mappings = {
-            "Microsoft.App/containerApps": "Container Apps",
-            "Microsoft.App/managedEnvironments": "Container Apps",
-            "Microsoft.ContainerRegistry/registries": "Container Registry",
-            "Microsoft.ApiManagement/service": "APIM",
-            "Microsoft.KeyVault/vaults": "Key Vault",
-            "Microsoft.Storage/storageAccounts": "Storage Account",
-            "aws_apprunner_service": "App Runner",
-            "aws_ecr_repository": "ECR",
-            "aws_api_gateway_rest_api": "API Gateway",
-            "aws_secretsmanager_secret": "Secrets Manager",
-            "google_cloud_run_service": "Cloud Run",
-            "google_artifact_registry_repository": "Artifact Registry",
-            "google_storage_bucket": "Cloud Storage",
-            "google_secret_manager_secret": "Secret Manager"
-        }
-
-        for resource in resources:
-            service_name = resource_mappings.get(resource, resource)
-            # コストドキュメントに記載があるか簡易チェック
-            # （実際にはより厳密なチェックが必要）
-            pass
+        for resource in sorted(resources):
+            # マッピングのないリソース（IAMロール等）はコスト見積もりの対象外
+            service_name = _RESOURCE_MAPPINGS.get(resource)
+            if service_name is None:
+                continue
+            if service_name not in self._doc_present:
+                self.warnings.append(
+                    f"⚠️  {platform}: {resource} ({service_name}) がコスト見積もりに記載されていません"
+                )
 
     def _check_monitoring_costs(self):
         """監視サービスコストチェック"""
         print(f"[4/5] 監視サービスコストチェック")
 
-        content = self.cost_doc_path.read_text(encoding="utf-8")
+        present = self._doc_present
 
         # Part 8: 監視サービスコストが含まれているか
-        if "Part 8" not in content or "監視サービス" not in content:
+        if "Part 8" not in present or "監視サービス" not in present:
             self.issues.append(
                 "❌ 監視サービスコスト（Part 8）が見つかりません"
             )
@@ -245,7 +293,7 @@ class CostEstimateChecker:
             print(f"  ✓ Part 8: 監視サービスコスト記載あり")
 
         # Application Insights
-        if "Application Insights" in content:
+        if "Application Insights" in present:
             print(f"  ✓ Azure Application Insights コスト記載あり")
         else:
             self.warnings.append(
@@ -253,7 +301,7 @@ class CostEstimateChecker:
             )
 
         # CloudWatch/X-Ray
-        if "CloudWatch" in content or "X-Ray" in content:
+        if "CloudWatch" in present or "X-Ray" in present:
             print(f"  ✓ AWS CloudWatch/X-Ray コスト記載あり")
         else:
             self.warnings.append(
@@ -261,7 +309,7 @@ class CostEstimateChecker:
             )
 
         # Cloud Logging/Trace
-        if "Cloud Logging" in content or "Cloud Trace" in content:
+        if "Cloud Logging" in present or "Cloud Trace" in present:
             print(f"  ✓ GCP Cloud Logging/Trace コスト記載あり")
         else:
             self.warnings.append(
@@ -274,10 +322,10 @@ class CostEstimateChecker:
         """年間処理件数との整合性チェック"""
         print(f"[5/5] 年間処理件数整合性チェック")
 
-        content = self.cost_doc_path.read_text(encoding="utf-8")
+        present = self._doc_present
 
         # 年間1,328件（月間約111件）が記載されているか
-        if "1,328" in content or "1328" in content:
+        if "1,328" in present or "1328" in present:
             print(f"  ✓ 年間処理件数（1,328件）記載あり")
         else:
             self.warnings.append(
@@ -285,7 +333,7 @@ class CostEstimateChecker:
             )
 
         # 月間約111件の記載
-        if "111" in content:
+        if "111" in present:
             print(f"  ✓ 月間処理件数（約111件）記載あり")
         else:
             self.warnings.append(
@@ -296,38 +344,43 @@ class CostEstimateChecker:
 
     def _print_summary(self) -> bool:
         """結果サマリーを表示"""
-        print(f"\n{'='*80}")
-        print(f"チェック結果サマリー")
-        print(f"{'='*80}\n")
+        # 行をまとめて組み立て、標準出力へは1回で書き出す
+        lines: List[str] = []
+        lines.append(f"\n{'='*80}")
+        lines.append(f"チェック結果サマリー")
+        lines.append(f"{'='*80}\n")
 
         if self.issues:
-            print("【問題】")
+            lines.append("【問題】")
             for issue in self.issues:
-                print(f"  {issue}")
-            print()
+                lines.append(f"  {issue}")
+            lines.append("")
 
         if self.warnings:
-            print("【警告】")
+            lines.append("【警告】")
             for warning in self.warnings:
-                print(f"  {warning}")
-            print()
+                lines.append(f"  {warning}")
+            lines.append("")
 
         if not self.issues and not self.warnings:
-            print("  ✅ 全てのチェックが成功しました\n")
+            lines.append("  ✅ 全てのチェックが成功しました\n")
 
-        print(f"{'='*80}")
-        print(f"合計: 問題 {len(self.issues)} 件, 警告 {len(self.warnings)} 件")
-        print(f"{'='*80}\n")
+        lines.append(f"{'='*80}")
+        lines.append(f"合計: 問題 {len(self.issues)} 件, 警告 {len(self.warnings)} 件")
+        lines.append(f"{'='*80}\n")
 
         if self.issues:
-            print("❌ コスト見積もり整合性チェック失敗")
-            return False
+            lines.append("❌ コスト見積もり整合性チェック失敗")
+            success = False
         elif self.warnings:
-            print("⚠️  コスト見積もり整合性チェック完了（警告あり）")
-            return True
+            lines.append("⚠️  コスト見積もり整合性チェック完了（警告あり）")
+            success = True
         else:
-            print("✅ コスト見積もり整合性チェック成功")
-            return True
+            lines.append("✅ コスト見積もり整合性チェック成功")
+            success = True
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        return success
 
 
 def main():
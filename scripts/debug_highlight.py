@@ -1,14 +1,25 @@
 import sys
 import os
 import traceback
+import importlib.machinery
 
 # Add src to python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+_src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+sys.path.append(_src_dir)
 
-print("Attempting to import HighlightingService...")
-try:
-    from core.highlighting_service import HighlightingService
-    print("Import Successful!")
-except Exception:
-    print("Import Failed!")
-    traceback.print_exc()
+if "--deep" in sys.argv[1:]:
+    # Full import: also exercises the transitive dependencies
+    print("Attempting to import HighlightingService...")
+    try:
+        from core.highlighting_service import HighlightingService
+        print("Import Successful!")
+    except Exception:
+        print("Import Failed!")
+        traceback.print_exc()
+else:
+    # Locate the module file only (executes nothing, not even core/__init__.py)
+    print("Locating core.highlighting_service (use --deep to import it)...")
+    spec = importlib.machinery.PathFinder.find_spec(
+        "highlighting_service", [os.path.join(_src_dir, "core")]
+    )
+    print("Module found (not imported)" if spec else "Module not found!")
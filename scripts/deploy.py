@@ -11,97 +11,319 @@
 """
 
 import argparse
+import asyncio
 import os
+import shutil
 import sys
 import subprocess
-import json
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional
 import time
 
 
+# バナーの区切り線
+_SEP = "=" * 70
+
+# 失敗時のエラー表示用に保持するサブプロセス出力の末尾行数
+OUTPUT_TAIL_LINES = 200
+
+# Dockerイメージのビルドタスク（環境ごとに1回だけビルドし、全プラットフォームで共有）
+_build_cache: Dict[str, "asyncio.Task[bool]"] = {}
+
+# BuildKit のレジストリキャッシュ参照（例: myacr.azurecr.io/ic-test-agent:buildcache）
+# 設定時かつ docker buildx が利用可能な場合のみ --cache-to でキャッシュを書き出す。
+# 未設定時はプッシュ済みイメージに埋め込んだインラインキャッシュを --cache-from で再利用する
+DEPLOY_BUILD_CACHE_REF = os.getenv("DEPLOY_BUILD_CACHE_REF", "")
+
+# レジストリキャッシュの書き出しに使う buildx ビルダー
+# （既定の docker ドライバはレジストリへのキャッシュ書き出しに対応しないため docker-container を使う）
+BUILDX_BUILDER_NAME = "ic-test-agent-builder"
+
+# 外部コマンドの同時起動数の上限（--platform all で terraform / docker / クラウドCLI が
+# 一斉に起動し、小さなCIランナーでCPU・メモリが過負荷になるのを防ぐ）
+DEPLOY_MAX_PARALLEL = max(1, int(os.getenv("DEPLOY_MAX_PARALLEL", os.cpu_count() or 2)))
+_SPAWN_SEM = asyncio.Semaphore(DEPLOY_MAX_PARALLEL)
+
+# docker push はデーモン側でレイヤーアップロードが直列化されるため1つずつ実行
+_DOCKER_SEM = asyncio.Semaphore(1)
+
+# 複数プラットフォームを並列デプロイする際、対話プロンプトが混ざらないよう直列化する
+_prompt_lock = threading.Lock()
+
+
+def _registry_image(platform: str, environment: str, tag: Optional[str] = None) -> str:
+    """プラットフォームごとのレジストリ上のイメージ参照（タグ省略時は環境名）"""
+    tag = tag or environment
+    if platform == "azure":
+        return f"ictestacr{environment}.azurecr.io/ic-test-agent:{tag}"
+    if platform == "aws":
+        aws_region = os.getenv("AWS_REGION", "ap-northeast-1")
+        aws_account_id = os.getenv("AWS_ACCOUNT_ID", "")
+        return f"{aws_account_id}.dkr.ecr.{aws_region}.amazonaws.com/ic-test-agent:{tag}"
+    if platform == "gcp":
+        gcp_project = os.getenv("GCP_PROJECT_ID", "")
+        gcp_region = os.getenv("GCP_REGION", "asia-northeast1")
+        return f"{gcp_region}-docker.pkg.dev/{gcp_project}/ic-test-agent/app:{tag}"
+    raise ValueError(f"不明なプラットフォーム: {platform}")
+
+
+def _format_dry_run(target: str, commands: tuple) -> str:
+    """DRY RUN時の実行予定コマンド表示ブロックを生成"""
+    lines = [f"  [DRY RUN] {target}をスキップします", "  実行予定コマンド:"]
+    lines.extend(f"    {command}" for command in commands)
+    return "\n".join(lines) + "\n"
+
+
+def _confirm(message: str) -> bool:
+    """y/N の確認プロンプト（並列実行中も1つずつ表示）"""
+    with _prompt_lock:
+        response = input(message)
+    return response.lower() == 'y'
+
+
 class Deployer:
     """デプロイメント実行クラス"""
 
-    def __init__(self, platform: str, environment: str = "staging", dry_run: bool = False):
+    # プラットフォームごとに必要な外部コマンド
+    REQUIRED_COMMANDS: Dict[str, List[str]] = {
+        "azure": ["az", "docker"],
+        "aws": ["aws", "terraform", "docker"],
+        "gcp": ["gcloud", "terraform", "docker"],
+    }
+
+    # shutil.which の結果（複数 Deployer 間で共有）
+    _WHICH_CACHE: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def _which(cls, name: str) -> Optional[str]:
+        """コマンドのパスを検索（結果をキャッシュ）"""
+        if name not in cls._WHICH_CACHE:
+            cls._WHICH_CACHE[name] = shutil.which(name)
+        return cls._WHICH_CACHE[name]
+
+    def __init__(
+        self,
+        platform: str,
+        environment: str = "staging",
+        dry_run: bool = False,
+        verbose: bool = False,
+        build_platforms: Optional[List[str]] = None,
+    ):
         self.platform = platform.lower()
         self.environment = environment
         self.dry_run = dry_run
+        self.verbose = verbose
+        # 共通イメージに付与するレジストリタグの対象（同時にデプロイする全プラットフォーム）
+        self.build_platforms = build_platforms or [self.platform]
+        # 並列デプロイ時の出力に付けるプラットフォーム名
+        self._log_prefix = f"[{self.platform}] " if len(self.build_platforms) > 1 else ""
+
+        # 必要なコマンドが無い場合は、途中までリソースを作成してから
+        # FileNotFoundError で止まる前に失敗させる（DRY RUNでは実行しないため不要）
+        if not dry_run:
+            missing = [
+                name for name in self.REQUIRED_COMMANDS.get(self.platform, [])
+                if self._which(name) is None
+            ]
+            if missing:
+                raise RuntimeError(
+                    f"{self.platform}: 必要なコマンドが見つかりません: {', '.join(missing)}"
+                )
         self.project_root = Path(__file__).parent.parent
         self.deployment_id = f"{platform}-{environment}-{int(time.time())}"
+        # ソースリビジョンを含むイメージタグ（deploy() 開始時に確定）
+        self.revision_tag = f"{environment}-{int(time.time())}"
+        self._revision_pinned = False
+
+    def _log_block(self, lines: List[str]) -> None:
+        """
+        複数行の出力を1回の書き込みでまとめて表示
+
+        並列デプロイ時も1ステップ分の出力が他プラットフォームの出力と
+        混ざらないようにします（await を挟まないため書き込み中に
+        他のコルーチンへ切り替わることはありません）。
+        複数プラットフォームを同時にデプロイする場合は、各行の先頭に
+        [プラットフォーム名] を付けて出力元を判別できるようにします。
+        """
+        text = "\n".join(lines)
+        if self._log_prefix:
+            text = "\n".join(
+                f"{self._log_prefix}{line}" if line.strip() else line
+                for line in text.split("\n")
+            )
+        sys.stdout.write(text + "\n")
+        sys.stdout.flush()
+
+    def _log(self, message: str = "") -> None:
+        """1メッセージを表示（並列デプロイ時はプラットフォーム名を付与）"""
+        self._log_block([message])
+
+    def _log_dry_run(self, target: str, *commands: str) -> None:
+        """DRY RUN時の実行予定コマンドを表示"""
+        self._log_block([_format_dry_run(target, commands)])
+
+    async def _drain(self, stream: asyncio.StreamReader, tail: deque) -> None:
+        """サブプロセス出力を1行ずつ読み、末尾 OUTPUT_TAIL_LINES 行だけを保持"""
+        async for raw in stream:
+            line = raw.decode(errors="replace")
+            tail.append(line)
+            if self.verbose:
+                print(f"  [{self.platform}] {line}", end="" if line.endswith("\n") else "\n")
+
+    async def _run(
+        self,
+        argv: List[str],
+        cwd: Optional[Path] = None,
+        input: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        外部コマンドを非同期に実行
+
+        asyncio のサブプロセスで実行するため、待機中もイベントループを
+        塞がず、他プラットフォームのデプロイ処理が並行して進みます。
+        terraform apply / docker build の長大なログを丸ごと保持しないよう、
+        stdout/stderr は行単位で読み捨て、末尾 OUTPUT_TAIL_LINES 行のみ残します。
+        同時に起動するプロセス数は DEPLOY_MAX_PARALLEL で制限されます。
+
+        Returns:
+            returncode / stdout / stderr（末尾のテキスト）を持つ CompletedProcess
+        """
+        async with _SPAWN_SEM:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.PIPE if input is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                env=env,
+                limit=1024 * 1024,  # 改行を含まない長い出力行（JSON等）にも対応
+            )
+            tail_out: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+            tail_err: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+            try:
+                if input is not None:
+                    proc.stdin.write(input.encode())
+                    await proc.stdin.drain()
+                    proc.stdin.close()
+                await asyncio.gather(
+                    self._drain(proc.stdout, tail_out),
+                    self._drain(proc.stderr, tail_err),
+                )
+                await proc.wait()
+            except asyncio.CancelledError:
+                # 待機がキャンセルされた場合は子プロセスを残さない
+                proc.kill()
+                await proc.wait()
+                raise
+            return subprocess.CompletedProcess(
+                argv,
+                proc.returncode,
+                "".join(tail_out),
+                "".join(tail_err),
+            )
+
+    async def _push(self, *images: str) -> subprocess.CompletedProcess:
+        """イメージをプッシュ（プラットフォーム間で直列化）"""
+        async with _DOCKER_SEM:
+            for image in images:
+                result = await self._run(["docker", "push", image])
+                if result.returncode != 0:
+                    break
+            return result
 
-    def deploy(self) -> bool:
+    async def deploy(self) -> bool:
         """デプロイメント実行"""
-        print(f"\n{'='*70}")
-        print(f"  デプロイメント開始: {self.platform.upper()} ({self.environment})")
-        print(f"  デプロイメントID: {self.deployment_id}")
+        banner = [
+            f"\n{_SEP}",
+            f"  デプロイメント開始: {self.platform.upper()} ({self.environment})",
+            f"  デプロイメントID: {self.deployment_id}",
+        ]
         if self.dry_run:
-            print(f"  モード: DRY RUN（実際のリソースは作成されません）")
-        print(f"{'='*70}\n")
+            banner.append(f"  モード: DRY RUN（実際のリソースは作成されません）")
+        banner.append(f"{_SEP}\n")
+        self._log_block(banner)
 
         try:
             # 1. 事前チェック
-            if not self._pre_deployment_check():
+            if not await self._pre_deployment_check():
                 return False
 
             # 2. シークレット設定確認
             if not self._check_secrets():
                 return False
 
+            # レジストリの環境タグが既に現在のリビジョンを指していれば
+            # ビルドとプッシュは不要
+            revision = await self._source_revision()
+            self.revision_tag = f"{self.environment}-{revision}"
+            build_task = None
+            if not await self._registry_is_current():
+                # Dockerイメージのビルドはインフラの出力に依存しないため、
+                # インフラストラクチャデプロイと並行して進める。
+                # ビルドは他プラットフォームと共有するため、ここでは中断しない
+                # （未完了のまま残った場合は asyncio.run 終了時にキャンセルされる）
+                build_task = self._start_build()
+
             # 3. インフラストラクチャデプロイ
-            if not self._deploy_infrastructure():
+            if not await self._deploy_infrastructure():
                 return False
 
             # 4. アプリケーションデプロイ
-            if not self._deploy_application():
+            if not await self._deploy_application(build_task):
                 return False
 
             # 5. デプロイメント検証
             if not self.dry_run:
-                if not self._validate_deployment():
+                if not await self._validate_deployment():
                     return False
 
-            print(f"\n{'='*70}")
-            print(f"  ✅ デプロイメント成功: {self.platform.upper()}")
-            print(f"  デプロイメントID: {self.deployment_id}")
-            print(f"{'='*70}\n")
+            self._log_block([
+                f"\n{_SEP}",
+                f"  ✅ デプロイメント成功: {self.platform.upper()}",
+                f"  デプロイメントID: {self.deployment_id}",
+                f"{_SEP}\n",
+            ])
             return True
 
         except Exception as e:
-            print(f"\n{'='*70}")
-            print(f"  ❌ デプロイメント失敗: {e}")
-            print(f"{'='*70}\n")
+            self._log_block([
+                f"\n{_SEP}",
+                f"  ❌ デプロイメント失敗: {e}",
+                f"{_SEP}\n",
+            ])
             return False
 
-    def _pre_deployment_check(self) -> bool:
+    async def _pre_deployment_check(self) -> bool:
         """デプロイメント前チェック"""
-        print("📋 [1/5] デプロイメント前チェック\n")
+        self._log("📋 [1/5] デプロイメント前チェック\n")
 
         # 準備スクリプト実行
-        result = subprocess.run(
+        result = await self._run(
             [sys.executable, "scripts/prepare_deployment.py", "--platform", self.platform],
             cwd=self.project_root,
-            capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            print("  ⚠️  デプロイメント前チェックで問題が検出されました")
-            print(result.stdout)
+            self._log_block([
+                "  ⚠️  デプロイメント前チェックで問題が検出されました",
+                result.stdout,
+            ])
 
             if not self.dry_run:
-                response = input("\n続行しますか? (y/N): ")
-                if response.lower() != 'y':
-                    print("  ❌ デプロイメントを中止しました")
+                if not await asyncio.to_thread(_confirm, f"\n[{self.platform}] 続行しますか? (y/N): "):
+                    self._log("  ❌ デプロイメントを中止しました")
                     return False
         else:
-            print("  ✅ デプロイメント前チェック完了\n")
+            self._log("  ✅ デプロイメント前チェック完了\n")
 
         return True
 
     def _check_secrets(self) -> bool:
         """シークレット設定確認"""
-        print("🔐 [2/5] シークレット設定確認\n")
+        self._log("🔐 [2/5] シークレット設定確認\n")
 
         if self.platform == "azure":
             required_vars = [
@@ -121,7 +343,7 @@ class Deployer:
                 "GCP_PROJECT_ID",
             ]
         else:
-            print(f"  ❌ 不明なプラットフォーム: {self.platform}")
+            self._log(f"  ❌ 不明なプラットフォーム: {self.platform}")
             return False
 
         missing_vars = []
@@ -130,67 +352,68 @@ class Deployer:
                 missing_vars.append(var)
 
         if missing_vars:
-            print(f"  ⚠️  以下の環境変数が未設定です:")
-            for var in missing_vars:
-                print(f"     - {var}")
+            self._log_block([
+                f"  ⚠️  以下の環境変数が未設定です:",
+                *(f"     - {var}" for var in missing_vars),
+            ])
 
             if not self.dry_run:
-                print(f"\n  💡 .env.{self.platform} ファイルを作成してください:")
-                print(f"     cp .env.{self.platform}.template .env.{self.platform}")
+                self._log_block([
+                    f"\n  💡 .env.{self.platform} ファイルを作成してください:",
+                    f"     cp .env.{self.platform}.template .env.{self.platform}",
+                ])
                 return False
             else:
-                print(f"  ℹ️  DRY RUNモードのため続行します\n")
+                self._log(f"  ℹ️  DRY RUNモードのため続行します\n")
         else:
-            print("  ✅ シークレット設定確認完了\n")
+            self._log("  ✅ シークレット設定確認完了\n")
 
         return True
 
-    def _deploy_infrastructure(self) -> bool:
+    async def _deploy_infrastructure(self) -> bool:
         """インフラストラクチャデプロイ"""
-        print("🏗️  [3/5] インフラストラクチャデプロイ\n")
+        self._log("🏗️  [3/5] インフラストラクチャデプロイ\n")
 
         if self.platform == "azure":
-            return self._deploy_azure_infrastructure()
+            return await self._deploy_azure_infrastructure()
         elif self.platform == "aws":
-            return self._deploy_aws_infrastructure()
+            return await self._deploy_aws_infrastructure()
         elif self.platform == "gcp":
-            return self._deploy_gcp_infrastructure()
+            return await self._deploy_gcp_infrastructure()
 
         return False
 
-    def _deploy_azure_infrastructure(self) -> bool:
+    async def _deploy_azure_infrastructure(self) -> bool:
         """Azure Bicepデプロイ"""
         bicep_dir = self.project_root / "infrastructure" / "azure" / "bicep"
 
         if self.dry_run:
-            print("  [DRY RUN] Azure Bicepデプロイをスキップします")
-            print(f"  実行予定コマンド:")
-            print(f"    az deployment group create \\")
-            print(f"      --resource-group ic-test-{self.environment}-rg \\")
-            print(f"      --template-file {bicep_dir}/main.bicep \\")
-            print(f"      --parameters {bicep_dir}/parameters.json")
-            print()
+            self._log_dry_run(
+                "Azure Bicepデプロイ",
+                "az deployment group create \\",
+                f"  --resource-group ic-test-{self.environment}-rg \\",
+                f"  --template-file {bicep_dir}/main.bicep \\",
+                f"  --parameters {bicep_dir}/parameters.json",
+            )
             return True
 
         # リソースグループ作成
-        print("  リソースグループ作成中...")
-        result = subprocess.run(
+        self._log("  リソースグループ作成中...")
+        result = await self._run(
             [
                 "az", "group", "create",
                 "--name", f"ic-test-{self.environment}-rg",
                 "--location", "japaneast",
             ],
-            capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            print(f"  ❌ リソースグループ作成失敗: {result.stderr}")
+            self._log(f"  ❌ リソースグループ作成失敗: {result.stderr}")
             return False
 
         # Bicepデプロイ
-        print("  Bicepデプロイ実行中...")
-        result = subprocess.run(
+        self._log("  Bicepデプロイ実行中...")
+        result = await self._run(
             [
                 "az", "deployment", "group", "create",
                 "--resource-group", f"ic-test-{self.environment}-rg",
@@ -198,356 +421,447 @@ class Deployer:
                 "--parameters", str(bicep_dir / "parameters.json"),
                 "--mode", "Incremental",
             ],
-            capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            print(f"  ❌ Bicepデプロイ失敗: {result.stderr}")
+            self._log(f"  ❌ Bicepデプロイ失敗: {result.stderr}")
             return False
 
-        print("  ✅ Azureインフラストラクチャデプロイ完了\n")
+        self._log("  ✅ Azureインフラストラクチャデプロイ完了\n")
         return True
 
-    def _deploy_aws_infrastructure(self) -> bool:
+    async def _deploy_aws_infrastructure(self) -> bool:
         """AWS Terraformデプロイ"""
         tf_dir = self.project_root / "infrastructure" / "aws" / "terraform"
 
         if self.dry_run:
-            print("  [DRY RUN] AWS Terraformデプロイをスキップします")
-            print(f"  実行予定コマンド:")
-            print(f"    cd {tf_dir}")
-            print(f"    terraform init")
-            print(f"    terraform plan")
-            print(f"    terraform apply -auto-approve")
-            print()
+            self._log_dry_run(
+                "AWS Terraformデプロイ",
+                f"cd {tf_dir}",
+                "terraform init",
+                "terraform plan",
+                "terraform apply -auto-approve",
+            )
             return True
 
         # Terraform init
-        print("  Terraform初期化中...")
-        result = subprocess.run(
+        self._log("  Terraform初期化中...")
+        result = await self._run(
             ["terraform", "init"],
             cwd=tf_dir,
-            capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            print(f"  ❌ Terraform init失敗: {result.stderr}")
+            self._log(f"  ❌ Terraform init失敗: {result.stderr}")
             return False
 
         # Terraform plan
-        print("  Terraform plan実行中...")
-        result = subprocess.run(
+        self._log("  Terraform plan実行中...")
+        result = await self._run(
             ["terraform", "plan", "-out=tfplan"],
             cwd=tf_dir,
-            capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            print(f"  ❌ Terraform plan失敗: {result.stderr}")
+            self._log(f"  ❌ Terraform plan失敗: {result.stderr}")
             return False
 
         # Terraform apply
-        print("  Terraform apply実行中...")
-        result = subprocess.run(
+        self._log("  Terraform apply実行中...")
+        result = await self._run(
             ["terraform", "apply", "-auto-approve", "tfplan"],
             cwd=tf_dir,
-            capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            print(f"  ❌ Terraform apply失敗: {result.stderr}")
+            self._log(f"  ❌ Terraform apply失敗: {result.stderr}")
             return False
 
-        print("  ✅ AWSインフラストラクチャデプロイ完了\n")
+        self._log("  ✅ AWSインフラストラクチャデプロイ完了\n")
         return True
 
-    def _deploy_gcp_infrastructure(self) -> bool:
+    async def _deploy_gcp_infrastructure(self) -> bool:
         """GCP Terraformデプロイ"""
         tf_dir = self.project_root / "infrastructure" / "gcp" / "terraform"
 
         if self.dry_run:
-            print("  [DRY RUN] GCP Terraformデプロイをスキップします")
-            print(f"  実行予定コマンド:")
-            print(f"    cd {tf_dir}")
-            print(f"    terraform init")
-            print(f"    terraform plan")
-            print(f"    terraform apply -auto-approve")
-            print()
+            self._log_dry_run(
+                "GCP Terraformデプロイ",
+                f"cd {tf_dir}",
+                "terraform init",
+                "terraform plan",
+                "terraform apply -auto-approve",
+            )
             return True
 
         # Terraform init
-        print("  Terraform初期化中...")
-        result = subprocess.run(
+        self._log("  Terraform初期化中...")
+        result = await self._run(
             ["terraform", "init"],
             cwd=tf_dir,
-            capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            print(f"  ❌ Terraform init失敗: {result.stderr}")
+            self._log(f"  ❌ Terraform init失敗: {result.stderr}")
             return False
 
         # Terraform apply
-        print("  Terraform apply実行中...")
-        result = subprocess.run(
+        self._log("  Terraform apply実行中...")
+        result = await self._run(
             ["terraform", "apply", "-auto-approve"],
             cwd=tf_dir,
-            capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            print(f"  ❌ Terraform apply失敗: {result.stderr}")
+            self._log(f"  ❌ Terraform apply失敗: {result.stderr}")
             return False
 
-        print("  ✅ GCPインフラストラクチャデプロイ完了\n")
+        self._log("  ✅ GCPインフラストラクチャデプロイ完了\n")
         return True
 
-    def _deploy_application(self) -> bool:
+    async def _deploy_application(self, build_task: Optional["asyncio.Task[bool]"]) -> bool:
         """アプリケーションデプロイ（Dockerイメージのビルド・プッシュ・デプロイ）"""
-        print("📦 [4/5] アプリケーションデプロイ\n")
+        self._log("📦 [4/5] アプリケーションデプロイ\n")
 
-        # 共通Dockerイメージのビルド
-        if not self._build_docker_image():
-            return False
+        push = build_task is not None
+        if push:
+            # 共通Dockerイメージのビルド（インフラデプロイと並行して開始済み）完了を待つ
+            if not await build_task:
+                return False
+        else:
+            self._log(f"  ℹ️  レジストリのイメージは最新です（{self.revision_tag}）。ビルドとプッシュをスキップします")
 
         if self.platform == "azure":
-            return self._deploy_azure_container_apps()
+            return await self._deploy_azure_container_apps(push)
         elif self.platform == "aws":
-            return self._deploy_aws_app_runner()
+            return await self._deploy_aws_app_runner(push)
         elif self.platform == "gcp":
-            return self._deploy_gcp_cloud_run()
+            return await self._deploy_gcp_cloud_run(push)
 
         return False
 
-    def _build_docker_image(self) -> bool:
-        """共通Dockerイメージのビルド"""
-        image_tag = f"ic-test-agent:{self.environment}-{int(time.time())}"
-        self._image_tag = image_tag
+    def _start_build(self) -> "asyncio.Task[bool]":
+        """共通Dockerイメージのビルドを開始（同一環境では実行中のビルドを共有）"""
+        task = _build_cache.get(self.environment)
+        if task is None:
+            task = asyncio.ensure_future(self._build_docker_image())
+            _build_cache[self.environment] = task
+        return task
+
+    async def _source_revision(self) -> str:
+        """
+        イメージタグ用のソースリビジョン（git の短縮コミットハッシュ）
+
+        同じソースからは同じタグになるため、再デプロイ時に
+        既存イメージとして扱われます。未コミットの変更がある場合は
+        "-dirty" を付け、レジストリとの一致判定には使いません。
+        git が使えない場合は時刻を使います。
+        """
+        try:
+            head, status = await asyncio.gather(
+                self._run(["git", "rev-parse", "--short=12", "HEAD"], cwd=self.project_root),
+                self._run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=self.project_root),
+            )
+        except OSError:
+            return str(int(time.time()))
+        if head.returncode != 0 or not head.stdout.strip():
+            return str(int(time.time()))
+        if status.returncode != 0 or status.stdout.strip():
+            return f"{head.stdout.strip()}-dirty"
+        self._revision_pinned = True
+        return head.stdout.strip()
+
+    async def _registry_digest(self, tag: str) -> Optional[str]:
+        """レジストリ上のタグが指すイメージのダイジェスト（存在しなければ None）"""
+        if self.platform == "azure":
+            argv = [
+                "az", "acr", "repository", "show",
+                "--name", f"ictestacr{self.environment}",
+                "--image", f"ic-test-agent:{tag}",
+                "--query", "digest", "--output", "tsv",
+            ]
+        elif self.platform == "aws":
+            argv = [
+                "aws", "ecr", "describe-images",
+                "--region", os.getenv("AWS_REGION", "ap-northeast-1"),
+                "--repository-name", "ic-test-agent",
+                "--image-ids", f"imageTag={tag}",
+                "--query", "imageDetails[0].imageDigest", "--output", "text",
+            ]
+        elif self.platform == "gcp":
+            argv = [
+                "gcloud", "artifacts", "docker", "images", "describe",
+                _registry_image("gcp", self.environment, tag),
+                "--format", "value(image_summary.digest)",
+            ]
+        else:
+            return None
+
+        result = await self._run(argv)
+        digest = result.stdout.strip()
+        if result.returncode != 0 or not digest or digest == "None":
+            return None
+        return digest
+
+    async def _registry_is_current(self) -> bool:
+        """レジストリの環境タグが現在のリビジョンのイメージを指しているか"""
+        if self.dry_run or not self._revision_pinned:
+            return False
+        current, revision = await asyncio.gather(
+            self._registry_digest(self.environment),
+            self._registry_digest(self.revision_tag),
+        )
+        return current is not None and current == revision
+
+    async def _build_docker_image(self) -> bool:
+        """
+        共通Dockerイメージのビルド
+
+        各レジストリのタグもビルド時にまとめて付与し、
+        プッシュ前の docker tag を不要にします。
+        """
+        image_tag = f"ic-test-agent:{self.revision_tag}"
+        registry_images = [
+            _registry_image(platform, self.environment) for platform in self.build_platforms
+        ]
+        revision_images = [
+            _registry_image(platform, self.environment, self.revision_tag)
+            for platform in self.build_platforms
+        ]
+        tag_args = [
+            arg for ref in [image_tag, *registry_images, *revision_images] for arg in ("-t", ref)
+        ]
 
         if self.dry_run:
-            print(f"  [DRY RUN] Dockerイメージビルドをスキップします")
-            print(f"  実行予定コマンド:")
-            print(f"    docker build -t {image_tag} .")
-            print()
+            self._log_dry_run(
+                "Dockerイメージビルド",
+                f"DOCKER_BUILDKIT=1 docker build {' '.join(tag_args)} .",
+            )
             return True
 
-        print(f"  Dockerイメージビルド中: {image_tag}")
-        result = subprocess.run(
-            ["docker", "build", "-t", image_tag, "."],
+        # BuildKit を有効化し、前回プッシュしたイメージをレイヤーキャッシュとして利用
+        # （--cache-from のキャッシュを取得できない場合は通常ビルドになる。
+        # --cache-to の書き出し失敗は ignore-error=true によりビルド失敗として扱わない）
+        build_cmd = ["docker", "build"]
+        cache_args = ["--build-arg", "BUILDKIT_INLINE_CACHE=1"]
+        cache_args += [arg for ref in registry_images for arg in ("--cache-from", ref)]
+        if DEPLOY_BUILD_CACHE_REF:
+            if await self._ensure_buildx_builder():
+                # ビルドはインフラデプロイと並行して始まるため、
+                # キャッシュの読み書き前にここでレジストリへログインしておく
+                for platform in self.build_platforms:
+                    error = await self._registry_login(platform)
+                    if error:
+                        self._log(f"  ⚠️  {error}（レジストリキャッシュを利用できない可能性があります）")
+                build_cmd = ["docker", "buildx", "build", "--builder", BUILDX_BUILDER_NAME, "--load"]
+                cache_args = [
+                    "--cache-from", f"type=registry,ref={DEPLOY_BUILD_CACHE_REF}",
+                    "--cache-to",
+                    f"type=registry,ref={DEPLOY_BUILD_CACHE_REF},mode=max,image-manifest=true,ignore-error=true",
+                ]
+            else:
+                self._log("  ⚠️  docker buildx ビルダーを利用できないため、インラインキャッシュでビルドします")
+
+        self._log(f"  Dockerイメージビルド中: {image_tag}")
+        result = await self._run(
+            [*build_cmd, *tag_args, *cache_args, "."],
             cwd=self.project_root,
-            capture_output=True,
-            text=True,
+            env={**os.environ, "DOCKER_BUILDKIT": "1"},
         )
 
         if result.returncode != 0:
-            print(f"  ❌ Dockerイメージビルド失敗: {result.stderr}")
+            self._log(f"  ❌ Dockerイメージビルド失敗: {result.stderr}")
             return False
 
-        print(f"  ✅ Dockerイメージビルド完了: {image_tag}\n")
+        self._log(f"  ✅ Dockerイメージビルド完了: {image_tag}\n")
         return True
 
-    def _deploy_azure_container_apps(self) -> bool:
+    async def _ensure_buildx_builder(self) -> bool:
+        """レジストリキャッシュを書き出せる docker-container ドライバのビルダーを用意"""
+        inspect = await self._run(["docker", "buildx", "inspect", BUILDX_BUILDER_NAME])
+        if inspect.returncode == 0:
+            return True
+        create = await self._run(
+            ["docker", "buildx", "create", "--name", BUILDX_BUILDER_NAME, "--driver", "docker-container"],
+        )
+        return create.returncode == 0
+
+    async def _registry_login(self, platform: str) -> Optional[str]:
+        """
+        プラットフォームのコンテナレジストリへ docker ログイン
+
+        Returns:
+            失敗時のエラーメッセージ（成功時は None）
+        """
+        if platform == "azure":
+            acr_name = f"ictestacr{self.environment}"
+            self._log(f"  ACRログイン中: {acr_name}")
+            result = await self._run(["az", "acr", "login", "--name", acr_name])
+            if result.returncode != 0:
+                return f"ACRログイン失敗: {result.stderr}"
+            return None
+
+        if platform == "aws":
+            aws_region = os.getenv("AWS_REGION", "ap-northeast-1")
+            aws_account_id = os.getenv("AWS_ACCOUNT_ID", "")
+            ecr_repo = f"{aws_account_id}.dkr.ecr.{aws_region}.amazonaws.com/ic-test-agent"
+            self._log(f"  ECRログイン中: {aws_region}")
+            login_password = await self._run(
+                ["aws", "ecr", "get-login-password", "--region", aws_region],
+            )
+            if login_password.returncode != 0:
+                return f"ECRログインパスワード取得失敗: {login_password.stderr}"
+            result = await self._run(
+                ["docker", "login", "--username", "AWS", "--password-stdin", ecr_repo],
+                input=login_password.stdout,
+            )
+            if result.returncode != 0:
+                return f"ECRログイン失敗: {result.stderr}"
+            return None
+
+        if platform == "gcp":
+            gcp_region = os.getenv("GCP_REGION", "asia-northeast1")
+            self._log(f"  Artifact Registry認証設定中: {gcp_region}")
+            result = await self._run(
+                ["gcloud", "auth", "configure-docker", f"{gcp_region}-docker.pkg.dev", "--quiet"],
+            )
+            if result.returncode != 0:
+                return f"Artifact Registry認証設定失敗: {result.stderr}"
+            return None
+
+        return f"不明なプラットフォーム: {platform}"
+
+    async def _deploy_azure_container_apps(self, push: bool = True) -> bool:
         """Azure Container Apps デプロイ（ACR経由）"""
         acr_name = f"ictestacr{self.environment}"
-        acr_image = f"{acr_name}.azurecr.io/ic-test-agent:{self.environment}"
+        acr_image = _registry_image("azure", self.environment)
+        acr_revision_image = _registry_image("azure", self.environment, self.revision_tag)
         container_app_name = f"ic-test-{self.environment}-app"
         resource_group = f"ic-test-{self.environment}-rg"
 
         if self.dry_run:
-            print("  [DRY RUN] Azure Container Appsデプロイをスキップします")
-            print(f"  実行予定コマンド:")
-            print(f"    az acr login --name {acr_name}")
-            print(f"    docker tag {self._image_tag} {acr_image}")
-            print(f"    docker push {acr_image}")
-            print(f"    az containerapp update \\")
-            print(f"      --name {container_app_name} \\")
-            print(f"      --resource-group {resource_group} \\")
-            print(f"      --image {acr_image}")
-            print()
+            self._log_dry_run(
+                "Azure Container Appsデプロイ",
+                f"az acr login --name {acr_name}",
+                f"docker push {acr_image}",
+                f"docker push {acr_revision_image}",
+                "az containerapp update \\",
+                f"  --name {container_app_name} \\",
+                f"  --resource-group {resource_group} \\",
+                f"  --image {acr_image}",
+            )
             return True
 
-        # ACRログイン
-        print(f"  ACRログイン中: {acr_name}")
-        result = subprocess.run(
-            ["az", "acr", "login", "--name", acr_name],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ ACRログイン失敗: {result.stderr}")
-            return False
-
-        # イメージタグ付け
-        print(f"  イメージタグ付け: {acr_image}")
-        result = subprocess.run(
-            ["docker", "tag", self._image_tag, acr_image],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ イメージタグ付け失敗: {result.stderr}")
-            return False
+        if push:
+            # ACRログイン（レジストリタグはビルド時に付与済み）
+            error = await self._registry_login("azure")
+            if error:
+                self._log(f"  ❌ {error}")
+                return False
 
-        # イメージプッシュ
-        print(f"  イメージプッシュ中: {acr_image}")
-        result = subprocess.run(
-            ["docker", "push", acr_image],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ イメージプッシュ失敗: {result.stderr}")
-            return False
+            # イメージプッシュ
+            self._log(f"  イメージプッシュ中: {acr_image}, {acr_revision_image}")
+            result = await self._push(acr_image, acr_revision_image)
+            if result.returncode != 0:
+                self._log(f"  ❌ イメージプッシュ失敗: {result.stderr}")
+                return False
 
         # Container Appsアップデート
-        print(f"  Container Appsアップデート中: {container_app_name}")
-        result = subprocess.run(
+        self._log(f"  Container Appsアップデート中: {container_app_name}")
+        result = await self._run(
             [
                 "az", "containerapp", "update",
                 "--name", container_app_name,
                 "--resource-group", resource_group,
                 "--image", acr_image,
             ],
-            capture_output=True,
-            text=True,
         )
         if result.returncode != 0:
-            print(f"  ❌ Container Appsアップデート失敗: {result.stderr}")
+            self._log(f"  ❌ Container Appsアップデート失敗: {result.stderr}")
             return False
 
-        print("  ✅ Azure Container Appsデプロイ完了\n")
+        self._log("  ✅ Azure Container Appsデプロイ完了\n")
         return True
 
-    def _deploy_aws_app_runner(self) -> bool:
+    async def _deploy_aws_app_runner(self, push: bool = True) -> bool:
         """AWS App Runner デプロイ（ECR経由）"""
         aws_region = os.getenv("AWS_REGION", "ap-northeast-1")
         aws_account_id = os.getenv("AWS_ACCOUNT_ID", "")
         ecr_repo = f"{aws_account_id}.dkr.ecr.{aws_region}.amazonaws.com/ic-test-agent"
-        ecr_image = f"{ecr_repo}:{self.environment}"
+        ecr_image = _registry_image("aws", self.environment)
+        ecr_revision_image = _registry_image("aws", self.environment, self.revision_tag)
         service_name = f"ic-test-{self.environment}-app"
 
         if self.dry_run:
-            print("  [DRY RUN] AWS App Runnerデプロイをスキップします")
-            print(f"  実行予定コマンド:")
-            print(f"    aws ecr get-login-password --region {aws_region} | docker login --username AWS --password-stdin {ecr_repo}")
-            print(f"    docker tag {self._image_tag} {ecr_image}")
-            print(f"    docker push {ecr_image}")
-            print(f"    aws apprunner update-service \\")
-            print(f"      --service-arn <service-arn> \\")
-            print(f"      --source-configuration ImageRepository={{ImageIdentifier={ecr_image}}}")
-            print()
+            self._log_dry_run(
+                "AWS App Runnerデプロイ",
+                f"aws ecr get-login-password --region {aws_region} | docker login --username AWS --password-stdin {ecr_repo}",
+                f"docker push {ecr_image}",
+                f"docker push {ecr_revision_image}",
+                "aws apprunner update-service \\",
+                "  --service-arn <service-arn> \\",
+                f"  --source-configuration ImageRepository={{ImageIdentifier={ecr_image}}}",
+            )
             return True
 
-        # ECRログイン
-        print(f"  ECRログイン中: {aws_region}")
-        login_password = subprocess.run(
-            ["aws", "ecr", "get-login-password", "--region", aws_region],
-            capture_output=True,
-            text=True,
-        )
-        if login_password.returncode != 0:
-            print(f"  ❌ ECRログインパスワード取得失敗: {login_password.stderr}")
-            return False
-
-        result = subprocess.run(
-            ["docker", "login", "--username", "AWS", "--password-stdin", ecr_repo],
-            input=login_password.stdout,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ ECRログイン失敗: {result.stderr}")
-            return False
-
-        # イメージタグ付け
-        print(f"  イメージタグ付け: {ecr_image}")
-        result = subprocess.run(
-            ["docker", "tag", self._image_tag, ecr_image],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ イメージタグ付け失敗: {result.stderr}")
-            return False
+        if push:
+            # ECRログイン（レジストリタグはビルド時に付与済み）
+            error = await self._registry_login("aws")
+            if error:
+                self._log(f"  ❌ {error}")
+                return False
 
-        # イメージプッシュ
-        print(f"  イメージプッシュ中: {ecr_image}")
-        result = subprocess.run(
-            ["docker", "push", ecr_image],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ イメージプッシュ失敗: {result.stderr}")
-            return False
+            # イメージプッシュ
+            self._log(f"  イメージプッシュ中: {ecr_image}, {ecr_revision_image}")
+            result = await self._push(ecr_image, ecr_revision_image)
+            if result.returncode != 0:
+                self._log(f"  ❌ イメージプッシュ失敗: {result.stderr}")
+                return False
 
         # App Runnerサービスアップデート（デプロイメントはECRトリガーで自動）
-        print(f"  App Runnerサービス: {service_name} - ECRプッシュにより自動デプロイ")
-        print("  ✅ AWS App Runnerデプロイ完了\n")
+        self._log_block([
+            f"  App Runnerサービス: {service_name} - ECRプッシュにより自動デプロイ",
+            "  ✅ AWS App Runnerデプロイ完了\n",
+        ])
         return True
 
-    def _deploy_gcp_cloud_run(self) -> bool:
+    async def _deploy_gcp_cloud_run(self, push: bool = True) -> bool:
         """GCP Cloud Run デプロイ（Artifact Registry経由）"""
-        gcp_project = os.getenv("GCP_PROJECT_ID", "")
         gcp_region = os.getenv("GCP_REGION", "asia-northeast1")
-        ar_image = f"{gcp_region}-docker.pkg.dev/{gcp_project}/ic-test-agent/app:{self.environment}"
+        ar_image = _registry_image("gcp", self.environment)
+        ar_revision_image = _registry_image("gcp", self.environment, self.revision_tag)
         service_name = f"ic-test-{self.environment}-app"
 
         if self.dry_run:
-            print("  [DRY RUN] GCP Cloud Runデプロイをスキップします")
-            print(f"  実行予定コマンド:")
-            print(f"    gcloud auth configure-docker {gcp_region}-docker.pkg.dev")
-            print(f"    docker tag {self._image_tag} {ar_image}")
-            print(f"    docker push {ar_image}")
-            print(f"    gcloud run deploy {service_name} \\")
-            print(f"      --image {ar_image} \\")
-            print(f"      --region {gcp_region} \\")
-            print(f"      --platform managed")
-            print()
+            self._log_dry_run(
+                "GCP Cloud Runデプロイ",
+                f"gcloud auth configure-docker {gcp_region}-docker.pkg.dev",
+                f"docker push {ar_image}",
+                f"docker push {ar_revision_image}",
+                f"gcloud run deploy {service_name} \\",
+                f"  --image {ar_image} \\",
+                f"  --region {gcp_region} \\",
+                "  --platform managed",
+            )
             return True
 
-        # Artifact Registry認証設定
-        print(f"  Artifact Registry認証設定中: {gcp_region}")
-        result = subprocess.run(
-            ["gcloud", "auth", "configure-docker", f"{gcp_region}-docker.pkg.dev", "--quiet"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ Artifact Registry認証設定失敗: {result.stderr}")
-            return False
-
-        # イメージタグ付け
-        print(f"  イメージタグ付け: {ar_image}")
-        result = subprocess.run(
-            ["docker", "tag", self._image_tag, ar_image],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ イメージタグ付け失敗: {result.stderr}")
-            return False
+        if push:
+            # Artifact Registry認証設定（レジストリタグはビルド時に付与済み）
+            error = await self._registry_login("gcp")
+            if error:
+                self._log(f"  ❌ {error}")
+                return False
 
-        # イメージプッシュ
-        print(f"  イメージプッシュ中: {ar_image}")
-        result = subprocess.run(
-            ["docker", "push", ar_image],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ❌ イメージプッシュ失敗: {result.stderr}")
-            return False
+            # イメージプッシュ
+            self._log(f"  イメージプッシュ中: {ar_image}, {ar_revision_image}")
+            result = await self._push(ar_image, ar_revision_image)
+            if result.returncode != 0:
+                self._log(f"  ❌ イメージプッシュ失敗: {result.stderr}")
+                return False
 
         # Cloud Runデプロイ
-        print(f"  Cloud Runデプロイ中: {service_name}")
-        result = subprocess.run(
+        self._log(f"  Cloud Runデプロイ中: {service_name}")
+        result = await self._run(
             [
                 "gcloud", "run", "deploy", service_name,
                 "--image", ar_image,
@@ -555,37 +869,56 @@ class Deployer:
                 "--platform", "managed",
                 "--quiet",
             ],
-            capture_output=True,
-            text=True,
         )
         if result.returncode != 0:
-            print(f"  ❌ Cloud Runデプロイ失敗: {result.stderr}")
+            self._log(f"  ❌ Cloud Runデプロイ失敗: {result.stderr}")
             return False
 
-        print("  ✅ GCP Cloud Runデプロイ完了\n")
+        self._log("  ✅ GCP Cloud Runデプロイ完了\n")
         return True
 
-    def _validate_deployment(self) -> bool:
+    async def _validate_deployment(self) -> bool:
         """デプロイメント検証"""
-        print("✅ [5/5] デプロイメント検証\n")
+        self._log("✅ [5/5] デプロイメント検証\n")
 
-        result = subprocess.run(
+        result = await self._run(
             [sys.executable, "scripts/validate_deployment.py", "--platform", self.platform],
             cwd=self.project_root,
-            capture_output=True,
-            text=True,
         )
 
-        print(result.stdout)
+        self._log_block([result.stdout])
 
         if result.returncode != 0:
-            print("  ⚠️  デプロイメント検証で問題が検出されました")
+            self._log("  ⚠️  デプロイメント検証で問題が検出されました")
             return False
 
-        print("  ✅ デプロイメント検証完了\n")
+        self._log("  ✅ デプロイメント検証完了\n")
         return True
 
 
+async def _deploy_platforms(
+    platforms: List[str],
+    environment: str,
+    dry_run: bool,
+    verbose: bool = False,
+) -> Dict[str, bool]:
+    """
+    各プラットフォームのデプロイを並列実行
+
+    プラットフォーム間に依存関係はないため、`--platform all` では
+    Azure/AWS/GCP のデプロイを同時に進め、所要時間を最も遅い1つ分に抑えます。
+    """
+    deployers = [
+        Deployer(platform, environment, dry_run, verbose, build_platforms=platforms)
+        for platform in platforms
+    ]
+    results = await asyncio.gather(
+        *(deployer.deploy() for deployer in deployers),
+        return_exceptions=True,
+    )
+    return {platform: result is True for platform, result in zip(platforms, results)}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="ワンコマンドデプロイメントスクリプト"
@@ -607,6 +940,11 @@ def main():
         action="store_true",
         help="ドライラン（実際のリソースは作成されません）",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="外部コマンドの出力を逐次表示",
+    )
 
     args = parser.parse_args()
 
@@ -615,20 +953,21 @@ def main():
     else:
         platforms = [args.platform]
 
-    all_success = True
-
-    for platform in platforms:
-        deployer = Deployer(platform, args.environment, args.dry_run)
-        success = deployer.deploy()
+    try:
+        results = asyncio.run(
+            _deploy_platforms(platforms, args.environment, args.dry_run, args.verbose)
+        )
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
 
-        if not success:
-            all_success = False
-            if not args.dry_run:
-                response = input(f"\n{platform}のデプロイに失敗しました。続行しますか? (y/N): ")
-                if response.lower() != 'y':
-                    break
+    if len(platforms) > 1:
+        print(f"\n{_SEP}")
+        for platform, success in results.items():
+            print(f"  {'✅' if success else '❌'} {platform.upper()}")
+        print(f"{_SEP}\n")
 
-    sys.exit(0 if all_success else 1)
+    sys.exit(0 if all(results.values()) else 1)
 
 
 if __name__ == "__main__":
@@ -6,21 +6,94 @@
 """
 
 import argparse
+import json
 import os
+import shutil
 import sys
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import subprocess
-import json
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _probe_version(cmd: str) -> Optional[subprocess.CompletedProcess]:
+    """`<cmd> --version` を実行（PATH上に無い場合はプロセスを起動せず None）"""
+    if shutil.which(cmd) is None:
+        return None
+    # 使うのは stdout の1行目のみのため、stderr は捨ててデコードも1行目に限定する
+    return subprocess.run(
+        [cmd, "--version"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=5,
+    )
+
+
+def _azure_cli_default_subscription() -> Optional[str]:
+    """
+    az CLI の既定サブスクリプションIDを取得（プロセスを起動せず設定ファイルから読む）
+
+    `az account set` で選択されたサブスクリプションは
+    azureProfile.json の isDefault で示されます。見つからなければ None。
+    """
+    config_dir = os.getenv("AZURE_CONFIG_DIR") or os.path.join(os.path.expanduser("~"), ".azure")
+    try:
+        with open(os.path.join(config_dir, "azureProfile.json"), encoding="utf-8-sig") as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return None
+    for subscription in profile.get("subscriptions", []):
+        if subscription.get("isDefault"):
+            return subscription.get("id")
+    return None
 
 
 class DeploymentPreparation:
     """デプロイメント準備クラス"""
 
+    # プラットフォームごとの必要CLIツール（コマンド: 表示名）
+    CLI_TOOLS: Dict[str, Dict[str, str]] = {
+        "azure": {"az": "Azure CLI", "terraform": "Terraform (optional)"},
+        "aws": {"aws": "AWS CLI", "terraform": "Terraform"},
+        "gcp": {"gcloud": "Google Cloud SDK", "terraform": "Terraform"},
+    }
+
+    # プラットフォームごとのIaCディレクトリと必須ファイル
+    IAC_FILES: Dict[str, Tuple[str, List[str]]] = {
+        "azure": ("infrastructure/azure/bicep", ["main.bicep", "parameters.json"]),
+        "aws": ("infrastructure/aws/terraform", ["backend.tf", "variables.tf"]),
+        "gcp": ("infrastructure/gcp/terraform", ["backend.tf", "variables.tf"]),
+    }
+
+    # プラットフォームごとのシークレット管理サービスと登録すべきシークレット
+    SECRET_NAMES: Dict[str, Tuple[str, List[str]]] = {
+        "azure": ("Azure Key Vault", [
+            "AZURE-FOUNDRY-API-KEY",
+            "AZURE-FOUNDRY-ENDPOINT",
+            "AZURE-DOCUMENT-INTELLIGENCE-API-KEY",
+            "AZURE-DOCUMENT-INTELLIGENCE-ENDPOINT",
+        ]),
+        "aws": ("AWS Secrets Manager", [
+            "ic-test/bedrock-api-key",
+            "ic-test/bedrock-endpoint",
+            "ic-test/textract-api-key",
+        ]),
+        "gcp": ("GCP Secret Manager", [
+            "vertexai-api-key",
+            "vertexai-endpoint",
+            "documentai-api-key",
+        ]),
+    }
+
     def __init__(self, platform: str):
         self.platform = platform.lower()
         self.issues: List[str] = []
         self.warnings: List[str] = []
         self.success_items: List[str] = []
+        self._check_platform_credentials: Optional[Callable[[], None]] = {
+            "azure": self._check_azure_credentials,
+            "aws": self._check_aws_credentials,
+            "gcp": self._check_gcp_credentials,
+        }.get(self.platform)
 
     def run_all_checks(self) -> bool:
         """全チェック実行"""
@@ -50,73 +123,53 @@ class DeploymentPreparation:
         """CLIツールの確認"""
         print("📋 CLIツールの確認\n")
 
-        if self.platform == "azure":
-            tools = {
-                "az": "Azure CLI",
-                "terraform": "Terraform (optional)",
-            }
-        elif self.platform == "aws":
-            tools = {
-                "aws": "AWS CLI",
-                "terraform": "Terraform",
-            }
-        elif self.platform == "gcp":
-            tools = {
-                "gcloud": "Google Cloud SDK",
-                "terraform": "Terraform",
-            }
-        else:
+        tools = self.CLI_TOOLS.get(self.platform)
+        if tools is None:
             self.issues.append(f"不明なプラットフォーム: {self.platform}")
             return
 
+        # 各ツールのバージョン確認はプロセス起動待ちが主なので並行実行する
+        # （結果は表示順を保つため tools の順に処理）
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            futures = {cmd: executor.submit(_probe_version, cmd) for cmd in tools}
+
+        lines: List[str] = []
         for cmd, name in tools.items():
             try:
-                result = subprocess.run(
-                    [cmd, "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
+                result = futures[cmd].result()
+                if result is None:
+                    raise FileNotFoundError(cmd)
                 if result.returncode == 0:
-                    version = result.stdout.split("\n")[0]
-                    print(f"  ✅ {name}: {version}")
+                    version = result.stdout.split(b"\n", 1)[0].decode("utf-8", "replace")
+                    lines.append(f"  ✅ {name}: {version}")
                     self.success_items.append(f"{name} インストール済み")
                 else:
-                    print(f"  ❌ {name}: インストールされていません")
+                    lines.append(f"  ❌ {name}: インストールされていません")
                     self.issues.append(f"{name} がインストールされていません")
             except FileNotFoundError:
-                print(f"  ❌ {name}: インストールされていません")
+                lines.append(f"  ❌ {name}: インストールされていません")
                 self.issues.append(f"{name} がインストールされていません")
             except Exception as e:
-                print(f"  ⚠️  {name}: チェックエラー ({e})")
+                lines.append(f"  ⚠️  {name}: チェックエラー ({e})")
                 self.warnings.append(f"{name} のチェックに失敗しました")
 
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _check_credentials(self):
         """認証情報の確認"""
         print("🔐 認証情報の確認\n")
 
-        if self.platform == "azure":
-            self._check_azure_credentials()
-        elif self.platform == "aws":
-            self._check_aws_credentials()
-        elif self.platform == "gcp":
-            self._check_gcp_credentials()
+        if self._check_platform_credentials is not None:
+            self._check_platform_credentials()
 
         print()
 
     def _check_azure_credentials(self):
         """Azure認証情報の確認"""
         try:
-            result = subprocess.run(
-                ["az", "account", "show"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                account_info = json.loads(result.stdout)
+            account_info = self._azure_account()
+            if account_info is not None:
                 print(f"  ✅ Azure認証済み")
                 print(f"     サブスクリプション: {account_info.get('name')}")
                 print(f"     ID: {account_info.get('id')}")
@@ -129,17 +182,62 @@ class DeploymentPreparation:
             print(f"  ⚠️  Azure認証確認エラー: {e}")
             self.warnings.append("Azure認証の確認に失敗しました")
 
-    def _check_aws_credentials(self):
-        """AWS認証情報の確認"""
+    def _azure_account(self) -> Optional[Dict[str, str]]:
+        """
+        Azureのサブスクリプション情報を取得（未認証なら None）
+
+        Azure SDK がインストールされていればCLIを起動せずに確認し、
+        無ければ `az account show` にフォールバックします。
+        """
         try:
+            from azure.core.exceptions import ClientAuthenticationError
+            from azure.identity import DefaultAzureCredential
+            from azure.mgmt.subscription import SubscriptionClient
+        except ImportError:
             result = subprocess.run(
-                ["aws", "sts", "get-caller-identity"],
+                ["az", "account", "show", "--query", "{name:name,id:id}", "--output", "tsv"],
                 capture_output=True,
                 text=True,
                 timeout=10,
             )
-            if result.returncode == 0:
-                identity = json.loads(result.stdout)
+            if result.returncode != 0 or not result.stdout.strip():
+                return None
+            name, _, subscription_id = result.stdout.strip().partition("\t")
+            return {"name": name, "id": subscription_id}
+
+        def _lookup() -> Optional[Dict[str, str]]:
+            # デプロイ対象（AZURE_SUBSCRIPTION_ID または az CLI の既定）を優先し、
+            # どちらも無い場合のみアクセス可能な最初のサブスクリプションを表示する
+            subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID") or _azure_cli_default_subscription()
+            try:
+                credential = DefaultAzureCredential(process_timeout=10)
+                client = SubscriptionClient(credential, connection_timeout=10, read_timeout=10)
+                if subscription_id:
+                    subscription = client.subscriptions.get(subscription_id)
+                else:
+                    subscription = next(iter(client.subscriptions.list()), None)
+            except ClientAuthenticationError:
+                return None
+            if subscription is None:
+                return None
+            name = subscription.display_name
+            if not subscription_id:
+                name = f"{name}（アクセス可能な最初のサブスクリプション）"
+            return {"name": name, "id": subscription.subscription_id}
+
+        # トークン取得（マネージドID等）が応答しない場合に備え、CLI版と同じく10秒で打ち切る
+        # （タイムアウトは呼び出し元で「確認に失敗」として扱う）
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return executor.submit(_lookup).result(timeout=10)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _check_aws_credentials(self):
+        """AWS認証情報の確認"""
+        try:
+            identity = self._aws_caller_identity()
+            if identity is not None:
                 print(f"  ✅ AWS認証済み")
                 print(f"     アカウントID: {identity.get('Account')}")
                 print(f"     ARN: {identity.get('Arn')}")
@@ -152,32 +250,67 @@ class DeploymentPreparation:
             print(f"  ⚠️  AWS認証確認エラー: {e}")
             self.warnings.append("AWS認証の確認に失敗しました")
 
-    def _check_gcp_credentials(self):
-        """GCP認証情報の確認"""
+    def _aws_caller_identity(self) -> Optional[Dict[str, str]]:
+        """
+        AWSの呼び出し元IDを取得（未認証なら None）
+
+        boto3 がインストールされていればCLIを起動せずに確認し、
+        無ければ `aws sts get-caller-identity` にフォールバックします。
+        """
         try:
+            import boto3
+            from botocore.exceptions import BotoCoreError, ClientError
+        except ImportError:
             result = subprocess.run(
-                ["gcloud", "auth", "list", "--filter=status:ACTIVE", "--format=json"],
+                ["aws", "sts", "get-caller-identity", "--query", "[Account, Arn]", "--output", "text"],
                 capture_output=True,
                 text=True,
                 timeout=10,
             )
-            if result.returncode == 0:
-                accounts = json.loads(result.stdout)
-                if accounts:
-                    print(f"  ✅ GCP認証済み")
-                    print(f"     アカウント: {accounts[0].get('account')}")
-                    self.success_items.append("GCP認証済み")
-                else:
-                    print(f"  ❌ GCP認証が必要です")
-                    print(f"     実行: gcloud auth login")
-                    self.issues.append("GCP認証が必要です")
+            if result.returncode != 0 or not result.stdout.strip():
+                return None
+            account, _, arn = result.stdout.strip().partition("\t")
+            return {"Account": account, "Arn": arn}
+
+        try:
+            return boto3.client("sts").get_caller_identity()
+        except (BotoCoreError, ClientError):
+            return None
+
+    def _check_gcp_credentials(self):
+        """GCP認証情報の確認"""
+        try:
+            account = self._gcp_account()
+            if account is not None:
+                print(f"  ✅ GCP認証済み")
+                print(f"     アカウント: {account}")
+                self.success_items.append("GCP認証済み")
             else:
                 print(f"  ❌ GCP認証が必要です")
+                print(f"     実行: gcloud auth login")
                 self.issues.append("GCP認証が必要です")
         except Exception as e:
             print(f"  ⚠️  GCP認証確認エラー: {e}")
             self.warnings.append("GCP認証の確認に失敗しました")
 
+    def _gcp_account(self) -> Optional[str]:
+        """
+        gcloud CLIの認証済みアカウントを取得（未認証なら None）
+
+        デプロイは gcloud CLI のアカウントで行うため、
+        Application Default Credentials ではなく `gcloud auth list` で確認します。
+        """
+        result = subprocess.run(
+            ["gcloud", "auth", "list", "--filter=status:ACTIVE", "--format=value(account)"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        if result.returncode != 0:
+            return None
+        accounts = result.stdout.split()
+        return accounts[0] if accounts else None
+
     def _check_environment_variables(self):
         """環境変数の確認"""
         print("🔧 環境変数の確認\n")
@@ -197,17 +330,23 @@ class DeploymentPreparation:
         """IaCファイルの確認"""
         print("📂 IaCファイルの確認\n")
 
-        if self.platform == "azure":
-            iac_dir = "infrastructure/azure/bicep"
-            required_files = ["main.bicep", "parameters.json"]
-        else:  # aws or gcp
-            iac_dir = f"infrastructure/{self.platform}/terraform"
-            required_files = ["backend.tf", "variables.tf"]
+        if self.platform not in self.IAC_FILES:
+            # 不明なプラットフォームは CLIツールの確認で問題として記録済み
+            print()
+            return
+        iac_dir, required_files = self.IAC_FILES[self.platform]
+
+        # ディレクトリを1回だけ読み、各ファイルの存在はその一覧から判定する
+        try:
+            with os.scandir(iac_dir) as entries:
+                present = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            present = set()
 
         missing_files = []
         for file in required_files:
             file_path = os.path.join(iac_dir, file)
-            if os.path.exists(file_path):
+            if file in present:
                 print(f"  ✅ {file_path}")
                 self.success_items.append(f"IaCファイル {file} 存在")
             else:
@@ -223,57 +362,43 @@ class DeploymentPreparation:
         """シークレットの確認"""
         print("🔒 シークレット管理の確認\n")
 
-        if self.platform == "azure":
-            print("  Azure Key Vaultにシークレットを登録してください:")
-            print("    - AZURE-FOUNDRY-API-KEY")
-            print("    - AZURE-FOUNDRY-ENDPOINT")
-            print("    - AZURE-DOCUMENT-INTELLIGENCE-API-KEY")
-            print("    - AZURE-DOCUMENT-INTELLIGENCE-ENDPOINT")
-        elif self.platform == "aws":
-            print("  AWS Secrets Managerにシークレットを登録してください:")
-            print("    - ic-test/bedrock-api-key")
-            print("    - ic-test/bedrock-endpoint")
-            print("    - ic-test/textract-api-key")
-        elif self.platform == "gcp":
-            print("  GCP Secret Managerにシークレットを登録してください:")
-            print("    - vertexai-api-key")
-            print("    - vertexai-endpoint")
-            print("    - documentai-api-key")
+        if self.platform in self.SECRET_NAMES:
+            service, secret_names = self.SECRET_NAMES[self.platform]
+            print(f"  {service}にシークレットを登録してください:")
+            for secret_name in secret_names:
+                print(f"    - {secret_name}")
 
         self.warnings.append("シークレットの登録を確認してください")
         print()
 
     def _print_summary(self) -> bool:
-        """結果サマリー表示"""
-        print(f"\n{'='*70}")
-        print("  チェック結果サマリー")
-        print(f"{'='*70}\n")
-
-        if self.success_items:
-            print("✅ 成功項目:")
-            for item in self.success_items:
-                print(f"  - {item}")
-            print()
-
-        if self.warnings:
-            print("⚠️  警告:")
-            for warning in self.warnings:
-                print(f"  - {warning}")
-            print()
+        """結果サマリー表示（まとめて1回で書き出す）"""
+        out: List[str] = [
+            f"\n{'='*70}",
+            "  チェック結果サマリー",
+            f"{'='*70}\n",
+        ]
+
+        for title, items in (
+            ("✅ 成功項目:", self.success_items),
+            ("⚠️  警告:", self.warnings),
+            ("❌ 問題:", self.issues),
+        ):
+            if items:
+                out.append(title)
+                out.extend(f"  - {item}" for item in items)
+                out.append("")
 
         if self.issues:
-            print("❌ 問題:")
-            for issue in self.issues:
-                print(f"  - {issue}")
-            print()
-            print("デプロイメント前に上記の問題を解決してください。\n")
-            return False
+            out.append("デプロイメント前に上記の問題を解決してください。\n")
+        elif self.warnings:
+            out.append("⚠️  警告がありますが、デプロイメント可能です。\n")
         else:
-            if self.warnings:
-                print("⚠️  警告がありますが、デプロイメント可能です。\n")
-            else:
-                print("✅ すべてのチェックが成功しました。デプロイメント可能です。\n")
-            return True
+            out.append("✅ すべてのチェックが成功しました。デプロイメント可能です。\n")
+
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+        return not self.issues
 
 
 def main():
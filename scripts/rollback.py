@@ -6,14 +6,84 @@
 """
 
 import argparse
+import shutil
 import sys
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# terraform destroy など削除コマンドのタイムアウト（秒）
+DESTROY_TIMEOUT = 1800
+
+# az group delete --no-wait は削除要求の受付のみのため短めに設定
+AZURE_DELETE_TIMEOUT = 300
+
+# 失敗時のエラー表示用に保持する出力の末尾行数
+OUTPUT_TAIL_LINES = 200
+
+
+def _run_streaming(
+    cmd: List[str],
+    cwd: Optional[Path] = None,
+    timeout: float = DESTROY_TIMEOUT,
+) -> Tuple[int, str]:
+    """
+    コマンドを実行し、出力を逐次表示
+
+    terraform destroy などの長い出力をメモリに溜めず、進捗をそのまま表示します。
+    失敗時のエラー表示用に末尾 OUTPUT_TAIL_LINES 行のみ保持します。
+
+    Returns:
+        (終了コード, 出力の末尾)
+
+    Raises:
+        subprocess.TimeoutExpired: timeout 秒以内に終了しなかった場合
+    """
+    tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    # 出力が途絶えたまま停止した場合も打ち切れるよう、タイマーで強制終了する
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            sys.stdout.write(f"    {line}")
+            tail.append(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output="".join(tail))
+    return returncode, "".join(tail)
 
 
 class Rollback:
     """ロールバック実行クラス"""
 
+    # プラットフォームごとに必要な外部コマンド
+    REQUIRED_COMMANDS = {
+        "azure": "az",
+        "aws": "terraform",
+        "gcp": "terraform",
+    }
+
     def __init__(self, platform: str, environment: str = "staging", dry_run: bool = False):
         self.platform = platform.lower()
         self.environment = environment
@@ -28,24 +98,40 @@ class Rollback:
             print(f"  モード: DRY RUN")
         print(f"{'='*70}\n")
 
+        rollback_impl = {
+            "azure": self._rollback_azure,
+            "aws": self._rollback_aws,
+            "gcp": self._rollback_gcp,
+        }.get(self.platform)
+        if rollback_impl is None:
+            print(f"  ❌ 不明なプラットフォーム: {self.platform}")
+            return False
+
+        # 確認プロンプトの前に実行環境を検証し、入力後に失敗するのを防ぐ
+        if not self._preflight():
+            return False
+
         if not self._confirm_rollback():
             return False
 
         try:
-            if self.platform == "azure":
-                return self._rollback_azure()
-            elif self.platform == "aws":
-                return self._rollback_aws()
-            elif self.platform == "gcp":
-                return self._rollback_gcp()
-            else:
-                print(f"  ❌ 不明なプラットフォーム: {self.platform}")
-                return False
-
+            return rollback_impl()
         except Exception as e:
             print(f"\n  ❌ ロールバック失敗: {e}\n")
             return False
 
+    def _preflight(self) -> bool:
+        """必要なコマンドの存在確認（DRY RUNでは実行しないため不要）"""
+        if self.dry_run:
+            return True
+
+        command = self.REQUIRED_COMMANDS[self.platform]
+        if shutil.which(command) is None:
+            print(f"  ❌ {command} コマンドが見つかりません。インストール後に再実行してください")
+            return False
+
+        return True
+
     def _confirm_rollback(self) -> bool:
         """ロールバック確認"""
         if self.dry_run:
@@ -72,19 +158,18 @@ class Rollback:
             return True
 
         print("  Azureリソースグループ削除中...")
-        result = subprocess.run(
+        returncode, output = _run_streaming(
             [
                 "az", "group", "delete",
                 "--name", f"ic-test-{self.environment}-rg",
                 "--yes",
                 "--no-wait",
             ],
-            capture_output=True,
-            text=True,
+            timeout=AZURE_DELETE_TIMEOUT,
         )
 
-        if result.returncode != 0:
-            print(f"  ❌ リソースグループ削除失敗: {result.stderr}")
+        if returncode != 0:
+            print(f"  ❌ リソースグループ削除失敗: {output}")
             return False
 
         print("  ✅ Azureロールバック完了（非同期削除中）\n")
@@ -103,15 +188,13 @@ class Rollback:
             return True
 
         print("  AWS Terraform destroy実行中...")
-        result = subprocess.run(
+        returncode, output = _run_streaming(
             ["terraform", "destroy", "-auto-approve"],
             cwd=tf_dir,
-            capture_output=True,
-            text=True,
         )
 
-        if result.returncode != 0:
-            print(f"  ❌ Terraform destroy失敗: {result.stderr}")
+        if returncode != 0:
+            print(f"  ❌ Terraform destroy失敗: {output}")
             return False
 
         print("  ✅ AWSロールバック完了\n")
@@ -130,15 +213,13 @@ class Rollback:
             return True
 
         print("  GCP Terraform destroy実行中...")
-        result = subprocess.run(
+        returncode, output = _run_streaming(
             ["terraform", "destroy", "-auto-approve"],
             cwd=tf_dir,
-            capture_output=True,
-            text=True,
         )
 
-        if result.returncode != 0:
-            print(f"  ❌ Terraform destroy失敗: {result.stderr}")
+        if returncode != 0:
+            print(f"  ❌ Terraform destroy失敗: {output}")
             return False
 
         print("  ✅ GCPロールバック完了\n")
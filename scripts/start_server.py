@@ -2,10 +2,10 @@
 import os
 import subprocess
 
-# プロジェクトルートを取得
-project_root = os.path.dirname(os.path.abspath(__file__))
+# プロジェクトルートを取得（このスクリプトは scripts/ 配下）
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 azure_func_path = os.path.join(project_root, "platforms", "azure")
 
 print(f"Starting Azure Functions from: {azure_func_path}")
-os.chdir(azure_func_path)
-subprocess.run(["func", "start", "--python"])
+# カレントディレクトリは変更せず、子プロセスの作業ディレクトリとして指定する
+subprocess.run(["func", "start", "--python"], cwd=azure_func_path, check=True)
@@ -28,42 +28,142 @@ python scripts/validate_deployment.py --all
 ================================================================================
 """
 import argparse
+import asyncio
 import sys
 import os
-import requests
 import time
-from typing import Dict, Any, List, Tuple
-from enum import Enum
+from functools import cached_property
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
+if TYPE_CHECKING:
+    # httpx は HTTP検証を行う場合のみ遅延インポートする（--help や環境変数のみの検証を軽くする）
+    import httpx
 
-class ValidationStatus(Enum):
-    """検証ステータス"""
+
+class ValidationStatus:
+    """検証ステータス（表示用の文字列定数）"""
     PASS = "✓ PASS"
     FAIL = "✗ FAIL"
     WARN = "⚠ WARN"
     SKIP = "- SKIP"
 
 
+# 環境変数検証の結果名テンプレートと (ステータス, メッセージ) の組
+_ENV_NAME_TMPL = "環境変数 %s"
+_ENV_PRESENT = (ValidationStatus.PASS, "設定済み")
+_ENV_MISSING = (ValidationStatus.FAIL, "未設定")
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """検証結果"""
-    def __init__(self, name: str, status: ValidationStatus, message: str = ""):
-        self.name = name
-        self.status = status
-        self.message = message
+    name: str
+    status: str
+    message: str = ""
 
     def __str__(self):
-        return f"{self.status.value} {self.name}: {self.message}"
+        return "%s %s: %s" % (self.status, self.name, self.message)
 
 
 class DeploymentValidator:
     """デプロイメント検証クラス"""
 
-    def __init__(self, platform: str):
+    # プラットフォームごとの必須環境変数
+    REQUIRED_ENV_VARS: Dict[str, List[str]] = {
+        "azure": [
+            "AZURE_APIM_ENDPOINT",
+            "AZURE_APIM_SUBSCRIPTION_KEY",
+            "APPLICATIONINSIGHTS_CONNECTION_STRING",
+            "KEY_VAULT_NAME"
+        ],
+        "aws": [
+            "AWS_API_GATEWAY_ENDPOINT",
+            "AWS_API_KEY",
+            "AWS_REGION"
+        ],
+        "gcp": [
+            "GCP_APIGEE_ENDPOINT",
+            "GCP_API_KEY",
+            "GCP_PROJECT"
+        ],
+    }
+
+    # プラットフォームごとのAPI Gateway設定（エンドポイント環境変数, APIキーヘッダー名, APIキー環境変数）
+    API_GATEWAY_ENV: Dict[str, Tuple[str, str, str]] = {
+        "azure": ("AZURE_APIM_ENDPOINT", "Ocp-Apim-Subscription-Key", "AZURE_APIM_SUBSCRIPTION_KEY"),
+        "aws": ("AWS_API_GATEWAY_ENDPOINT", "X-Api-Key", "AWS_API_KEY"),
+        "gcp": ("GCP_APIGEE_ENDPOINT", "X-Api-Key", "GCP_API_KEY"),
+    }
+
+    # 一時的なエラーとしてリトライするステータスコード
+    RETRY_STATUS_CODES = (502, 503, 504)
+    MAX_RETRIES = 2
+
+    def __init__(self, platform: str, client: Optional["httpx.AsyncClient"] = None):
         self.platform = platform
         self.results: List[ValidationResult] = []
+        # 全プラットフォームの検証で共有するHTTPクライアント
+        self.client = client
+
+        # /health へのプローブ結果（レスポンス, 例外）。
+        # ゲートウェイ接続・バックエンド状態・相関ID伝播の3検証で共有する
+        self._health_probe: Optional[Tuple[Optional["httpx.Response"], Optional[Exception]]] = None
+        self._test_correlation_id = f"validation_{int(time.time())}"
+
+    async def _fetch_health(self) -> None:
+        """
+        相関IDヘッダー付きで /health を1回だけ呼び出す
+
+        ステータスコード（ゲートウェイ到達性）、レスポンスボディ（ヘルス状態）、
+        レスポンスヘッダー（相関IDのエコー）を1往復で取得します。
+        一時的な 5xx は検証全体をやり直さずにリトライします。
+        """
+        import httpx
+
+        endpoint, api_key_header, api_key = self.api_gateway_config
+        headers = {
+            api_key_header: api_key,
+            "X-Correlation-ID": self._test_correlation_id,
+        }
+        try:
+            for attempt in range(self.MAX_RETRIES + 1):
+                response = await self.client.get(
+                    f"{endpoint}/health",
+                    headers=headers,
+                    timeout=10
+                )
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.MAX_RETRIES:
+                    break
+                await asyncio.sleep(0.1 * (2 ** attempt))
+            self._health_probe = (response, None)
+        except httpx.HTTPError as e:
+            self._health_probe = (None, e)
+
+    def _probe_health(self) -> "httpx.Response":
+        """
+        取得済みの /health プローブ結果を返す
+
+        接続エラー時は、呼び出すたびに同じ例外を送出します。
+        """
+        response, error = self._health_probe
+        if error is not None:
+            raise error
+        return response
+
+    async def validate_all(self) -> bool:
+        """
+        全検証を実行
+
+        ネットワーク待ちは最初の /health プローブのみで、以降の表示は
+        await を挟まずに行うため、他プラットフォームと並行実行しても
+        出力が混ざりません。
+        """
+        endpoint, _, api_key = self.api_gateway_config
+        if endpoint and api_key:
+            await self._fetch_health()
 
-    def validate_all(self) -> bool:
-        """全検証を実行"""
         print(f"\n{'='*80}")
         print(f"デプロイメント検証開始: {self.platform.upper()}")
         print(f"{'='*80}\n")
@@ -90,58 +190,32 @@ class DeploymentValidator:
         """環境変数の確認"""
         print(f"[1/5] 環境変数確認")
 
-        required_vars = self._get_required_env_vars()
+        required_vars = self.required_env_vars
 
-        for var_name in required_vars:
-            value = os.getenv(var_name)
-            if value:
-                self.results.append(
-                    ValidationResult(
-                        f"環境変数 {var_name}",
-                        ValidationStatus.PASS,
-                        "設定済み"
-                    )
-                )
-            else:
-                self.results.append(
-                    ValidationResult(
-                        f"環境変数 {var_name}",
-                        ValidationStatus.FAIL,
-                        "未設定"
-                    )
-                )
+        # 設定済み（空文字でない）変数を集合演算でまとめて判定
+        present = {
+            var_name for var_name in os.environ.keys() & set(required_vars)
+            if os.environ[var_name]
+        }
+        self.results.extend(
+            ValidationResult(_ENV_NAME_TMPL % var_name, *(
+                _ENV_PRESENT if var_name in present else _ENV_MISSING
+            ))
+            for var_name in required_vars
+        )
 
         print()
 
-    def _get_required_env_vars(self) -> List[str]:
-        """プラットフォームごとの必須環境変数"""
-        if self.platform == "azure":
-            return [
-                "AZURE_APIM_ENDPOINT",
-                "AZURE_APIM_SUBSCRIPTION_KEY",
-                "APPLICATIONINSIGHTS_CONNECTION_STRING",
-                "KEY_VAULT_NAME"
-            ]
-        elif self.platform == "aws":
-            return [
-                "AWS_API_GATEWAY_ENDPOINT",
-                "AWS_API_KEY",
-                "AWS_REGION"
-            ]
-        elif self.platform == "gcp":
-            return [
-                "GCP_APIGEE_ENDPOINT",
-                "GCP_API_KEY",
-                "GCP_PROJECT"
-            ]
-        else:
-            return []
+    @cached_property
+    def required_env_vars(self) -> List[str]:
+        """プラットフォームごとの必須環境変数（検証中は不変のため1回だけ解決）"""
+        return self.REQUIRED_ENV_VARS.get(self.platform, [])
 
     def _validate_api_gateway(self):
         """API Gateway接続確認"""
         print(f"[2/5] API Gateway接続確認")
 
-        endpoint, api_key_header, api_key = self._get_api_gateway_config()
+        endpoint, api_key_header, api_key = self.api_gateway_config
 
         if not endpoint or not api_key:
             self.results.append(
@@ -154,12 +228,10 @@ class DeploymentValidator:
             print()
             return
 
+        import httpx
+
         try:
-            response = requests.get(
-                f"{endpoint}/health",
-                headers={api_key_header: api_key},
-                timeout=10
-            )
+            response = self._probe_health()
 
             if response.status_code == 200:
                 self.results.append(
@@ -178,7 +250,7 @@ class DeploymentValidator:
                     )
                 )
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             self.results.append(
                 ValidationResult(
                     "API Gateway接続",
@@ -189,34 +261,19 @@ class DeploymentValidator:
 
         print()
 
-    def _get_api_gateway_config(self) -> Tuple[str, str, str]:
-        """API Gateway設定を取得"""
-        if self.platform == "azure":
-            return (
-                os.getenv("AZURE_APIM_ENDPOINT"),
-                "Ocp-Apim-Subscription-Key",
-                os.getenv("AZURE_APIM_SUBSCRIPTION_KEY")
-            )
-        elif self.platform == "aws":
-            return (
-                os.getenv("AWS_API_GATEWAY_ENDPOINT"),
-                "X-Api-Key",
-                os.getenv("AWS_API_KEY")
-            )
-        elif self.platform == "gcp":
-            return (
-                os.getenv("GCP_APIGEE_ENDPOINT"),
-                "X-Api-Key",
-                os.getenv("GCP_API_KEY")
-            )
-        else:
+    @cached_property
+    def api_gateway_config(self) -> Tuple[str, str, str]:
+        """API Gateway設定（エンドポイント, APIキーヘッダー名, APIキー）を1回だけ取得"""
+        if self.platform not in self.API_GATEWAY_ENV:
             return (None, None, None)
+        endpoint_var, api_key_header, api_key_var = self.API_GATEWAY_ENV[self.platform]
+        return (os.getenv(endpoint_var), api_key_header, os.getenv(api_key_var))
 
     def _validate_backend_health(self):
         """バックエンドヘルスチェック"""
         print(f"[3/5] バックエンドヘルスチェック")
 
-        endpoint, api_key_header, api_key = self._get_api_gateway_config()
+        endpoint, api_key_header, api_key = self.api_gateway_config
 
         if not endpoint or not api_key:
             self.results.append(
@@ -230,11 +287,7 @@ class DeploymentValidator:
             return
 
         try:
-            response = requests.get(
-                f"{endpoint}/health",
-                headers={api_key_header: api_key},
-                timeout=10
-            )
+            response = self._probe_health()
 
             if response.status_code == 200:
                 data = response.json()
@@ -278,7 +331,7 @@ class DeploymentValidator:
         """相関ID伝播確認"""
         print(f"[4/5] 相関ID伝播確認")
 
-        endpoint, api_key_header, api_key = self._get_api_gateway_config()
+        endpoint, api_key_header, api_key = self.api_gateway_config
 
         if not endpoint or not api_key:
             self.results.append(
@@ -291,17 +344,10 @@ class DeploymentValidator:
             print()
             return
 
-        test_correlation_id = f"validation_{int(time.time())}"
+        test_correlation_id = self._test_correlation_id
 
         try:
-            response = requests.get(
-                f"{endpoint}/health",
-                headers={
-                    "X-Correlation-ID": test_correlation_id,
-                    api_key_header: api_key
-                },
-                timeout=10
-            )
+            response = self._probe_health()
 
             if response.status_code == 200:
                 returned_id = (
@@ -412,36 +458,39 @@ class DeploymentValidator:
         print()
 
     def _print_summary(self) -> bool:
-        """結果サマリーを表示"""
-        print(f"\n{'='*80}")
-        print(f"検証結果サマリー")
-        print(f"{'='*80}\n")
-
-        pass_count = sum(1 for r in self.results if r.status == ValidationStatus.PASS)
-        fail_count = sum(1 for r in self.results if r.status == ValidationStatus.FAIL)
-        warn_count = sum(1 for r in self.results if r.status == ValidationStatus.WARN)
-        skip_count = sum(1 for r in self.results if r.status == ValidationStatus.SKIP)
-
-        for result in self.results:
-            print(result)
-
-        print(f"\n{'='*80}")
-        print(f"合計: {len(self.results)} 項目")
-        print(f"  成功: {pass_count}")
-        print(f"  失敗: {fail_count}")
-        print(f"  警告: {warn_count}")
-        print(f"  スキップ: {skip_count}")
-        print(f"{'='*80}\n")
+        """結果サマリーを表示（まとめて1回で書き出す）"""
+        counts = Counter(r.status for r in self.results)
+        pass_count = counts[ValidationStatus.PASS]
+        fail_count = counts[ValidationStatus.FAIL]
+        warn_count = counts[ValidationStatus.WARN]
+        skip_count = counts[ValidationStatus.SKIP]
+
+        out: List[str] = [
+            f"\n{'='*80}",
+            f"検証結果サマリー",
+            f"{'='*80}\n",
+        ]
+        out.extend(str(result) for result in self.results)
+        out.extend([
+            f"\n{'='*80}",
+            f"合計: {len(self.results)} 項目",
+            f"  成功: {pass_count}",
+            f"  失敗: {fail_count}",
+            f"  警告: {warn_count}",
+            f"  スキップ: {skip_count}",
+            f"{'='*80}\n",
+        ])
 
         if fail_count > 0:
-            print("❌ デプロイメント検証失敗")
-            return False
+            out.append("❌ デプロイメント検証失敗")
         elif warn_count > 0:
-            print("⚠️  デプロイメント検証完了（警告あり）")
-            return True
+            out.append("⚠️  デプロイメント検証完了（警告あり）")
         else:
-            print("✅ デプロイメント検証成功")
-            return True
+            out.append("✅ デプロイメント検証成功")
+
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+        return fail_count == 0
 
 
 def main():
@@ -468,15 +517,28 @@ def main():
 
     platforms = ["azure", "aws", "gcp"] if args.all else [args.platform]
 
-    all_passed = True
+    validators = [DeploymentValidator(platform) for platform in platforms]
+
+    # 各プラットフォームの検証は独立しているため並行実行する
+    async def run_all() -> List[bool]:
+        async def run(validator: DeploymentValidator) -> bool:
+            passed = await validator.validate_all()
+            if len(platforms) > 1:
+                print("\n")
+            return passed
+
+        # エンドポイント未設定でHTTP検証を行わない場合は httpx を読み込まない
+        if not any(v.api_gateway_config[0] and v.api_gateway_config[2] for v in validators):
+            return await asyncio.gather(*(run(v) for v in validators))
+
+        import httpx
 
-    for platform in platforms:
-        validator = DeploymentValidator(platform)
-        passed = validator.validate_all()
-        all_passed = all_passed and passed
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            for validator in validators:
+                validator.client = client
+            return await asyncio.gather(*(run(v) for v in validators))
 
-        if len(platforms) > 1:
-            print("\n")
+    all_passed = all(asyncio.run(run_all()))
 
     sys.exit(0 if all_passed else 1)
 
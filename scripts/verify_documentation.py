@@ -18,25 +18,93 @@ verify_documentation.py - ドキュメント整合性検証スクリプト
 python scripts/verify_documentation.py
 
 【出力】
-- ドキュメント整合性レポート
-- 不整合箇所のリスト
-- リンク切れの一覧
+- ドキュメント整合性レポート（標準出力、末尾に件数サマリー）
+- 不整合箇所・リンク切れ（検出時に標準エラーへ逐次出力）
 
 ================================================================================
 """
+import os
 import re
 import sys
-from typing import List, Dict, Set
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict
 from pathlib import Path
 
 
+# リンクチェックで降りないディレクトリ（名前の完全一致。.github 等は対象に含める）
+_EXCLUDE_DIRS = frozenset({".venv", "node_modules", ".git"})
+
+# Markdownファイル読み込みの並列数（I/O待ちが主のためスレッドで並行化）
+_READ_MAX_WORKERS = 16
+
+# 検索対象ファイルはバイト列のまま扱う（存在確認だけのために全文をデコードしない）
+# FastAPIのルートデコレータ（固定の接頭辞なので正規表現を使わず分割で抽出）
+_ROUTE_PREFIXES = (b"@app.get(", b"@app.post(")
+_QUOTES = (b'"', b"'")
+
+# Markdownリンク [text](path)
+# 所有格量指定子（++）でバックトラックを禁止し、リンクテキストに '[' を含めないことで
+# '[' が連続する等の病的な入力でも各位置からの走査が次の '[' までで打ち切られ線形時間になる
+# （抽出されるリンク先は従来のパターンと同じ）
+_LINK_RE = re.compile(rb'\[([^\[\]]++)\]\(([^)]++)\)')
+
+
+def _extract_routes(content: bytes) -> List[str]:
+    """
+    @app.get/post デコレータの第1引数（パス文字列リテラル）を抽出
+
+    接頭辞で分割し、引用符から次の引用符（' / " のいずれか）までを切り出します。
+    """
+    routes = []
+    for prefix in _ROUTE_PREFIXES:
+        for part in content.split(prefix)[1:]:
+            if part[:1] not in _QUOTES:
+                continue
+            ends = [i for i in (part.find(b'"', 1), part.find(b"'", 1)) if i != -1]
+            if ends and min(ends) > 1:
+                routes.append(part[1:min(ends)].decode("utf-8"))
+    return routes
+
+
+def _iter_markdown(directory: Path) -> Iterator[Path]:
+    """
+    directory 配下の Markdown ファイルを再帰的に列挙
+
+    除外対象（.venv, node_modules, .git 等）のディレクトリは降りる前に
+    枝刈りするため、その配下のエントリには一切 stat を発行しません。
+    列挙順は Path.glob("**/*.md") と同じ（各ディレクトリのファイル →
+    サブディレクトリの順の深さ優先）です。
+    """
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _EXCLUDE_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".md"):
+                yield Path(entry.path)
+    for subdir in subdirs:
+        yield from _iter_markdown(Path(subdir))
+
+
 class DocumentationVerifier:
     """ドキュメント整合性検証クラス"""
 
     def __init__(self):
         self.root_dir = Path(__file__).parent.parent
-        self.issues: List[str] = []
-        self.warnings: List[str] = []
+        # 問題・警告は検出時に標準出力へ出力し、件数のみ保持する
+        self.counts: Counter = Counter()
+
+    def _issue(self, message: str):
+        """問題を即時出力して件数を加算"""
+        self.counts["issue"] += 1
+        sys.stdout.write(f"  {message}\n")
+
+    def _warn(self, message: str):
+        """警告を即時出力して件数を加算"""
+        self.counts["warning"] += 1
+        sys.stdout.write(f"  {message}\n")
 
     def verify_all(self) -> bool:
         """全検証を実行"""
@@ -80,7 +148,7 @@ class DocumentationVerifier:
             if full_path.exists():
                 print(f"  ✓ {doc_path}")
             else:
-                self.issues.append(f"❌ 必須ドキュメント不在: {doc_path}")
+                self._issue(f"❌ 必須ドキュメント不在: {doc_path}")
                 print(f"  ❌ {doc_path}")
 
         print()
@@ -91,11 +159,11 @@ class DocumentationVerifier:
 
         readme_path = self.root_dir / "README.md"
         if not readme_path.exists():
-            self.issues.append("❌ README.mdが見つかりません")
+            self._issue("❌ README.mdが見つかりません")
             print(f"  ❌ ファイル不在\n")
             return
 
-        content = readme_path.read_text(encoding="utf-8")
+        content = readme_path.read_bytes()
 
         # アーキテクチャ関連キーワードのチェック
         required_keywords = [
@@ -107,22 +175,23 @@ class DocumentationVerifier:
             "X-Ray",
             "Cloud Logging"
         ]
+        # プラットフォーム情報のチェック対象
+        platforms = ["Azure", "AWS", "GCP"]
 
         for keyword in required_keywords:
-            if keyword in content:
+            if keyword.encode("utf-8") in content:
                 print(f"  ✓ キーワード存在: {keyword}")
             else:
-                self.warnings.append(
+                self._warn(
                     f"⚠️  README.mdに'{keyword}'の記載がありません"
                 )
 
         # プラットフォーム情報のチェック
-        platforms = ["Azure", "AWS", "GCP"]
         for platform in platforms:
-            if platform in content:
+            if platform.encode("utf-8") in content:
                 print(f"  ✓ プラットフォーム記載: {platform}")
             else:
-                self.warnings.append(
+                self._warn(
                     f"⚠️  README.mdに'{platform}'の記載がありません"
                 )
 
@@ -134,17 +203,17 @@ class DocumentationVerifier:
 
         spec_path = self.root_dir / "SYSTEM_SPECIFICATION.md"
         if not spec_path.exists():
-            self.issues.append("❌ SYSTEM_SPECIFICATION.mdが見つかりません")
+            self._issue("❌ SYSTEM_SPECIFICATION.mdが見つかりません")
             print(f"  ❌ ファイル不在\n")
             return
 
-        content = spec_path.read_text(encoding="utf-8")
+        content = spec_path.read_bytes()
 
         # アーキテクチャ図の記載チェック
-        if "```mermaid" in content or "```" in content:
+        if b"```mermaid" in content or b"```" in content:
             print(f"  ✓ アーキテクチャ図記載あり")
         else:
-            self.warnings.append(
+            self._warn(
                 "⚠️  SYSTEM_SPECIFICATION.mdにアーキテクチャ図がありません"
             )
 
@@ -158,10 +227,10 @@ class DocumentationVerifier:
         ]
 
         for endpoint in endpoints:
-            if endpoint in content:
+            if endpoint.encode("utf-8") in content:
                 print(f"  ✓ エンドポイント記載: {endpoint}")
             else:
-                self.warnings.append(
+                self._warn(
                     f"⚠️  SYSTEM_SPECIFICATION.mdに'{endpoint}'の記載がありません"
                 )
 
@@ -175,17 +244,19 @@ class DocumentationVerifier:
         # FastAPI共通エントリーポイント
         fastapi_main = self.root_dir / "platforms" / "local" / "main.py"
         if fastapi_main.exists():
-            content = fastapi_main.read_text(encoding="utf-8")
+            content = fastapi_main.read_bytes()
             # @app.get/post デコレータからエンドポイントを抽出
-            implemented_endpoints = re.findall(r'@app\.(?:get|post)\(["\']([^"\']+)["\']', content)
+            # 改行区切りで1つの文字列にまとめ、各エンドポイントは1回の部分一致検索で確認
+            # （ルートは改行を含まないため、いずれかのルートの部分文字列か否かと同値）
+            implemented_blob = "\n".join(_extract_routes(content))
 
             for endpoint in documented_endpoints:
                 # /api プレフィックスを除去して比較
                 endpoint_path = endpoint.replace("/api", "")
-                if any(endpoint_path in impl for impl in implemented_endpoints):
+                if endpoint_path in implemented_blob:
                     print(f"  ✓ Azure実装確認: {endpoint}")
                 else:
-                    self.warnings.append(
+                    self._warn(
                         f"⚠️  Azureに'{endpoint}'の実装が見つかりません"
                     )
 
@@ -199,12 +270,12 @@ class DocumentationVerifier:
             readme_path = self.root_dir / "platforms" / platform / "README.md"
 
             if not readme_path.exists():
-                self.warnings.append(
+                self._warn(
                     f"⚠️  {platform.upper()} README.mdが見つかりません"
                 )
                 continue
 
-            content = readme_path.read_text(encoding="utf-8")
+            content = readme_path.read_bytes()
 
             # 必須セクションのチェック
             required_sections = [
@@ -215,22 +286,22 @@ class DocumentationVerifier:
             ]
 
             for section in required_sections:
-                if section in content:
+                if section.encode("utf-8") in content:
                     print(f"  ✓ {platform.upper()}: {section}セクション存在")
                 else:
-                    self.warnings.append(
+                    self._warn(
                         f"⚠️  {platform.upper()} README.mdに'{section}'セクションがありません"
                     )
 
             # API Gateway/APIM/Apigee設定の記載チェック
-            if platform == "azure" and "APIM" in content:
+            if platform == "azure" and b"APIM" in content:
                 print(f"  ✓ {platform.upper()}: APIM設定記載あり")
-            elif platform == "aws" and "API Gateway" in content:
+            elif platform == "aws" and b"API Gateway" in content:
                 print(f"  ✓ {platform.upper()}: API Gateway設定記載あり")
-            elif platform == "gcp" and "Apigee" in content:
+            elif platform == "gcp" and b"Apigee" in content:
                 print(f"  ✓ {platform.upper()}: Apigee設定記載あり")
             else:
-                self.warnings.append(
+                self._warn(
                     f"⚠️  {platform.upper()} README.mdにAPI Gateway層の記載がありません"
                 )
 
@@ -240,31 +311,36 @@ class DocumentationVerifier:
         """ドキュメント間リンクチェック"""
         print(f"[5/5] ドキュメント間リンクチェック")
 
-        # 全markdownファイルを取得
-        markdown_files = list(self.root_dir.glob("**/*.md"))
+        # 全markdownファイルを取得（.venv, node_modules等は走査前に除外）
+        markdown_files = list(_iter_markdown(self.root_dir))
 
         broken_links_count = 0
+        # リンク先の存在確認結果（同じリンク先への resolve/stat を1回に抑える）
+        exists_cache: Dict[str, bool] = {}
 
-        for md_file in markdown_files:
-            # .venv, node_modules等を除外
-            if any(exclude in str(md_file) for exclude in [".venv", "node_modules", ".git"]):
-                continue
-
-            content = md_file.read_text(encoding="utf-8")
+        # ファイル読み込みを並行実行し、リンク抽出は読み込み順（元の順序）に行う
+        with ThreadPoolExecutor(max_workers=_READ_MAX_WORKERS) as executor:
+            contents = list(executor.map(Path.read_bytes, markdown_files))
 
+        for md_file, content in zip(markdown_files, contents):
             # Markdownリンク [text](path) を抽出
-            links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', content)
+            links = _LINK_RE.findall(content)
 
             for link_text, link_path in links:
                 # 外部URLはスキップ
-                if link_path.startswith(("http://", "https://", "#")):
+                if link_path.startswith((b"http://", b"https://", b"#")):
                     continue
+                link_path = link_path.decode("utf-8")
 
-                # 相対パスを解決
-                target_path = (md_file.parent / link_path).resolve()
+                # 相対パスを解決（解決結果と存在有無はリンク先ごとにキャッシュ）
+                target_key = os.path.join(md_file.parent, link_path)
+                exists = exists_cache.get(target_key)
+                if exists is None:
+                    exists = Path(target_key).resolve().exists()
+                    exists_cache[target_key] = exists
 
-                if not target_path.exists():
-                    self.warnings.append(
+                if not exists:
+                    self._warn(
                         f"⚠️  リンク切れ: {md_file.name} -> {link_path}"
                     )
                     broken_links_count += 1
@@ -282,29 +358,20 @@ class DocumentationVerifier:
         print(f"検証結果サマリー")
         print(f"{'='*80}\n")
 
-        if self.issues:
-            print("【問題】")
-            for issue in self.issues:
-                print(f"  {issue}")
-            print()
-
-        if self.warnings:
-            print("【警告】")
-            for warning in self.warnings:
-                print(f"  {warning}")
-            print()
+        issue_count = self.counts["issue"]
+        warning_count = self.counts["warning"]
 
-        if not self.issues and not self.warnings:
+        if not issue_count and not warning_count:
             print("  ✅ 全てのチェックが成功しました\n")
 
         print(f"{'='*80}")
-        print(f"合計: 問題 {len(self.issues)} 件, 警告 {len(self.warnings)} 件")
+        print(f"合計: 問題 {issue_count} 件, 警告 {warning_count} 件")
         print(f"{'='*80}\n")
 
-        if self.issues:
+        if issue_count:
             print("❌ ドキュメント整合性検証失敗")
             return False
-        elif self.warnings:
+        elif warning_count:
             print("⚠️  ドキュメント整合性検証完了（警告あり）")
             return True
         else:
@@ -36,6 +36,7 @@ Azure Container Apps/AWS App Runner等のコンテナ環境では、タイムア
 【環境変数】
 - JOB_STORAGE_TYPE: ジョブストレージタイプ（azure_table, memory等）
 - AZURE_STORAGE_CONNECTION_STRING: Azure Table Storage接続文字列
+- JOB_BATCH_SIZE: バックグラウンド処理で1回に評価する項目数（デフォルト: 5）
 
 【使用例】
 ```python
@@ -73,10 +74,30 @@ from core.async_job_manager import (
     JobStatus,
 )
 from core.handlers import handle_evaluate
+from infrastructure.config import ConfigError, get_env_int
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# 定数定義（環境変数で上書き可能）
+# =============================================================================
+
+# バックグラウンド処理で handle_evaluate に一括で渡す項目数のデフォルト
+# LLM/オーケストレーターの初期化をバッチ内で共有し、handle_evaluate 内の
+# セマフォ制御下で項目を並列評価する。キャンセル確認と進捗更新はバッチ単位のため、
+# 応答性を損なわないよう同時評価数（MAX_CONCURRENT_EVALUATIONS=10）より小さくする
+DEFAULT_JOB_BATCH_SIZE = 5
+
+try:
+    JOB_BATCH_SIZE = get_env_int(
+        "JOB_BATCH_SIZE", default=DEFAULT_JOB_BATCH_SIZE, min_val=1, max_val=50
+    )
+except ConfigError as e:
+    logger.warning(f"[AsyncHandlers] {e}（デフォルト {DEFAULT_JOB_BATCH_SIZE} を使用）")
+    JOB_BATCH_SIZE = DEFAULT_JOB_BATCH_SIZE
+
+
 # =============================================================================
 # グローバル変数（シングルトン）
 # =============================================================================
@@ -362,14 +383,25 @@ def _restore_evidence_from_blob(
     return items
 
 
-async def process_single_job(job: EvaluationJob, storage: JobStorageBase) -> None:
+def _mark_running(job: EvaluationJob) -> None:
+    """ジョブを「実行中」状態にする（保存は呼び出し側で行う）"""
+    job.status = JobStatus.RUNNING
+    job.started_at = datetime.utcnow()
+    job.message = "Processing started"
+
+
+async def process_single_job(
+    job: EvaluationJob,
+    storage: JobStorageBase,
+    claimed: bool = False
+) -> None:
     """
     単一のジョブを処理
 
     【処理フロー】
     1. ジョブステータスを「実行中」に更新
     2. 証跡ファイルをBlob Storageから復元（64KB制限対策）
-    3. 各項目を順次評価（キャンセルチェック付き）
+    3. JOB_BATCH_SIZE件ずつ順次評価（キャンセルチェック付き）
     4. 進捗をリアルタイムで更新
     5. 完了/失敗ステータスを更新
 
@@ -378,12 +410,14 @@ async def process_single_job(job: EvaluationJob, storage: JobStorageBase) -> Non
     - ジョブ全体のエラー: ジョブステータスをFAILEDに更新
 
     【キャンセル対応】
-    各項目処理前にキャンセル状態をチェックし、
+    各バッチ処理前にキャンセル状態をチェックし、
     キャンセルされていた場合は処理を中断
 
     Args:
         job: 処理するEvaluationJobオブジェクト
         storage: ジョブストレージ（進捗更新用）
+        claimed: 呼び出し側で「実行中」を保存済みの場合True
+            （process_pending_jobs が条件付き更新でジョブを確保した場合）
 
     Note:
         この関数はバックグラウンドワーカーから呼び出されます。
@@ -395,11 +429,10 @@ async def process_single_job(job: EvaluationJob, storage: JobStorageBase) -> Non
     logger.info(f"[AsyncHandlers] テナント: {job.tenant_id}, 項目数: {len(job.items)}")
     logger.info("=" * 60)
 
-    # ステータスを「実行中」に更新
-    job.status = JobStatus.RUNNING
-    job.started_at = datetime.utcnow()
-    job.message = "Processing started"
-    await storage.update_job(job)
+    # ステータスを「実行中」に更新（確保済みの場合は書き込みを省略）
+    if not claimed:
+        _mark_running(job)
+        await storage.update_job(job)
     logger.debug(f"[AsyncHandlers] ステータス更新: RUNNING")
 
     # Blobから証跡ファイルを復元（64KB制限対策）
@@ -412,60 +445,67 @@ async def process_single_job(job: EvaluationJob, storage: JobStorageBase) -> Non
         total = len(items_to_process)
         results = []
 
-        for i, item in enumerate(items_to_process):
-            item_start_time = time.time()
-            item_id = item.get('ID', 'unknown')
+        # JOB_BATCH_SIZE件ずつまとめて評価する（デフォルトは5件ずつ）
+        for batch_start in range(0, total, JOB_BATCH_SIZE):
+            batch = items_to_process[batch_start:batch_start + JOB_BATCH_SIZE]
+            batch_end = batch_start + len(batch)
+            batch_start_time = time.time()
+            batch_ids = [item.get('ID', 'unknown') for item in batch]
 
-            # キャンセルチェック（各項目処理前に確認）
+            # キャンセルチェック（各バッチ処理前に確認）
             current_job = await storage.get_job(job.job_id)
             if current_job and current_job.status == JobStatus.CANCELLED:
                 logger.warning(f"[AsyncHandlers] ジョブがキャンセルされました: {job.job_id}")
-                logger.info(f"[AsyncHandlers] 処理済み: {i}/{total}項目")
+                logger.info(f"[AsyncHandlers] 処理済み: {batch_start}/{total}項目")
                 return
 
             # 項目処理開始
             logger.info("-" * 40)
-            logger.info(f"[AsyncHandlers] 項目処理 [{i + 1}/{total}]: ID={item_id}")
+            logger.info(
+                f"[AsyncHandlers] 項目処理 [{batch_start + 1}-{batch_end}/{total}]: "
+                f"ID={', '.join(batch_ids)}"
+            )
 
             try:
                 # 既存のhandle_evaluateを使用して評価を実行
-                result = await handle_evaluate([item])
+                result = await handle_evaluate(batch)
                 results.extend(result)
 
-                item_elapsed = time.time() - item_start_time
-                eval_result = result[0].get("evaluationResult", False) if result else False
-                logger.info(
-                    f"[AsyncHandlers] 項目完了: ID={item_id}, "
-                    f"結果={'有効' if eval_result else '要確認'}, "
-                    f"処理時間={item_elapsed:.1f}秒"
-                )
+                batch_elapsed = time.time() - batch_start_time
+                for r in result:
+                    logger.info(
+                        f"[AsyncHandlers] 項目完了: ID={r.get('ID', 'unknown')}, "
+                        f"結果={'有効' if r.get('evaluationResult', False) else '要確認'}"
+                    )
+                logger.info(f"[AsyncHandlers] 処理時間={batch_elapsed:.1f}秒")
 
             except Exception as item_error:
                 # 項目単位のエラーは結果に含め、処理を継続
-                item_elapsed = time.time() - item_start_time
+                batch_elapsed = time.time() - batch_start_time
                 error_msg = f"{type(item_error).__name__}: {str(item_error)}"
 
                 logger.error(
-                    f"[AsyncHandlers] 項目エラー: ID={item_id}, "
-                    f"エラー={error_msg}, 処理時間={item_elapsed:.1f}秒"
+                    f"[AsyncHandlers] 項目エラー: ID={', '.join(batch_ids)}, "
+                    f"エラー={error_msg}, 処理時間={batch_elapsed:.1f}秒"
                 )
                 logger.debug(f"[AsyncHandlers] トレースバック:\n{traceback.format_exc()}")
 
-                # エラー結果を記録
-                results.append({
-                    "ID": item_id,
-                    "evaluationResult": False,
-                    "judgmentBasis": f"評価エラー: {error_msg}",
-                    "documentReference": "",
-                    "fileName": "",
-                    "evidenceFiles": [],
-                    "_error": True,
-                    "_error_type": type(item_error).__name__
-                })
+                # バッチ内の各項目にエラー結果を記録
+                for item_id in batch_ids:
+                    results.append({
+                        "ID": item_id,
+                        "evaluationResult": False,
+                        "judgmentBasis": f"評価エラー: {error_msg}",
+                        "documentReference": "",
+                        "fileName": "",
+                        "evidenceFiles": [],
+                        "_error": True,
+                        "_error_type": type(item_error).__name__
+                    })
 
             # 進捗更新（ストレージに保存）
-            job.progress = int((i + 1) / total * 100)
-            job.message = f"{i + 1}/{total} items processed"
+            job.progress = int(batch_end / total * 100)
+            job.message = f"{batch_end}/{total} items processed"
             await storage.update_job(job)
 
             logger.debug(f"[AsyncHandlers] 進捗更新: {job.progress}%")
@@ -535,7 +575,17 @@ async def process_pending_jobs(max_jobs: int = 1) -> int:
 
     processed = 0
     for job in pending_jobs:
-        await process_single_job(job, storage)
+        # 処理直前に「待機中」→「実行中」へ条件付きで遷移させてジョブを確保する
+        # （他ワーカーが確保済み・キャンセル済みのジョブはスキップ）
+        claimed = await storage.conditional_update_status(
+            job.job_id, (JobStatus.PENDING,), JobStatus.RUNNING, "Processing started"
+        )
+        if not claimed:
+            logger.info(f"[AsyncHandlers] Job already claimed or no longer pending: {job.job_id}")
+            continue
+
+        _mark_running(job)
+        await process_single_job(job, storage, claimed=True)
         processed += 1
 
     logger.info(f"[AsyncHandlers] Processed {processed} jobs")
@@ -568,7 +618,7 @@ async def process_job_by_id(job_id: str) -> bool:
     if job.status != JobStatus.PENDING:
         logger.warning(
             f"[AsyncHandlers] Job not pending: {job_id}, "
-            f"status: {job.status.value}"
+            f"status: {job.status}"
         )
         return False
 
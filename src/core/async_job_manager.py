@@ -23,13 +23,15 @@ async_job_manager.py - 非同期ジョブ管理モジュール
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional, Tuple
 from datetime import datetime
-import uuid
+import secrets
+import time
 import logging
 
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,8 +39,15 @@ logger = logging.getLogger(__name__)
 # ジョブステータス定義
 # =============================================================================
 
-class JobStatus(Enum):
-    """ジョブの状態を表す列挙型"""
+class JobStatus:
+    """
+    ジョブの状態を表す文字列定数
+
+    値はそのまま JSON/ストレージに書き込める str です。
+    Enum の値変換（JobStatus(value) / .value）を挟まないため、
+    ジョブのシリアライズ・デシリアライズのたびに発生する
+    列挙型のルックアップコストがかかりません。
+    """
     PENDING = "pending"      # 処理待ち
     RUNNING = "running"      # 処理中
     COMPLETED = "completed"  # 完了
@@ -46,17 +55,53 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"  # キャンセル
 
 
+JobStatusValue = Literal["pending", "running", "completed", "failed", "cancelled"]
+
+_JOB_STATUSES = frozenset({
+    JobStatus.PENDING,
+    JobStatus.RUNNING,
+    JobStatus.COMPLETED,
+    JobStatus.FAILED,
+    JobStatus.CANCELLED,
+})
+
+# 以降変化しない終了状態
+TERMINAL_JOB_STATUSES = frozenset({
+    JobStatus.COMPLETED,
+    JobStatus.FAILED,
+    JobStatus.CANCELLED,
+})
+
+
+def validate_job_status(value: str) -> JobStatusValue:
+    """
+    外部から読み込んだステータス文字列を検証
+
+    Args:
+        value: ストレージ等から読み込んだステータス
+
+    Returns:
+        検証済みのステータス（入力と同じ文字列）
+
+    Raises:
+        ValueError: 未定義のステータスの場合
+    """
+    if value not in _JOB_STATUSES:
+        raise ValueError(f"{value!r} is not a valid JobStatus")
+    return value
+
+
 # =============================================================================
 # データクラス定義
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationJob:
     """
     評価ジョブを表すデータクラス
 
     Attributes:
-        job_id: ジョブの一意識別子（UUID）
+        job_id: ジョブの一意識別子（URLセーフなランダム文字列）
         tenant_id: テナント識別子（マルチテナント対応）
         status: ジョブの状態
         items: 評価対象の項目リスト
@@ -71,28 +116,25 @@ class EvaluationJob:
     """
     job_id: str
     tenant_id: str
-    status: JobStatus
+    status: JobStatusValue
     items: List[Dict[str, Any]]
     results: Optional[List[Dict[str, Any]]] = None
     progress: int = 0
     message: str = ""
-    created_at: Optional[datetime] = None
+    # 未指定の新規ジョブのみ現在時刻を設定（明示的な None はそのまま保持し、
+    # 復元時に作成日時を捏造しない・構築ごとの判定を行わない）
+    created_at: Optional[datetime] = field(default_factory=datetime.utcnow)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error_message: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        """初期化後の処理"""
-        if self.created_at is None:
-            self.created_at = datetime.utcnow()
-
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換（シリアライズ用）"""
         return {
             "job_id": self.job_id,
             "tenant_id": self.tenant_id,
-            "status": self.status.value,
+            "status": self.status,
             "items": self.items,
             "results": self.results,
             "progress": self.progress,
@@ -110,7 +152,7 @@ class EvaluationJob:
         return cls(
             job_id=data["job_id"],
             tenant_id=data["tenant_id"],
-            status=JobStatus(data["status"]),
+            status=validate_job_status(data["status"]),
             items=data["items"],
             results=data.get("results"),
             progress=data.get("progress", 0),
@@ -123,7 +165,7 @@ class EvaluationJob:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class JobSubmitResponse:
     """ジョブ送信レスポンス"""
     job_id: str
@@ -140,7 +182,7 @@ class JobSubmitResponse:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class JobStatusResponse:
     """ジョブステータスレスポンス"""
     job_id: str
@@ -161,7 +203,7 @@ class JobStatusResponse:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class JobResultsResponse:
     """ジョブ結果レスポンス"""
     job_id: str
@@ -217,6 +259,22 @@ class JobStorageBase(ABC):
         """
         pass
 
+    async def get_job_status(self, job_id: str) -> Optional[EvaluationJob]:
+        """
+        ジョブのステータス情報のみを取得
+
+        ステータス確認（ポーリング）用の軽量版get_jobです。
+        items/resultsを読み込まずに済むストレージはオーバーライドしてください。
+        デフォルト実装はget_jobに委譲します。
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            EvaluationJob（items/results・日時は空の場合あり、存在しない場合はNone）
+        """
+        return await self.get_job(job_id)
+
     @abstractmethod
     async def update_job(self, job: EvaluationJob) -> None:
         """
@@ -227,6 +285,46 @@ class JobStorageBase(ABC):
         """
         pass
 
+    async def conditional_update_status(
+        self,
+        job_id: str,
+        expected: Tuple[JobStatusValue, ...],
+        new_status: JobStatusValue,
+        message: str
+    ) -> bool:
+        """
+        現在のステータスが expected のいずれかの場合のみステータスを更新
+
+        キャンセル等の状態遷移用です。ネイティブの条件付き更新
+        （ETag / ConditionExpression / トランザクション）を持つストレージは
+        オーバーライドし、読み込みと書き込みの間の競合および
+        遷移済みジョブへの無駄な書き込みを防いでください。
+        デフォルト実装はget_job → update_jobの読み込み・更新です。
+        終了状態への遷移時は completed_at、実行中への遷移時は started_at も設定します。
+
+        Args:
+            job_id: ジョブID
+            expected: 更新を許可する現在のステータス
+            new_status: 更新後のステータス
+            message: 更新後の状態メッセージ
+
+        Returns:
+            更新したらTrue（ジョブが存在しない・ステータスが不一致ならFalse）
+        """
+        job = await self.get_job(job_id)
+        if not job or job.status not in expected:
+            return False
+
+        job.status = new_status
+        job.message = message
+        if new_status in TERMINAL_JOB_STATUSES:
+            job.completed_at = datetime.utcnow()
+        elif new_status == JobStatus.RUNNING:
+            job.started_at = datetime.utcnow()
+
+        await self.update_job(job)
+        return True
+
     @abstractmethod
     async def delete_job(self, job_id: str) -> bool:
         """
@@ -258,7 +356,7 @@ class JobStorageBase(ABC):
         self,
         tenant_id: str,
         limit: int = 100,
-        status: Optional[JobStatus] = None
+        status: Optional[JobStatusValue] = None
     ) -> List[EvaluationJob]:
         """
         テナントのジョブ一覧を取得
@@ -323,6 +421,13 @@ class AsyncJobManager:
     # 1項目あたりの推定処理時間（秒）
     ESTIMATED_TIME_PER_ITEM = 60
 
+    # ステータス応答のキャッシュ（ポーリングによるストレージ読み込みを抑制）
+    # 実行中のジョブは短いTTL、変化しない終了状態のジョブは長めのTTLで保持し、
+    # 上限件数を超えたら最も長く参照されていないものから破棄する（LRU）
+    STATUS_CACHE_TTL_SECONDS = 1.0
+    TERMINAL_STATUS_CACHE_TTL_SECONDS = 30.0
+    STATUS_CACHE_MAX_ENTRIES = 1000
+
     def __init__(self, storage: JobStorageBase, queue: Optional[JobQueueBase] = None):
         """
         Args:
@@ -331,6 +436,8 @@ class AsyncJobManager:
         """
         self.storage = storage
         self.queue = queue
+        # job_id -> (取得時刻[monotonic], ステータス応答)
+        self._status_cache: OrderedDict[str, Tuple[float, JobStatusResponse]] = OrderedDict()
         logger.info("[AsyncJobManager] Initialized")
 
     # ジョブ投入時の制限値
@@ -400,7 +507,7 @@ class AsyncJobManager:
 
         return JobSubmitResponse(
             job_id=job.job_id,
-            status=job.status.value,
+            status=job.status,
             estimated_time=estimated_time
         )
 
@@ -413,10 +520,31 @@ class AsyncJobManager:
 
         Returns:
             JobStatusResponse
+
+        【パフォーマンス】
+        クライアントは数秒おきにポーリングするため、応答をプロセス内に
+        キャッシュします。終了状態（完了・失敗・キャンセル）は以降変化しない
+        ため TERMINAL_STATUS_CACHE_TTL_SECONDS、それ以外は
+        STATUS_CACHE_TTL_SECONDS の間だけ返します。TTL経過後は
+        ストレージを再読込するため、削除・期限切れのジョブは not_found になります。
         """
-        job = await self.storage.get_job(job_id)
+        now = time.monotonic()
+        cached = self._status_cache.get(job_id)
+        if cached is not None:
+            fetched_at, response = cached
+            ttl = (
+                self.TERMINAL_STATUS_CACHE_TTL_SECONDS
+                if response.status in TERMINAL_JOB_STATUSES
+                else self.STATUS_CACHE_TTL_SECONDS
+            )
+            if now - fetched_at < ttl:
+                self._status_cache.move_to_end(job_id)
+                return response
+
+        job = await self.storage.get_job_status(job_id)
 
         if not job:
+            self._status_cache.pop(job_id, None)
             logger.warning(f"[AsyncJobManager] Job not found: {job_id}")
             return JobStatusResponse(
                 job_id=job_id,
@@ -426,14 +554,21 @@ class AsyncJobManager:
                 error_message="The specified job does not exist"
             )
 
-        return JobStatusResponse(
+        response = JobStatusResponse(
             job_id=job.job_id,
-            status=job.status.value,
+            status=job.status,
             progress=job.progress,
             message=job.message,
             error_message=job.error_message
         )
 
+        self._status_cache[job_id] = (now, response)
+        self._status_cache.move_to_end(job_id)
+        if len(self._status_cache) > self.STATUS_CACHE_MAX_ENTRIES:
+            self._status_cache.popitem(last=False)
+
+        return response
+
     async def get_results(self, job_id: str) -> JobResultsResponse:
         """
         ジョブの結果を取得
@@ -443,8 +578,12 @@ class AsyncJobManager:
 
         Returns:
             JobResultsResponse
+
+        【パフォーマンス】
+        先に軽量なステータスのみを取得し、完了済みの場合だけ
+        結果を含むジョブ全体を読み込みます。
         """
-        job = await self.storage.get_job(job_id)
+        job = await self.storage.get_job_status(job_id)
 
         if not job:
             logger.warning(f"[AsyncJobManager] Job not found: {job_id}")
@@ -457,17 +596,27 @@ class AsyncJobManager:
         if job.status != JobStatus.COMPLETED:
             logger.info(
                 f"[AsyncJobManager] Job not completed: {job_id}, "
-                f"status: {job.status.value}"
+                f"status: {job.status}"
             )
             return JobResultsResponse(
                 job_id=job.job_id,
-                status=job.status.value,
+                status=job.status,
+                results=[]
+            )
+
+        job = await self.storage.get_job(job_id)
+
+        if not job:
+            logger.warning(f"[AsyncJobManager] Job not found: {job_id}")
+            return JobResultsResponse(
+                job_id=job_id,
+                status="not_found",
                 results=[]
             )
 
         return JobResultsResponse(
             job_id=job.job_id,
-            status=job.status.value,
+            status=job.status,
             results=job.results or []
         )
 
@@ -480,21 +629,23 @@ class AsyncJobManager:
 
         Returns:
             キャンセル成功したらTrue
-        """
-        job = await self.storage.get_job(job_id)
-
-        if not job:
-            return False
 
+        【パフォーマンス】
+        ストレージの条件付き更新で「待機中・実行中の場合のみ」書き込むため、
+        キャンセルの再送や既に終了したジョブに対する余分な読み込み・書き込みが発生しません。
+        """
         # 実行中または待機中のジョブのみキャンセル可能
-        if job.status not in [JobStatus.PENDING, JobStatus.RUNNING]:
-            return False
+        cancelled = await self.storage.conditional_update_status(
+            job_id,
+            expected=(JobStatus.PENDING, JobStatus.RUNNING),
+            new_status=JobStatus.CANCELLED,
+            message="Job cancelled by user"
+        )
 
-        job.status = JobStatus.CANCELLED
-        job.message = "Job cancelled by user"
-        job.completed_at = datetime.utcnow()
+        if not cancelled:
+            return False
 
-        await self.storage.update_job(job)
+        self._status_cache.pop(job_id, None)
         logger.info(f"[AsyncJobManager] Job cancelled: {job_id}")
 
         return True
@@ -505,8 +656,14 @@ class AsyncJobManager:
 # =============================================================================
 
 def generate_job_id() -> str:
-    """新しいジョブIDを生成"""
-    return str(uuid.uuid4())
+    """
+    新しいジョブIDを生成
+
+    128bitの乱数をURLセーフなBase64（22文字、[A-Za-z0-9_-]）で表現します。
+    UUIDオブジェクトの生成やハイフン区切りの整形を行わず、
+    キーとしても36文字のUUID文字列より短くなります。
+    """
+    return secrets.token_urlsafe(16)
 
 
 def calculate_estimated_time(item_count: int, time_per_item: int = 60) -> int:
@@ -61,6 +61,8 @@ print(result.judgment_basis)     # 判断根拠
 
 ================================================================================
 """
+from __future__ import annotations
+
 import warnings
 import logging
 
@@ -71,24 +73,17 @@ warnings.warn(
     DeprecationWarning,
     stacklevel=2
 )
-from typing import List, Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
 
-from .tasks.base_task import (
-    BaseAuditTask, TaskType, TaskResult, AuditContext
-)
-from .tasks import (
-    SemanticSearchTask,
-    ImageRecognitionTask,
-    DataExtractionTask,
-    StepwiseReasoningTask,
-    SemanticReasoningTask,
-    MultiDocumentTask,
-    PatternAnalysisTask,
-    SoDDetectionTask,
-)
+# LangChain と各タスク実装（core.tasks パッケージ）は、非推奨の本モジュールを
+# インポートしただけでは読み込まず、オーケストレーター生成・実行時に読み込む
+if TYPE_CHECKING:
+    from .tasks.base_task import (
+        BaseAuditTask, TaskType, TaskResult, AuditContext
+    )
 
 # =============================================================================
 # ログ設定
@@ -228,11 +223,64 @@ A8: 競合検出（SoD/職務分掌） - 権限の競合・職務分掌違反の
 """
 
 
+@lru_cache(maxsize=None)
+def _prompt_components() -> Tuple[Any, Any, Any]:
+    """
+    プランナー・最終判断テンプレートとJSONパーサーを返す
+
+    LangChain は初回のオーケストレーター生成時に読み込み、組み立てた
+    テンプレートとパーサー（不変）は以降の全インスタンスで共有します。
+
+    Returns:
+        (プランナー用テンプレート, 最終判断用テンプレート, JSONパーサー)
+    """
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.output_parsers import JsonOutputParser
+
+    return (
+        ChatPromptTemplate.from_template(PLANNER_PROMPT),
+        ChatPromptTemplate.from_template(FINAL_JUDGMENT_PROMPT),
+        JsonOutputParser(),
+    )
+
+
+# =============================================================================
+# 実行計画サマリー用の定数
+# =============================================================================
+
+# タスクタイプ別の名称
+_TASK_TYPE_NAMES = {
+    "A1": "意味検索",
+    "A2": "画像認識",
+    "A3": "構造化データ抽出",
+    "A4": "段階的推論",
+    "A5": "意味推論",
+    "A6": "複数文書統合",
+    "A7": "パターン分析",
+    "A8": "SoD検出",
+}
+
+# デフォルト説明文
+_DEFAULT_DESCRIPTIONS = {
+    "A1": "証跡の記載内容を意味的に検索・確認した",
+    "A2": "証跡の印影・署名・日付を画像から確認した",
+    "A3": "証跡の表データから数値を抽出・突合した",
+    "A4": "計算結果をステップごとに検証した",
+    "A5": "規程要求と実施記録の整合性を推論・判定した",
+    "A6": "複数の証跡を統合して確認した",
+    "A7": "複数期間の実施状況をパターン分析した",
+    "A8": "職務分掌・権限分離を検証した",
+}
+
+# reasoning 先頭のタスクタイプ接頭辞（A1_〜A8_、大文字小文字を区別しない）
+_TASK_PREFIX_RE = re.compile(r"A[1-8]_", re.IGNORECASE)
+
+
 # =============================================================================
 # データクラス定義
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionPlan:
     """
     実行計画データクラス
@@ -251,14 +299,32 @@ class ExecutionPlan:
             - priority: 優先度（必須/推奨/任意）
         dependencies (Dict[str, List[str]]): タスク間の依存関係
         reasoning (str): 計画立案の理由
+        desc_by_task_type (Dict[str, str]): タスクタイプ（大文字）→テスト内容
+        desc_by_step_index (Dict[int, str]): ステップ順序→テスト内容
     """
     analysis: Dict[str, Any]
     steps: List[Dict[str, Any]]
     dependencies: Dict[str, List[str]]
     reasoning: str
-
-
-@dataclass
+    desc_by_task_type: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    desc_by_step_index: Dict[int, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # 実行計画サマリー用のテスト内容を生成時に一度だけ索引化する
+        for idx, step in enumerate(self.steps or []):
+            if isinstance(step, dict):
+                task_type = step.get("task_type", "")
+                test_desc = step.get("test_description", "") or step.get("purpose", "")
+                if task_type:
+                    self.desc_by_task_type[task_type.upper()] = test_desc
+                self.desc_by_step_index[idx] = test_desc
+
+
+@dataclass(slots=True)
 class AuditResult:
     """
     監査結果データクラス
@@ -301,8 +367,22 @@ class AuditResult:
     task_results: List[TaskResult] = field(default_factory=list)
     execution_plan: Optional[ExecutionPlan] = None
     confidence: float = 0.0
-
-    def to_response_dict(self, include_debug: bool = True) -> dict:
+    # 実行計画サマリーのキャッシュ（task_results / execution_plan の代入時に破棄）
+    _summary_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # 代入されるとサマリーのキャッシュを破棄するフィールド
+    _SUMMARY_SOURCES = frozenset({"task_results", "execution_plan"})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in AuditResult._SUMMARY_SOURCES:
+            object.__setattr__(self, "_summary_cache", None)
+
+    def to_response_dict(
+        self, include_debug: bool = True, include_summary: bool = True
+    ) -> dict:
         """
         API応答形式の辞書に変換
 
@@ -310,19 +390,24 @@ class AuditResult:
 
         Args:
             include_debug (bool): デバッグ情報を含めるか
+            include_summary (bool): 実行計画サマリーを生成するか
+                （False の場合 executionPlanSummary は空文字）
 
         Returns:
             dict: API応答形式の辞書
                 - ID: テスト項目ID
                 - evaluationResult: 評価結果
+                - executionPlanSummary: 実行計画サマリー
                 - judgmentBasis: 判断根拠
                 - documentReference: 証跡からの引用文
                 - fileName: 主要ファイル名（後方互換用）
                 - evidenceFiles: 証跡ファイル情報配列（ファイル名とパス）
                 - _debug: デバッグ情報（オプション）
         """
-        # 実行計画サマリーを生成
-        execution_plan_summary = self._format_execution_plan_summary()
+        # 実行計画サマリーを生成（不要な場合は生成しない）
+        execution_plan_summary = (
+            self._format_execution_plan_summary() if include_summary else ""
+        )
 
         # 基本応答を構築
         response = {
@@ -337,31 +422,29 @@ class AuditResult:
 
         # デバッグ情報を追加（開発時のトラブルシューティング用）
         if include_debug:
+            plan = self.execution_plan
             response["_debug"] = {
                 "confidence": self.confidence,
-                "executionPlan": None,
-                "taskResults": []
+                # 実行計画の詳細
+                "executionPlan": {
+                    "analysis": plan.analysis,
+                    "steps": plan.steps,
+                    "reasoning": plan.reasoning
+                } if plan else None,
+                # 各タスクの実行結果
+                "taskResults": [
+                    {
+                        "taskType": tr.task_type.value,
+                        "taskName": tr.task_name,
+                        "success": tr.success,
+                        "confidence": tr.confidence,
+                        "reasoning": tr.reasoning,
+                        "evidenceReferences": tr.evidence_references
+                    }
+                    for tr in self.task_results
+                ]
             }
 
-            # 実行計画の詳細を追加
-            if self.execution_plan:
-                response["_debug"]["executionPlan"] = {
-                    "analysis": self.execution_plan.analysis,
-                    "steps": self.execution_plan.steps,
-                    "reasoning": self.execution_plan.reasoning
-                }
-
-            # 各タスクの実行結果を追加
-            for tr in self.task_results:
-                response["_debug"]["taskResults"].append({
-                    "taskType": tr.task_type.value,
-                    "taskName": tr.task_name,
-                    "success": tr.success,
-                    "confidence": tr.confidence,
-                    "reasoning": tr.reasoning,
-                    "evidenceReferences": tr.evidence_references
-                })
-
         return response
 
     def _format_execution_plan_summary(self) -> str:
@@ -373,85 +456,84 @@ class AuditResult:
 
         Returns:
             str: 実行計画サマリー
+
+        Note:
+            同一インスタンスを複数回シリアライズしても再計算しないよう、
+            生成結果をインスタンスにキャッシュします。
         """
+        if self._summary_cache is not None:
+            return self._summary_cache
+
         if not self.task_results:
             return "（タスク未実行）"
 
-        task_summaries = []
-
-        # 実行計画のstepsからtest_descriptionを取得
-        step_descriptions = {}
-        if self.execution_plan and self.execution_plan.steps:
-            for idx, step in enumerate(self.execution_plan.steps):
-                if isinstance(step, dict):
-                    task_type = step.get("task_type", "")
-                    test_desc = step.get("test_description", "") or step.get("purpose", "")
-                    if task_type:
-                        step_descriptions[task_type.upper()] = test_desc
-                    step_descriptions[f"step_{idx}"] = test_desc
-
-        # タスクタイプ別の名称
-        task_type_names = {
-            "A1": "意味検索",
-            "A2": "画像認識",
-            "A3": "構造化データ抽出",
-            "A4": "段階的推論",
-            "A5": "意味推論",
-            "A6": "複数文書統合",
-            "A7": "パターン分析",
-            "A8": "SoD検出",
-        }
-
-        # デフォルト説明文
-        default_descriptions = {
-            "A1": "証跡の記載内容を意味的に検索・確認した",
-            "A2": "証跡の印影・署名・日付を画像から確認した",
-            "A3": "証跡の表データから数値を抽出・突合した",
-            "A4": "計算結果をステップごとに検証した",
-            "A5": "規程要求と実施記録の整合性を推論・判定した",
-            "A6": "複数の証跡を統合して確認した",
-            "A7": "複数期間の実施状況をパターン分析した",
-            "A8": "職務分掌・権限分離を検証した",
-        }
-
-        for i, tr in enumerate(self.task_results, 1):
-            status = "○" if tr.success else "×"
-            task_type_short = ""
-            task_type_name = ""
-
-            if tr.task_type:
-                task_type_short = tr.task_type.value.split("_")[0].upper()
-                task_type_name = task_type_names.get(task_type_short, task_type_short)
-
-            # 1. 実行計画のtest_descriptionを優先
-            test_desc = step_descriptions.get(task_type_short, "")
+        # 実行計画のstepsから索引化済みのtest_descriptionを取得
+        if self.execution_plan:
+            desc_by_task_type = self.execution_plan.desc_by_task_type
+            desc_by_step_index = self.execution_plan.desc_by_step_index
+        else:
+            desc_by_task_type = desc_by_step_index = {}
 
-            # 2. ステップ順序でのフォールバック
-            if not test_desc:
-                test_desc = step_descriptions.get(f"step_{i-1}", "")
+        self._summary_cache = "\n".join(
+            self._format_task_line(i, tr, desc_by_task_type, desc_by_step_index)
+            for i, tr in enumerate(self.task_results, 1)
+        )
+        return self._summary_cache
+
+    @staticmethod
+    def _format_task_line(
+        i: int,
+        tr: TaskResult,
+        desc_by_task_type: Dict[str, str],
+        desc_by_step_index: Dict[int, str],
+    ) -> str:
+        """
+        実行計画サマリーの1行（1タスク分）を生成
 
-            # 3. reasoningからの抽出
-            if not test_desc and tr.reasoning:
-                reasoning_text = tr.reasoning
-                for prefix in ["A1_", "A2_", "A3_", "A4_", "A5_", "A6_", "A7_", "A8_"]:
-                    if reasoning_text.upper().startswith(prefix):
-                        reasoning_text = reasoning_text[len(prefix):].strip()
-                        break
-                if ":" in reasoning_text[:30]:
-                    reasoning_text = reasoning_text.split(":", 1)[1].strip()
-                if "。" in reasoning_text:
-                    test_desc = reasoning_text.split("。")[0] + "。"
-                else:
-                    test_desc = reasoning_text[:100]
+        Args:
+            i (int): テスト番号（1始まり）
+            tr (TaskResult): タスク実行結果
+            desc_by_task_type (Dict[str, str]): タスクタイプ別のテスト内容
+            desc_by_step_index (Dict[int, str]): ステップ順序別のテスト内容
 
-            # 4. デフォルト説明文（最終フォールバック）
-            if not test_desc or (test_desc.startswith("A") and len(test_desc) < 5):
-                test_desc = default_descriptions.get(task_type_short, "テストを実施した")
+        Returns:
+            str: 「○ テスト1 [A1:意味検索]: 具体的なテスト内容」形式の1行
+        """
+        status = "○" if tr.success else "×"
+        task_type_short = ""
+        task_type_name = ""
+
+        if tr.task_type:
+            # TaskType の値は "A1"〜"A8" の短縮コードそのもの
+            task_type_short = tr.task_type.value
+            task_type_name = _TASK_TYPE_NAMES.get(task_type_short, task_type_short)
+
+        # 1. 実行計画のtest_descriptionを優先
+        test_desc = desc_by_task_type.get(task_type_short, "")
+
+        # 2. ステップ順序でのフォールバック
+        if not test_desc:
+            test_desc = desc_by_step_index.get(i - 1, "")
+
+        # 3. reasoningからの抽出
+        if not test_desc and tr.reasoning:
+            reasoning_text = tr.reasoning
+            prefix_match = _TASK_PREFIX_RE.match(reasoning_text)
+            if prefix_match:
+                reasoning_text = reasoning_text[prefix_match.end():].strip()
+            if ":" in reasoning_text[:30]:
+                reasoning_text = reasoning_text.split(":", 1)[1].strip()
+            if "。" in reasoning_text:
+                test_desc = reasoning_text.split("。")[0] + "。"
+            else:
+                test_desc = reasoning_text[:100]
 
-            # タスクタイプ参照 + 具体的なテスト内容を出力
-            task_summaries.append(f"{status} テスト{i} [{task_type_short}:{task_type_name}]: {test_desc}")
+        # 4. デフォルト説明文（最終フォールバック）
+        if not test_desc or (test_desc.startswith("A") and len(test_desc) < 5):
+            test_desc = _DEFAULT_DESCRIPTIONS.get(task_type_short, "テストを実施した")
 
-        return "\n".join(task_summaries)
+        # タスクタイプ参照 + 具体的なテスト内容を出力
+        return f"{status} テスト{i} [{task_type_short}:{task_type_name}]: {test_desc}"
 
 
 # =============================================================================
@@ -486,6 +568,7 @@ class AuditOrchestrator:
         vision_llm: 画像処理用のVision対応ChatModel
         tasks: タスクハンドラーの辞書（TaskType -> BaseAuditTask）
         planner_prompt: 実行計画立案用のプロンプト
+        final_judgment_prompt: 最終判断用のプロンプト
         parser: JSON出力パーサー
 
     使用例:
@@ -508,6 +591,18 @@ class AuditOrchestrator:
             vision_llm: 画像処理用のVision対応ChatModel
                         Noneの場合はllmを使用
         """
+        from .tasks.base_task import TaskType
+        from .tasks import (
+            SemanticSearchTask,
+            ImageRecognitionTask,
+            DataExtractionTask,
+            StepwiseReasoningTask,
+            SemanticReasoningTask,
+            MultiDocumentTask,
+            PatternAnalysisTask,
+            SoDDetectionTask,
+        )
+
         self.llm = llm
         self.vision_llm = vision_llm or llm
 
@@ -527,9 +622,8 @@ class AuditOrchestrator:
 
         logger.info(f"[オーケストレーター] タスクハンドラー登録完了: {len(self.tasks)}件")
 
-        # プランナーコンポーネントを初期化
-        self.planner_prompt = ChatPromptTemplate.from_template(PLANNER_PROMPT)
-        self.parser = JsonOutputParser()
+        # プランナー・最終判断コンポーネント（構築済みのものを全インスタンスで共有）
+        self.planner_prompt, self.final_judgment_prompt, self.parser = _prompt_components()
 
         logger.info("[オーケストレーター] 初期化完了")
 
@@ -802,6 +896,7 @@ class AuditOrchestrator:
                             exc_info=True)
 
                 # エラー結果を追加
+                from .tasks.base_task import TaskResult
                 results.append(TaskResult(
                     task_type=task_type,
                     task_name=task.task_name,
@@ -828,6 +923,8 @@ class AuditOrchestrator:
                 - 成功時: TaskType列挙値
                 - 失敗時: None
         """
+        from .tasks.base_task import TaskType
+
         task_type_map = {
             "A1": TaskType.A1_SEMANTIC_SEARCH,
             "A2": TaskType.A2_IMAGE_RECOGNITION,
@@ -938,8 +1035,7 @@ class AuditOrchestrator:
 
         try:
             # LLMチェーンを構築して実行
-            prompt = ChatPromptTemplate.from_template(FINAL_JUDGMENT_PROMPT)
-            chain = prompt | self.llm | self.parser
+            chain = self.final_judgment_prompt | self.llm | self.parser
 
             result = await chain.ainvoke({
                 "control_description": context.control_description,
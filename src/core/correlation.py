@@ -9,7 +9,7 @@
 
 from contextvars import ContextVar
 from typing import Dict, Optional
-import uuid
+import os
 import logging
 
 # 相関IDを保持するContextVar（スレッドセーフ）
@@ -18,6 +18,23 @@ correlation_id_var: ContextVar[Optional[str]] = ContextVar('correlation_id', def
 logger = logging.getLogger(__name__)
 
 
+def _generate_uuid4() -> str:
+    """
+    UUID v4形式の相関IDを生成します。
+
+    uuid.uuid4() と同じ形式（RFC 4122 バージョン4）の文字列を、
+    UUIDオブジェクトを経由せずに乱数バイト列から直接組み立てます。
+
+    Returns:
+        "xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx" 形式の文字列
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # バージョン4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 バリアント
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 def get_or_create_correlation_id(headers: Dict[str, str]) -> str:
     """
     HTTPヘッダーから相関IDを取得、存在しない場合は新規生成します。
@@ -40,15 +57,17 @@ def get_or_create_correlation_id(headers: Dict[str, str]) -> str:
         36
     """
     # X-Correlation-IDヘッダーを探す（大文字小文字を区別しない）
-    correlation_id = None
-    for key, value in headers.items():
-        if key.lower() == 'x-correlation-id':
-            correlation_id = value
-            break
+    # 一般的な表記は直接参照し、見つからない場合のみ全ヘッダーを走査
+    correlation_id = headers.get('X-Correlation-ID') or headers.get('x-correlation-id')
+    if not correlation_id:
+        for key, value in headers.items():
+            if key.lower() == 'x-correlation-id':
+                correlation_id = value
+                break
 
     # ヘッダーに相関IDがない場合はUUID生成
     if not correlation_id:
-        correlation_id = str(uuid.uuid4())
+        correlation_id = _generate_uuid4()
         logger.info(
             f"相関IDが見つからないため新規生成しました: {correlation_id}",
             extra={"correlation_id": correlation_id}
@@ -177,3 +196,27 @@ def get_correlation_id_for_logging() -> Dict[str, str]:
     if correlation_id:
         return {"correlation_id": correlation_id}
     return {}
+
+
+class CorrelationIdFilter(logging.Filter):
+    """
+    ログレコードに現在の相関IDを付与するフィルタ。
+
+    ContextVarから相関IDを読み取り record.correlation_id に設定するため、
+    フォーマット文字列で %(correlation_id)s を参照できます。
+    extra で明示的に渡された相関IDは上書きしません。
+
+    Examples:
+        >>> handler = logging.StreamHandler()
+        >>> handler.addFilter(CorrelationIdFilter())
+        >>> handler.setFormatter(logging.Formatter("[%(correlation_id)s] %(message)s"))
+    """
+
+    def __init__(self, default: str = "-"):
+        super().__init__()
+        self.default = default
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "correlation_id", None):
+            record.correlation_id = correlation_id_var.get() or self.default
+        return True
@@ -50,6 +50,8 @@ import time
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from pydantic_core import from_json
+
 # =============================================================================
 # ログ設定
 # =============================================================================
@@ -892,16 +894,16 @@ def parse_request_body(body: bytes) -> Tuple[Optional[List[Dict[str, Any]]], Opt
     - JSONの構文エラー
     - 配列形式でないデータ
     - UTF-8でエンコードされていない
+
+    【パフォーマンス】
+    バイト列をpydantic-core（Rust実装）のJSONパーサーで直接解析します。
+    UTF-8デコード済みの中間文字列を作らないため、大きなリクエストほど高速です。
     """
     logger.debug(f"[パース] リクエストボディを解析中 ({len(body)} bytes)")
 
     try:
-        # UTF-8としてデコード
-        body_str = body.decode('utf-8')
-        logger.debug(f"[パース] デコード成功 ({len(body_str)} chars)")
-
-        # JSONとしてパース
-        data = json.loads(body_str)
+        # JSONとしてパース（UTF-8の検証もパーサー内で行われる）
+        data = from_json(body)
 
         # 配列形式であることを確認
         if not isinstance(data, list):
@@ -919,17 +921,13 @@ def parse_request_body(body: bytes) -> Tuple[Optional[List[Dict[str, Any]]], Opt
 
         return data, None
 
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # JSON構文エラー・不正なUTF-8シーケンスはいずれもValueError
         error_msg = f"JSONパースエラー: {str(e)}"
         logger.error(f"[パース] {error_msg}")
         logger.debug(f"[パース] 問題のボディ先頭100文字: {body[:100]}")
         return None, error_msg
 
-    except UnicodeDecodeError as e:
-        error_msg = f"文字エンコーディングエラー: {str(e)}"
-        logger.error(f"[パース] {error_msg}")
-        return None, error_msg
-
     except Exception as e:
         error_msg = f"リクエスト解析エラー: {type(e).__name__}: {str(e)}"
         logger.error(f"[パース] {error_msg}")
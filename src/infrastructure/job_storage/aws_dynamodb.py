@@ -29,14 +29,17 @@ import os
 import json
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 
 from core.async_job_manager import (
     JobStorageBase,
     EvaluationJob,
     JobStatus,
+    JobStatusValue,
+    TERMINAL_JOB_STATUSES,
     generate_job_id,
+    validate_job_status,
 )
 
 logger = logging.getLogger(__name__)
@@ -197,7 +200,7 @@ class AWSDynamoDBJobStorage(JobStorageBase):
         return {
             "tenant_id": job.tenant_id,
             "job_id": job.job_id,
-            "status": job.status.value,
+            "status": job.status,
             "items": json.dumps(job.items, ensure_ascii=False, cls=DecimalEncoder),
             "results": json.dumps(job.results, ensure_ascii=False, cls=DecimalEncoder) if job.results else "",
             "progress": job.progress,
@@ -217,7 +220,7 @@ class AWSDynamoDBJobStorage(JobStorageBase):
         return EvaluationJob(
             job_id=item["job_id"],
             tenant_id=item["tenant_id"],
-            status=JobStatus(item["status"]),
+            status=validate_job_status(item["status"]),
             items=json.loads(item["items"]) if item.get("items") else [],
             results=json.loads(item["results"]) if item.get("results") else None,
             progress=item.get("progress", 0),
@@ -279,6 +282,31 @@ class AWSDynamoDBJobStorage(JobStorageBase):
             logger.error(f"[AWSDynamoDB] Error getting job {job_id}: {e}")
             return None
 
+    # ステータス確認時に読み込む属性（items/resultsは読み込まない）
+    _STATUS_PROJECTION = "tenant_id, job_id, #s, progress, message, error_message, metadata"
+
+    async def get_job_status(self, job_id: str) -> Optional[EvaluationJob]:
+        """ジョブのステータス情報のみを取得（items/resultsは読み込まない）"""
+        try:
+            response = self._table.query(
+                IndexName="job_id-index",
+                KeyConditionExpression="job_id = :jid",
+                ExpressionAttributeValues={":jid": job_id},
+                ExpressionAttributeNames={"#s": "status"},
+                ProjectionExpression=self._STATUS_PROJECTION
+            )
+
+            items = response.get("Items", [])
+            if items:
+                return self._item_to_job(items[0])
+            else:
+                logger.debug(f"[AWSDynamoDB] Job not found: {job_id}")
+                return None
+
+        except Exception as e:
+            logger.error(f"[AWSDynamoDB] Error getting job status {job_id}: {e}")
+            return None
+
     async def update_job(self, job: EvaluationJob) -> None:
         """ジョブを更新"""
         try:
@@ -287,13 +315,64 @@ class AWSDynamoDBJobStorage(JobStorageBase):
 
             logger.debug(
                 f"[AWSDynamoDB] Job updated: {job.job_id}, "
-                f"status: {job.status.value}, progress: {job.progress}%"
+                f"status: {job.status}, progress: {job.progress}%"
             )
 
         except Exception as e:
             logger.error(f"[AWSDynamoDB] Error updating job {job.job_id}: {e}")
             raise
 
+    async def conditional_update_status(
+        self,
+        job_id: str,
+        expected: Tuple[JobStatusValue, ...],
+        new_status: JobStatusValue,
+        message: str
+    ) -> bool:
+        """ConditionExpressionで現在のステータスを確認しつつ更新（items/resultsは読み書きしない）"""
+        try:
+            # キー（tenant_id, job_id）のみを取得
+            response = self._table.query(
+                IndexName="job_id-index",
+                KeyConditionExpression="job_id = :jid",
+                ExpressionAttributeValues={":jid": job_id},
+                ProjectionExpression="tenant_id, job_id"
+            )
+            items = response.get("Items", [])
+            if not items:
+                return False
+
+            update_expression = "SET #s = :new, message = :msg"
+            values: Dict[str, Any] = {":new": new_status, ":msg": message}
+            if new_status in TERMINAL_JOB_STATUSES:
+                update_expression += ", completed_at = :done"
+                values[":done"] = datetime.utcnow().isoformat()
+            elif new_status == JobStatus.RUNNING:
+                update_expression += ", started_at = :started"
+                values[":started"] = datetime.utcnow().isoformat()
+
+            expected_keys = []
+            for i, status in enumerate(expected):
+                values[f":e{i}"] = status
+                expected_keys.append(f":e{i}")
+
+            self._table.update_item(
+                Key={"tenant_id": items[0]["tenant_id"], "job_id": job_id},
+                UpdateExpression=update_expression,
+                ConditionExpression=f"#s IN ({', '.join(expected_keys)})",
+                ExpressionAttributeNames={"#s": "status"},
+                ExpressionAttributeValues=values
+            )
+            logger.debug(f"[AWSDynamoDB] Job status updated: {job_id}, status: {new_status}")
+            return True
+
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                logger.debug(f"[AWSDynamoDB] Job status not updated (condition failed): {job_id}")
+                return False
+            logger.error(f"[AWSDynamoDB] Error updating job status {job_id}: {e}")
+            raise
+
     async def delete_job(self, job_id: str) -> bool:
         """ジョブを削除"""
         try:
@@ -324,7 +403,7 @@ class AWSDynamoDBJobStorage(JobStorageBase):
                 IndexName="status-created_at-index",
                 KeyConditionExpression="#s = :s",
                 ExpressionAttributeNames={"#s": "status"},
-                ExpressionAttributeValues={":s": JobStatus.PENDING.value},
+                ExpressionAttributeValues={":s": JobStatus.PENDING},
                 Limit=limit,
                 ScanIndexForward=True  # 作成日時昇順（古い順）
             )
@@ -341,7 +420,7 @@ class AWSDynamoDBJobStorage(JobStorageBase):
         self,
         tenant_id: str,
         limit: int = 100,
-        status: Optional[JobStatus] = None
+        status: Optional[JobStatusValue] = None
     ) -> List[EvaluationJob]:
         """テナントのジョブ一覧を取得"""
         try:
@@ -354,7 +433,7 @@ class AWSDynamoDBJobStorage(JobStorageBase):
             expression_names = None
             if status:
                 filter_expression = "#s = :s"
-                expression_values[":s"] = status.value
+                expression_values[":s"] = status
                 expression_names = {"#s": "status"}
 
             query_params = {
@@ -25,16 +25,20 @@ pip install azure-data-tables
 """
 
 import os
-import json
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+import orjson
 
 from core.async_job_manager import (
     JobStorageBase,
     EvaluationJob,
     JobStatus,
+    JobStatusValue,
+    TERMINAL_JOB_STATUSES,
     generate_job_id,
+    validate_job_status,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,7 +46,10 @@ logger = logging.getLogger(__name__)
 # Azure Table Storage SDK
 try:
     from azure.data.tables import TableServiceClient, TableClient
-    from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+    from azure.core import MatchConditions
+    from azure.core.exceptions import (
+        ResourceExistsError, ResourceNotFoundError, ResourceModifiedError
+    )
     AZURE_TABLES_AVAILABLE = True
 except ImportError:
     AZURE_TABLES_AVAILABLE = False
@@ -62,6 +69,14 @@ class AzureTableJobStorage(JobStorageBase):
 
     TABLE_NAME = "EvaluationJobs"
 
+    # ステータス確認時に取得する列（items/resultsの大きなJSON列は除外）
+    # 日時列はステータス応答で使わないため取得せず、ポーリングごとの
+    # ISO 8601 文字列のパースも省略する
+    _STATUS_COLUMNS = [
+        "PartitionKey", "RowKey", "status", "progress", "message",
+        "error_message", "metadata"
+    ]
+
     def __init__(
         self,
         connection_string: str = None,
@@ -132,16 +147,16 @@ class AzureTableJobStorage(JobStorageBase):
         return {
             "PartitionKey": job.tenant_id,
             "RowKey": job.job_id,
-            "status": job.status.value,
-            "items": json.dumps(job.items, ensure_ascii=False),
-            "results": json.dumps(job.results, ensure_ascii=False) if job.results else "",
+            "status": job.status,
+            "items": orjson.dumps(job.items).decode("utf-8"),
+            "results": orjson.dumps(job.results).decode("utf-8") if job.results else "",
             "progress": job.progress,
             "message": job.message,
             "created_at": job.created_at.isoformat() if job.created_at else "",
             "started_at": job.started_at.isoformat() if job.started_at else "",
             "completed_at": job.completed_at.isoformat() if job.completed_at else "",
             "error_message": job.error_message,
-            "metadata": json.dumps(job.metadata, ensure_ascii=False) if job.metadata else "{}"
+            "metadata": orjson.dumps(job.metadata).decode("utf-8") if job.metadata else "{}"
         }
 
     def _entity_to_job(self, entity: Dict[str, Any]) -> EvaluationJob:
@@ -149,16 +164,16 @@ class AzureTableJobStorage(JobStorageBase):
         return EvaluationJob(
             job_id=entity["RowKey"],
             tenant_id=entity["PartitionKey"],
-            status=JobStatus(entity["status"]),
-            items=json.loads(entity["items"]) if entity.get("items") else [],
-            results=json.loads(entity["results"]) if entity.get("results") else None,
+            status=validate_job_status(entity["status"]),
+            items=orjson.loads(entity["items"]) if entity.get("items") else [],
+            results=orjson.loads(entity["results"]) if entity.get("results") else None,
             progress=entity.get("progress", 0),
             message=entity.get("message", ""),
             created_at=datetime.fromisoformat(entity["created_at"]) if entity.get("created_at") else None,
             started_at=datetime.fromisoformat(entity["started_at"]) if entity.get("started_at") else None,
             completed_at=datetime.fromisoformat(entity["completed_at"]) if entity.get("completed_at") else None,
             error_message=entity.get("error_message", ""),
-            metadata=json.loads(entity["metadata"]) if entity.get("metadata") else {}
+            metadata=orjson.loads(entity["metadata"]) if entity.get("metadata") else {}
         )
 
     async def create_job(
@@ -309,6 +324,24 @@ class AzureTableJobStorage(JobStorageBase):
             logger.error(f"[AzureTableStorage] Error getting job {job_id}: {e}")
             return None
 
+    async def get_job_status(self, job_id: str) -> Optional[EvaluationJob]:
+        """ジョブのステータス情報のみを取得（items/resultsは読み込まない）"""
+        try:
+            filter_query = f"RowKey eq '{job_id}'"
+            entities = list(self._table_client.query_entities(
+                filter_query, select=self._STATUS_COLUMNS
+            ))
+
+            if entities:
+                return self._entity_to_job(entities[0])
+            else:
+                logger.debug(f"[AzureTableStorage] Job not found: {job_id}")
+                return None
+
+        except Exception as e:
+            logger.error(f"[AzureTableStorage] Error getting job status {job_id}: {e}")
+            return None
+
     async def update_job(self, job: EvaluationJob) -> None:
         """ジョブを更新"""
         try:
@@ -317,13 +350,70 @@ class AzureTableJobStorage(JobStorageBase):
 
             logger.debug(
                 f"[AzureTableStorage] Job updated: {job.job_id}, "
-                f"status: {job.status.value}, progress: {job.progress}%"
+                f"status: {job.status}, progress: {job.progress}%"
             )
 
         except Exception as e:
             logger.error(f"[AzureTableStorage] Error updating job {job.job_id}: {e}")
             raise
 
+    # ETag不一致（進捗更新などの並行書き込み）時の再試行回数
+    _CONDITIONAL_UPDATE_ATTEMPTS = 3
+
+    async def conditional_update_status(
+        self,
+        job_id: str,
+        expected: Tuple[JobStatusValue, ...],
+        new_status: JobStatusValue,
+        message: str
+    ) -> bool:
+        """ETagで楽観的排他を行いステータス列のみ更新（items/resultsは読み書きしない）"""
+        try:
+            for _ in range(self._CONDITIONAL_UPDATE_ATTEMPTS):
+                entities = list(self._table_client.query_entities(
+                    f"RowKey eq '{job_id}'", select=["PartitionKey", "RowKey", "status"]
+                ))
+                if not entities or entities[0].get("status") not in expected:
+                    return False
+
+                entity = entities[0]
+                patch = {
+                    "PartitionKey": entity["PartitionKey"],
+                    "RowKey": entity["RowKey"],
+                    "status": new_status,
+                    "message": message,
+                }
+                if new_status in TERMINAL_JOB_STATUSES:
+                    patch["completed_at"] = datetime.utcnow().isoformat()
+                elif new_status == JobStatus.RUNNING:
+                    patch["started_at"] = datetime.utcnow().isoformat()
+
+                try:
+                    self._table_client.update_entity(
+                        entity=patch,
+                        mode="merge",
+                        etag=entity.metadata["etag"],
+                        match_condition=MatchConditions.IfNotModified
+                    )
+                except ResourceModifiedError:
+                    # 読み込み後に他の書き込み（実行中ジョブの進捗更新など）があった。
+                    # ステータスが expected のままなら再読み込みして再試行する
+                    logger.debug(f"[AzureTableStorage] Job modified during status update, retrying: {job_id}")
+                    continue
+
+                logger.debug(f"[AzureTableStorage] Job status updated: {job_id}, status: {new_status}")
+                return True
+
+            logger.warning(
+                f"[AzureTableStorage] Job status not updated (modified concurrently): {job_id}"
+            )
+            return False
+
+        except Exception as e:
+            # ETag不一致以外（スロットリング・通信・認証エラー等）は「確保済み」と区別するため再送出する
+            logger.error(f"[AzureTableStorage] Error updating job status {job_id}: {e}")
+            raise
+
     async def delete_job(self, job_id: str) -> bool:
         """ジョブを削除"""
         try:
@@ -372,13 +462,13 @@ class AzureTableJobStorage(JobStorageBase):
         self,
         tenant_id: str,
         limit: int = 100,
-        status: Optional[JobStatus] = None
+        status: Optional[JobStatusValue] = None
     ) -> List[EvaluationJob]:
         """テナントのジョブ一覧を取得"""
         try:
             filter_query = f"PartitionKey eq '{tenant_id}'"
             if status:
-                filter_query += f" and status eq '{status.value}'"
+                filter_query += f" and status eq '{status}'"
 
             entities = list(self._table_client.query_entities(filter_query))
 
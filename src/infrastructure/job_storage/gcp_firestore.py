@@ -32,13 +32,16 @@ pip install google-cloud-firestore
 import os
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from core.async_job_manager import (
     JobStorageBase,
     EvaluationJob,
     JobStatus,
+    JobStatusValue,
+    TERMINAL_JOB_STATUSES,
     generate_job_id,
+    validate_job_status,
 )
 
 logger = logging.getLogger(__name__)
@@ -121,7 +124,7 @@ class GCPFirestoreJobStorage(JobStorageBase):
         return {
             "job_id": job.job_id,
             "tenant_id": job.tenant_id,
-            "status": job.status.value,
+            "status": job.status,
             "items": job.items,
             "results": job.results if job.results else None,
             "progress": job.progress,
@@ -151,7 +154,7 @@ class GCPFirestoreJobStorage(JobStorageBase):
         return EvaluationJob(
             job_id=doc_data.get("job_id"),
             tenant_id=doc_data.get("tenant_id"),
-            status=JobStatus(doc_data.get("status", "pending")),
+            status=validate_job_status(doc_data.get("status", "pending")),
             items=doc_data.get("items", []),
             results=doc_data.get("results"),
             progress=doc_data.get("progress", 0),
@@ -208,6 +211,27 @@ class GCPFirestoreJobStorage(JobStorageBase):
             logger.error(f"[GCPFirestore] Error getting job {job_id}: {e}")
             return None
 
+    # ステータス確認時に読み込むフィールド（items/resultsは読み込まない）
+    _STATUS_FIELDS = [
+        "job_id", "tenant_id", "status", "progress", "message",
+        "error_message", "metadata"
+    ]
+
+    async def get_job_status(self, job_id: str) -> Optional[EvaluationJob]:
+        """ジョブのステータス情報のみを取得（items/resultsは読み込まない）"""
+        try:
+            doc = self._collection.document(job_id).get(field_paths=self._STATUS_FIELDS)
+
+            if doc.exists:
+                return self._doc_to_job(doc.to_dict())
+            else:
+                logger.debug(f"[GCPFirestore] Job not found: {job_id}")
+                return None
+
+        except Exception as e:
+            logger.error(f"[GCPFirestore] Error getting job status {job_id}: {e}")
+            return None
+
     async def update_job(self, job: EvaluationJob) -> None:
         """ジョブを更新"""
         try:
@@ -216,13 +240,42 @@ class GCPFirestoreJobStorage(JobStorageBase):
 
             logger.debug(
                 f"[GCPFirestore] Job updated: {job.job_id}, "
-                f"status: {job.status.value}, progress: {job.progress}%"
+                f"status: {job.status}, progress: {job.progress}%"
             )
 
         except Exception as e:
             logger.error(f"[GCPFirestore] Error updating job {job.job_id}: {e}")
             raise
 
+    async def conditional_update_status(
+        self,
+        job_id: str,
+        expected: Tuple[JobStatusValue, ...],
+        new_status: JobStatusValue,
+        message: str
+    ) -> bool:
+        """トランザクション内で現在のステータスを確認してから更新"""
+        doc_ref = self._collection.document(job_id)
+
+        @firestore.transactional
+        def _update(transaction) -> bool:
+            snapshot = doc_ref.get(field_paths=["status"], transaction=transaction)
+            if not snapshot.exists or snapshot.get("status") not in expected:
+                return False
+
+            fields: Dict[str, Any] = {"status": new_status, "message": message}
+            if new_status in TERMINAL_JOB_STATUSES:
+                fields["completed_at"] = datetime.utcnow()
+            elif new_status == JobStatus.RUNNING:
+                fields["started_at"] = datetime.utcnow()
+            transaction.update(doc_ref, fields)
+            return True
+
+        updated = _update(self._db.transaction())
+        if updated:
+            logger.debug(f"[GCPFirestore] Job status updated: {job_id}, status: {new_status}")
+        return updated
+
     async def delete_job(self, job_id: str) -> bool:
         """ジョブを削除"""
         try:
@@ -266,7 +319,7 @@ class GCPFirestoreJobStorage(JobStorageBase):
         self,
         tenant_id: str,
         limit: int = 100,
-        status: Optional[JobStatus] = None
+        status: Optional[JobStatusValue] = None
     ) -> List[EvaluationJob]:
         """テナントのジョブ一覧を取得"""
         try:
@@ -276,7 +329,7 @@ class GCPFirestoreJobStorage(JobStorageBase):
 
             if status:
                 query = query.where(
-                    filter=FieldFilter("status", "==", status.value)
+                    filter=FieldFilter("status", "==", status)
                 )
 
             query = query.order_by("created_at", direction=firestore.Query.DESCENDING)
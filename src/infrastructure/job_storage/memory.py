@@ -22,7 +22,7 @@ Azure/AWS/GCPの永続化ストレージを使用してください。
 import asyncio
 from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from core.async_job_manager import (
@@ -30,6 +30,8 @@ from core.async_job_manager import (
     JobQueueBase,
     EvaluationJob,
     JobStatus,
+    JobStatusValue,
+    TERMINAL_JOB_STATUSES,
     generate_job_id,
 )
 
@@ -107,9 +109,33 @@ class InMemoryJobStorage(JobStorageBase):
             self._jobs[job.job_id] = job
             logger.debug(
                 f"[InMemoryJobStorage] Job updated: {job.job_id}, "
-                f"status: {job.status.value}, progress: {job.progress}%"
+                f"status: {job.status}, progress: {job.progress}%"
             )
 
+    async def conditional_update_status(
+        self,
+        job_id: str,
+        expected: Tuple[JobStatusValue, ...],
+        new_status: JobStatusValue,
+        message: str
+    ) -> bool:
+        """ロック内で現在のステータスを確認してから更新"""
+        async with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job.status not in expected:
+                return False
+
+            job.status = new_status
+            job.message = message
+            if new_status in TERMINAL_JOB_STATUSES:
+                job.completed_at = datetime.utcnow()
+            elif new_status == JobStatus.RUNNING:
+                job.started_at = datetime.utcnow()
+            logger.debug(
+                f"[InMemoryJobStorage] Job status updated: {job_id}, status: {new_status}"
+            )
+            return True
+
     async def delete_job(self, job_id: str) -> bool:
         """ジョブを削除"""
         async with self._lock:
@@ -143,7 +169,7 @@ class InMemoryJobStorage(JobStorageBase):
         self,
         tenant_id: str,
         limit: int = 100,
-        status: Optional[JobStatus] = None
+        status: Optional[JobStatusValue] = None
     ) -> List[EvaluationJob]:
         """テナントのジョブ一覧を取得"""
         async with self._lock:
@@ -171,7 +197,7 @@ class InMemoryJobStorage(JobStorageBase):
         """統計情報を取得（デバッグ用）"""
         status_counts = {}
         for job in self._jobs.values():
-            status = job.status.value
+            status = job.status
             status_counts[status] = status_counts.get(status, 0) + 1
 
         return {
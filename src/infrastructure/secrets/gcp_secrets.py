@@ -228,7 +228,7 @@ class GCPSecretManagerProvider(SecretProvider):
             for secret in secrets:
                 # フルパスから名前部分を抽出
                 # projects/123/secrets/my-secret → my-secret
-                secret_name = secret.name.split("/")[-1]
+                secret_name = secret.name.rpartition("/")[2]
                 secret_names.append(secret_name)
 
             logger.info(f"Secret Managerから{len(secret_names)}個のシークレットを取得しました")
@@ -311,7 +311,7 @@ class GCPSecretManagerProvider(SecretProvider):
             for version in versions:
                 # フルパスからバージョン番号を抽出
                 # projects/123/secrets/my-secret/versions/1 → 1
-                version_number = version.name.split("/")[-1]
+                version_number = version.name.rpartition("/")[2]
                 version_names.append(version_number)
 
             logger.info(
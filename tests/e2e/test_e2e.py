@@ -184,6 +184,12 @@ class TestParseRequestBody:
         assert error is None
         assert items[0]["ControlDescription"] == "月次売上レポートの承認プロセス"
 
+    def test_parse_invalid_utf8(self):
+        """UTF-8として不正なバイト列"""
+        items, error = parse_request_body(b'[{"ID": "\xff"}]')
+        assert items is None
+        assert error is not None
+
 
 # =============================================================================
 # Evaluate エンドポイント E2E テスト（モック評価フォールバック）
@@ -14,6 +14,7 @@ test_job_storage.py - job_storageモジュールのユニットテスト
 ================================================================================
 """
 
+import re
 import pytest
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
@@ -87,6 +88,44 @@ class TestInMemoryJobStorage:
         assert updated_job.status == JobStatus.RUNNING
         assert updated_job.progress == 50
 
+    @pytest.mark.asyncio
+    async def test_conditional_update_status(self, storage):
+        """条件付きステータス更新"""
+        job = await storage.create_job("test-tenant", [{"ID": "CLC-01"}])
+        expected = (JobStatus.PENDING, JobStatus.RUNNING)
+
+        assert await storage.conditional_update_status(
+            job.job_id, expected, JobStatus.CANCELLED, "cancelled"
+        ) is True
+        cancelled = await storage.get_job(job.job_id)
+        assert cancelled.status == JobStatus.CANCELLED
+        assert cancelled.completed_at is not None
+
+        # 既に終了状態のため2回目は更新しない
+        assert await storage.conditional_update_status(
+            job.job_id, expected, JobStatus.CANCELLED, "cancelled"
+        ) is False
+        assert await storage.conditional_update_status(
+            "non-existent-id", expected, JobStatus.CANCELLED, "cancelled"
+        ) is False
+
+    @pytest.mark.asyncio
+    async def test_conditional_update_status_claims_pending_job(self, storage):
+        """待機中ジョブの確保（実行中への遷移で started_at を設定）"""
+        job = await storage.create_job("test-tenant", [{"ID": "CLC-01"}])
+
+        assert await storage.conditional_update_status(
+            job.job_id, (JobStatus.PENDING,), JobStatus.RUNNING, "Processing started"
+        ) is True
+        claimed = await storage.get_job(job.job_id)
+        assert claimed.status == JobStatus.RUNNING
+        assert claimed.started_at is not None
+
+        # 他のワーカーは同じジョブを確保できない
+        assert await storage.conditional_update_status(
+            job.job_id, (JobStatus.PENDING,), JobStatus.RUNNING, "Processing started"
+        ) is False
+
     @pytest.mark.asyncio
     async def test_delete_job(self, storage):
         """ジョブ削除"""
@@ -444,6 +483,61 @@ class TestEvidenceBlobStorage:
             storage.delete_evidence_files(test_job_id)
 
 
+# =============================================================================
+# AzureTableJobStorage テスト（モック）
+# =============================================================================
+
+
+class TestAzureTableJobStorage:
+    """AzureTableJobStorage.conditional_update_status のテスト"""
+
+    @staticmethod
+    def _storage():
+        """テーブルクライアントをモックに差し替えたストレージ"""
+        from infrastructure.job_storage.azure_table import AZURE_TABLES_AVAILABLE, AzureTableJobStorage
+        if not AZURE_TABLES_AVAILABLE:
+            pytest.skip("azure-data-tables not installed")
+
+        storage = AzureTableJobStorage.__new__(AzureTableJobStorage)
+        storage._table_client = MagicMock()
+
+        class _Entity(dict):
+            metadata = {"etag": "W/1"}
+
+        storage._table_client.query_entities.return_value = [
+            _Entity(PartitionKey="tenant", RowKey="job-1", status=JobStatus.PENDING)
+        ]
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_etag_mismatch_returns_false(self):
+        """ETag不一致が続く場合は再試行の後 False"""
+        from azure.core.exceptions import ResourceModifiedError
+
+        storage = self._storage()
+        storage._table_client.update_entity.side_effect = ResourceModifiedError("etag mismatch")
+
+        result = await storage.conditional_update_status(
+            "job-1", (JobStatus.PENDING,), JobStatus.RUNNING, "Processing started"
+        )
+
+        assert result is False
+        assert storage._table_client.update_entity.call_count == storage._CONDITIONAL_UPDATE_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_raised(self):
+        """ETag不一致以外のエラーは「確保済み」と区別するため送出"""
+        from azure.core.exceptions import HttpResponseError
+
+        storage = self._storage()
+        storage._table_client.update_entity.side_effect = HttpResponseError("throttled")
+
+        with pytest.raises(HttpResponseError):
+            await storage.conditional_update_status(
+                "job-1", (JobStatus.PENDING,), JobStatus.RUNNING, "Processing started"
+            )
+
+
 # =============================================================================
 # AzureQueueJobQueue テスト（モック）
 # =============================================================================
@@ -671,6 +765,8 @@ class TestGenerateJobId:
         job_id = generate_job_id()
         assert isinstance(job_id, str)
         assert len(job_id) > 0
+        # URLセーフな22文字（128bit）
+        assert re.fullmatch(r"[A-Za-z0-9_-]{22}", job_id)
 
 
 # =============================================================================
@@ -696,10 +792,10 @@ class TestEvaluationJob:
 
     def test_job_status_values(self):
         """ジョブステータス値"""
-        assert JobStatus.PENDING.value == "pending"
-        assert JobStatus.RUNNING.value == "running"
-        assert JobStatus.COMPLETED.value == "completed"
-        assert JobStatus.FAILED.value == "failed"
+        assert JobStatus.PENDING == "pending"
+        assert JobStatus.RUNNING == "running"
+        assert JobStatus.COMPLETED == "completed"
+        assert JobStatus.FAILED == "failed"
 
 
 # =============================================================================
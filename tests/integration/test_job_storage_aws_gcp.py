@@ -106,6 +106,30 @@ class TestAWSDynamoDB:
         job = await storage.get_job("nonexistent")
         assert job is None
 
+    @pytest.mark.asyncio
+    async def test_get_job_status_projection(self):
+        """ステータス取得はitems/resultsを射影しない"""
+        storage, mock_table = self._make_storage()
+        mock_table.query.return_value = {
+            "Items": [{
+                "job_id": "job-123",
+                "tenant_id": "default",
+                "status": "completed",
+                "progress": 100,
+                "message": "",
+                "error_message": "",
+                "metadata": "{}"
+            }]
+        }
+        job = await storage.get_job_status("job-123")
+        assert job.status == "completed"
+        assert job.items == []
+        assert job.results is None
+        kwargs = mock_table.query.call_args.kwargs
+        assert "items" not in kwargs["ProjectionExpression"]
+        assert "results" not in kwargs["ProjectionExpression"]
+        assert kwargs["ExpressionAttributeNames"] == {"#s": "status"}
+
     @pytest.mark.asyncio
     async def test_update_job(self):
         """ジョブ更新"""
@@ -118,6 +142,40 @@ class TestAWSDynamoDB:
         await storage.update_job(job)
         mock_table.put_item.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_conditional_update_status(self):
+        """条件付きステータス更新（ConditionExpression付きのupdate_item）"""
+        storage, mock_table = self._make_storage()
+        mock_table.query.return_value = {
+            "Items": [{"job_id": "job-123", "tenant_id": "default"}]
+        }
+        result = await storage.conditional_update_status(
+            "job-123", ("pending", "running"), "cancelled", "Job cancelled by user"
+        )
+        assert result is True
+        mock_table.put_item.assert_not_called()
+        kwargs = mock_table.update_item.call_args.kwargs
+        assert kwargs["Key"] == {"tenant_id": "default", "job_id": "job-123"}
+        assert kwargs["ConditionExpression"] == "#s IN (:e0, :e1)"
+        assert kwargs["ExpressionAttributeValues"][":new"] == "cancelled"
+        assert ":done" in kwargs["ExpressionAttributeValues"]
+
+    @pytest.mark.asyncio
+    async def test_conditional_update_status_condition_failed(self):
+        """ステータス不一致（ConditionalCheckFailed）の場合はFalse"""
+        storage, mock_table = self._make_storage()
+        from infrastructure.job_storage import aws_dynamodb
+        error = aws_dynamodb.ClientError()
+        error.response = {"Error": {"Code": "ConditionalCheckFailedException"}}
+        mock_table.query.return_value = {
+            "Items": [{"job_id": "job-123", "tenant_id": "default"}]
+        }
+        mock_table.update_item.side_effect = error
+        result = await storage.conditional_update_status(
+            "job-123", ("pending", "running"), "cancelled", "Job cancelled by user"
+        )
+        assert result is False
+
     @pytest.mark.asyncio
     async def test_delete_job(self):
         """ジョブ削除"""
@@ -365,6 +423,28 @@ class TestGCPFirestore:
         job = await storage.get_job("nonexistent")
         assert job is None
 
+    @pytest.mark.asyncio
+    async def test_get_job_status_field_paths(self):
+        """ステータス取得はitems/resultsを読み込まない"""
+        storage, mock_collection = self._make_storage()
+        mock_doc = MagicMock()
+        mock_doc.exists = True
+        mock_doc.to_dict.return_value = {
+            "job_id": "job-123",
+            "tenant_id": "default",
+            "status": "completed",
+            "progress": 100,
+        }
+        mock_get = mock_collection.document.return_value.get
+        mock_get.return_value = mock_doc
+
+        job = await storage.get_job_status("job-123")
+        assert job.job_id == "job-123"
+        assert job.status == "completed"
+        field_paths = mock_get.call_args.kwargs["field_paths"]
+        assert "items" not in field_paths
+        assert "results" not in field_paths
+
     @pytest.mark.asyncio
     async def test_update_job(self):
         """ジョブ更新"""
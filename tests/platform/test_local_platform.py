@@ -18,7 +18,7 @@ from unittest.mock import patch, AsyncMock, MagicMock
 
 # パス設定
 _current_dir = os.path.dirname(os.path.abspath(__file__))
-_project_root = os.path.dirname(_current_dir)
+_project_root = os.path.dirname(os.path.dirname(_current_dir))
 _local_platform_path = os.path.join(_project_root, "platforms", "local")
 _src_path = os.path.join(_project_root, "src")
 
@@ -127,6 +127,61 @@ class TestLocalPlatformEndpoints:
         assert "base_url" in data["ollama"]
         assert "model" in data["ollama"]
 
+    @pytest.mark.integration
+    def test_config_memoized_until_env_changes(self, client):
+        """設定状態は環境変数が変わるまで再利用される"""
+        import main
+        main._build_config_status.cache_clear()
+
+        with patch("core.handlers.handle_config", side_effect=lambda: {"llm": {}}) as mock_config:
+            client.get("/config")
+            response = client.get("/config")
+            assert mock_config.call_count == 1
+            assert response.json()["ollama"]["model"] == os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+
+            with patch.dict(os.environ, {"OLLAMA_MODEL": "custom-model"}):
+                response = client.get("/config")
+            assert mock_config.call_count == 2
+            assert response.json()["ollama"]["model"] == "custom-model"
+
+        main._build_config_status.cache_clear()
+
+    def test_correlation_id_propagated_to_handlers(self, client):
+        """相関IDがContextVar経由で下流ハンドラに伝播し、レスポンスで返却される"""
+        from core.correlation import get_correlation_id
+        seen = {}
+
+        def fake_config():
+            seen["correlation_id"] = get_correlation_id()
+            return {"llm": {}}
+
+        import main
+        main._build_config_status.cache_clear()
+        with patch("core.handlers.handle_config", side_effect=fake_config):
+            response = client.get("/config", headers={"X-Correlation-ID": "corr-123"})
+        main._build_config_status.cache_clear()
+
+        assert seen["correlation_id"] == "corr-123"
+        assert response.headers["X-Correlation-ID"] == "corr-123"
+
+    def test_results_streamed_for_large_payload(self, client):
+        """件数の多い結果はストリーミングで返却され、内容は通常のJSONと同一"""
+        import main
+        payload = {
+            "job_id": "job-1",
+            "status": "completed",
+            "results": [{"ID": f"CLC-{i:04d}", "judgmentBasis": "x" * 200} for i in range(1000)],
+        }
+
+        with patch("core.async_handlers.handle_results", new_callable=AsyncMock, return_value=payload):
+            response = client.get("/evaluate/results/job-1")
+
+        assert response.status_code == 200
+        assert "content-length" not in response.headers
+        assert response.json() == payload
+        assert b"".join(main._iter_results_json(payload)) == main.orjson.dumps(payload)
+        assert b"".join(main._iter_results_json({"results": []})) == b'{"results":[]}'
+
     @pytest.mark.integration
     def test_evaluate_empty_request(self, client):
         """空リクエストのエラー処理"""
@@ -173,6 +228,29 @@ class TestLocalPlatformEndpoints:
         # レスポンスに必要なフィールドがあることを確認
         assert "status" in data or "error" in data or "job_id" in data
 
+    @pytest.mark.integration
+    def test_evaluate_unexpected_error_hides_details(self, client):
+        """予期せぬエラー時、デフォルトではトレースバックを返さない"""
+        with patch("core.handlers.handle_evaluate", new_callable=AsyncMock,
+                   side_effect=RuntimeError("boom")):
+            response = client.post("/evaluate", json=[{"ID": "CLC-01"}])
+
+        assert response.status_code == 500
+        data = response.json()
+        assert data["message"] == "boom"
+        assert "details" not in data
+
+    @pytest.mark.integration
+    def test_evaluate_unexpected_error_with_details(self, client):
+        """INCLUDE_ERROR_DETAILS有効時はトレースバックを返す"""
+        with patch("main.INCLUDE_ERROR_DETAILS", True), \
+             patch("core.handlers.handle_evaluate", new_callable=AsyncMock,
+                   side_effect=RuntimeError("boom")):
+            response = client.post("/evaluate", json=[{"ID": "CLC-01"}])
+
+        assert response.status_code == 500
+        assert "RuntimeError: boom" in response.json()["details"]
+
 
 # =============================================================================
 # Pydantic モデルテスト
@@ -292,6 +370,20 @@ class TestHelperFunctions:
         except ImportError:
             pytest.skip("main module not importable")
 
+    def test_create_json_response_uses_orjson(self):
+        """orjsonでUTF-8のままシリアライズされる"""
+        try:
+            sys.path.insert(0, _local_platform_path)
+            from main import create_json_response, ORJSONResponse
+        except ImportError:
+            pytest.skip("main module not importable")
+
+        response = create_json_response({"message": "評価完了", 1: "non-str key"}, 202)
+        assert isinstance(response, ORJSONResponse)
+        assert response.status_code == 202
+        assert "評価完了".encode("utf-8") in response.body
+        assert b'"1":"non-str key"' in response.body
+
 
 # =============================================================================
 # Ollama 接続テスト
@@ -350,6 +442,34 @@ class TestOllamaConnection:
             assert result["connected"] is False
             assert "error" in result
 
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_check_ollama_connection_uses_shared_client(self):
+        """lifespanで生成した共有クライアントを再利用するか"""
+        try:
+            sys.path.insert(0, _local_platform_path)
+            from main import app, check_ollama_connection
+        except ImportError:
+            pytest.skip("main module not importable")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"models": [{"name": "llama3.1:8b"}]}
+
+        shared_client = AsyncMock()
+        shared_client.get.return_value = mock_response
+        app.state.ollama_client = shared_client
+
+        try:
+            with patch("httpx.AsyncClient") as mock_client:
+                result = await check_ollama_connection()
+                mock_client.assert_not_called()
+        finally:
+            del app.state.ollama_client
+
+        shared_client.get.assert_awaited_once_with("/api/tags")
+        assert result["connected"] is True
+
 
 # =============================================================================
 # LLM/OCR プロバイダー連携テスト
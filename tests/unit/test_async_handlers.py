@@ -67,6 +67,20 @@ def _make_mock_storage():
     storage = MagicMock(spec=JobStorageBase)
     storage.create_job = AsyncMock()
     storage.get_job = AsyncMock()
+
+    async def _get_job_status(job_id):
+        # 基底クラスのデフォルト実装と同様に get_job へ委譲
+        return await storage.get_job(job_id)
+
+    storage.get_job_status = AsyncMock(side_effect=_get_job_status)
+
+    async def _conditional_update_status(job_id, expected, new_status, message):
+        # 基底クラスのデフォルト実装（get_job → update_job）と同じ動作
+        return await JobStorageBase.conditional_update_status(
+            storage, job_id, expected, new_status, message
+        )
+
+    storage.conditional_update_status = AsyncMock(side_effect=_conditional_update_status)
     storage.update_job = AsyncMock()
     storage.delete_job = AsyncMock()
     storage.get_pending_jobs = AsyncMock(return_value=[])
@@ -294,6 +308,57 @@ class TestHandleStatus:
         assert result["status"] == "error"
         assert "Storage error" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_status_terminal_is_cached(self):
+        """終了状態のステータスはストレージを再読込しない"""
+        self.storage.get_job = AsyncMock(return_value=_make_job(status=JobStatus.COMPLETED))
+
+        first = await handle_status("test-job-001")
+        second = await handle_status("test-job-001")
+
+        assert first == second
+        assert first["status"] == "completed"
+        self.storage.get_job.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_status_running_refetched_after_ttl(self):
+        """実行中のステータスはTTL経過後に再取得される"""
+        self.manager.STATUS_CACHE_TTL_SECONDS = 0
+        running = _make_job(status=JobStatus.RUNNING)
+        completed = _make_job(status=JobStatus.COMPLETED)
+        self.storage.get_job = AsyncMock(side_effect=[running, completed])
+
+        assert (await handle_status("test-job-001"))["status"] == "running"
+        assert (await handle_status("test-job-001"))["status"] == "completed"
+        assert self.storage.get_job.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_status_terminal_expires_after_ttl(self):
+        """終了状態もTTL経過後は再取得され、削除済みジョブは not_found になる"""
+        self.manager.TERMINAL_STATUS_CACHE_TTL_SECONDS = 0
+        self.storage.get_job = AsyncMock(
+            side_effect=[_make_job(status=JobStatus.COMPLETED), None]
+        )
+
+        assert (await handle_status("test-job-001"))["status"] == "completed"
+        assert (await handle_status("test-job-001"))["status"] == "not_found"
+        assert "test-job-001" not in self.manager._status_cache
+
+    @pytest.mark.asyncio
+    async def test_status_cache_evicts_least_recently_used(self):
+        """キャッシュ上限超過時は最も長く参照されていないジョブを破棄"""
+        self.manager.STATUS_CACHE_MAX_ENTRIES = 2
+        self.storage.get_job = AsyncMock(
+            side_effect=lambda job_id: _make_job(job_id=job_id, status=JobStatus.COMPLETED)
+        )
+
+        await handle_status("job-1")
+        await handle_status("job-2")
+        await handle_status("job-1")  # キャッシュヒットで最近使用に更新
+        await handle_status("job-3")
+
+        assert list(self.manager._status_cache) == ["job-1", "job-3"]
+
 
 # =============================================================================
 # handle_results テスト
@@ -331,6 +396,15 @@ class TestHandleResults:
         assert result["status"] == "running"
         assert result["results"] == []
 
+    @pytest.mark.asyncio
+    async def test_results_not_completed_skips_full_load(self):
+        """未完了ジョブではステータスのみ取得し、結果全体は読み込まない"""
+        self.storage.get_job_status = AsyncMock(return_value=_make_job(status=JobStatus.RUNNING))
+
+        result = await handle_results("test-job-001")
+        assert result["status"] == "running"
+        self.storage.get_job.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_results_not_found(self):
         """存在しないジョブの結果取得"""
@@ -419,7 +493,9 @@ class TestProcessSingleJob:
         self.storage = _make_mock_storage()
         # get_job はキャンセルチェック用に呼ばれる
         self.storage.get_job = AsyncMock(return_value=_make_job(status=JobStatus.RUNNING))
-        yield
+        # 項目単位の動作を検証するため1件ずつ評価する（バッチ評価は個別テストで検証）
+        with patch("core.async_handlers.JOB_BATCH_SIZE", 1):
+            yield
 
     @pytest.mark.asyncio
     async def test_single_item_success(self):
@@ -470,6 +546,28 @@ class TestProcessSingleJob:
         assert job.results[0].get("_error") is True
         assert job.results[1]["evaluationResult"] is True
 
+    @pytest.mark.asyncio
+    async def test_batched_items(self):
+        """JOB_BATCH_SIZE件ずつまとめて評価"""
+        items = [{"ID": f"CLC-{i:02d}"} for i in range(3)]
+        job = _make_job(items=items)
+
+        with patch("core.async_handlers.JOB_BATCH_SIZE", 2), \
+             patch("core.async_handlers.handle_evaluate", new_callable=AsyncMock) as mock_eval:
+            mock_eval.side_effect = [
+                [{"ID": "CLC-00", "evaluationResult": True},
+                 {"ID": "CLC-01", "evaluationResult": False}],
+                Exception("LLM timeout"),
+            ]
+            await process_single_job(job, self.storage)
+
+        assert mock_eval.call_count == 2
+        assert mock_eval.call_args_list[0].args[0] == items[:2]
+        assert job.status == JobStatus.COMPLETED
+        assert [r["ID"] for r in job.results] == ["CLC-00", "CLC-01", "CLC-02"]
+        assert job.results[2].get("_error") is True
+        assert self.storage.get_job.call_count == 2
+
     @pytest.mark.asyncio
     async def test_cancelled_job_stops(self):
         """キャンセルされたジョブは処理中断"""
@@ -549,6 +647,7 @@ class TestProcessPendingJobs:
         job = _make_job()
         self.storage.get_pending_jobs = AsyncMock(return_value=[job])
         self.storage.get_job = AsyncMock(return_value=_make_job(status=JobStatus.RUNNING))
+        self.storage.conditional_update_status = AsyncMock(return_value=True)
 
         with patch("core.async_handlers.handle_evaluate", new_callable=AsyncMock) as mock_eval:
             mock_eval.return_value = [{"ID": "CLC-01", "evaluationResult": True}]
@@ -556,6 +655,43 @@ class TestProcessPendingJobs:
 
         assert result == 1
 
+    @pytest.mark.asyncio
+    async def test_pending_jobs_claimed_one_by_one(self):
+        """各ジョブは処理直前に条件付き更新で確保され、確保できないジョブはスキップ"""
+        jobs = [_make_job(job_id="job-1"), _make_job(job_id="job-2")]
+        self.storage.get_pending_jobs = AsyncMock(return_value=jobs)
+        self.storage.get_job = AsyncMock(return_value=_make_job(status=JobStatus.RUNNING))
+
+        calls = []
+
+        async def _claim(job_id, expected, new_status, message):
+            calls.append(("claim", job_id))
+            # job-2 は他のワーカーが確保済み
+            return job_id == "job-1"
+
+        self.storage.conditional_update_status = AsyncMock(side_effect=_claim)
+
+        async def _evaluate(items):
+            calls.append(("evaluate", items[0]["ID"]))
+            return [{"ID": "CLC-01", "evaluationResult": True}]
+
+        with patch("core.async_handlers.handle_evaluate", side_effect=_evaluate):
+            result = await process_pending_jobs(max_jobs=2)
+
+        assert result == 1
+        # 確保は次のジョブの処理直前に1件ずつ行う
+        assert calls == [
+            ("claim", "job-1"), ("evaluate", "CLC-01"), ("claim", "job-2")
+        ]
+        self.storage.conditional_update_status.assert_any_await(
+            "job-1", (JobStatus.PENDING,), JobStatus.RUNNING, "Processing started"
+        )
+        assert jobs[0].status == JobStatus.COMPLETED
+        assert jobs[0].started_at is not None
+        # 確保できなかったジョブには書き込まない
+        assert jobs[1].status == JobStatus.PENDING
+        assert jobs[1].started_at is None
+
 
 # =============================================================================
 # process_job_by_id テスト
@@ -0,0 +1,39 @@
+"""
+セキュリティ監査スクリプトのユニットテスト
+
+scripts/audit_security.pyのシークレット検出をテストします。
+"""
+import os
+
+# テスト対象のモジュールをインポート
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from audit_security import SecurityAuditor, _is_high_entropy  # noqa: E402
+
+
+class TestHighEntropyDetection:
+    """疑わしい長い文字列の検出テスト"""
+
+    def test_hex_api_key_is_high_entropy(self):
+        """40文字の16進APIキーは検出対象"""
+        assert _is_high_entropy(b"8f3a9c2e71b04d56e8a1f9c3b7d20e4a6c5f1b9d")
+
+    def test_base64_token_is_high_entropy(self):
+        """ランダムなbase64系トークンは検出対象"""
+        assert _is_high_entropy(b"Zk9xQ2pMd3R1Vm5CeUhzR2FpT0VyWXBNbGtOcUpmRGg=")
+
+    def test_low_entropy_strings_are_ignored(self):
+        """同じ文字の繰り返しなど低エントロピーの文字列は除外"""
+        assert not _is_high_entropy(b"0" * 40)
+        assert not _is_high_entropy(b"abababababababababababababababab")
+
+    def test_hex_api_key_is_reported(self, tmp_path):
+        """ファイル中の16進APIキーが疑わしい長い文字列として報告される"""
+        target = tmp_path / "settings.py"
+        target.write_text('KEY = "8f3a9c2e71b04d56e8a1f9c3b7d20e4a6c5f1b9d"\n', encoding="utf-8")
+
+        skip_reason, hits = SecurityAuditor(use_cache=False)._scan_file_for_secrets(target)
+
+        assert skip_reason is None
+        assert [(lineno, secret_type) for lineno, secret_type, _ in hits] == [(1, "疑わしい長い文字列")]
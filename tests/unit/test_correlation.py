@@ -3,9 +3,9 @@
 
 correlation.pyの機能をテストします。
 """
+import logging
 import pytest
 import uuid
-from contextvars import ContextVar
 
 # テスト対象のモジュールをインポート
 import sys
@@ -16,7 +16,8 @@ from core.correlation import (
     get_or_create_correlation_id,
     get_correlation_id,
     set_correlation_id,
-    correlation_id_var
+    correlation_id_var,
+    CorrelationIdFilter
 )
 
 
@@ -169,6 +170,10 @@ class TestCorrelationID:
         except ValueError:
             pytest.fail(f"Generated correlation ID is not a valid UUID: {correlation_id}")
 
+        # UUID v4（RFC 4122バリアント）であることを確認
+        assert parsed_uuid.version == 4
+        assert parsed_uuid.variant == uuid.RFC_4122
+
     def test_get_or_create_with_special_characters(self):
         """
         特殊文字を含む相関IDも正しく処理できることを確認
@@ -191,6 +196,30 @@ class TestCorrelationID:
 
         assert correlation_id_1 == correlation_id_2 == correlation_id_3
 
+    def test_logging_filter_injects_context_correlation_id(self):
+        """
+        ログフィルタがContextVarの相関IDをレコードに付与することを確認
+        """
+        log_filter = CorrelationIdFilter()
+
+        def make_record():
+            return logging.LogRecord("test", logging.INFO, __file__, 0, "msg", None, None)
+
+        record = make_record()
+        assert log_filter.filter(record) is True
+        assert record.correlation_id == "-"
+
+        set_correlation_id("ctx-id")
+        record = make_record()
+        log_filter.filter(record)
+        assert record.correlation_id == "ctx-id"
+
+        # extra で明示された相関IDは優先される
+        record = make_record()
+        record.correlation_id = "explicit-id"
+        log_filter.filter(record)
+        assert record.correlation_id == "explicit-id"
+
 
 # pytest実行時のエントリポイント
 if __name__ == "__main__":